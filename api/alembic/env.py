@@ -38,14 +38,16 @@ from app.models import (  # noqa: F401
     Workflow,
     Workspace,
 )
+from app.utils.migration import migration_lock
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when run from inside the app,
+# which has already configured its own logging.
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -60,8 +62,10 @@ target_metadata = SQLModel.metadata
 
 def get_database_url() -> str:
     """Get database URL from environment variables or config."""
-    # Try to get from environment first
-    database_url = os.getenv('DATABASE_URL')
+    # Try to get from environment first. MIGRATION_DATABASE_URL takes precedence so that
+    # migrations can bypass PgBouncer: they hold a session advisory lock and run
+    # CREATE INDEX CONCURRENTLY, neither of which works under transaction pooling.
+    database_url = os.getenv('MIGRATION_DATABASE_URL') or os.getenv('DATABASE_URL')
     if database_url:
         # Convert async URL to sync for Alembic
         if 'postgresql+asyncpg://' in database_url:
@@ -93,6 +97,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        render_as_batch=True,
         literal_binds=True,
         dialect_opts={'paramstyle': 'named'},
     )
@@ -119,8 +124,15 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    lock_timeout = config.attributes.get('lock_timeout', 300)
+
+    # Serialize concurrent upgrades from several replicas
+    with connectable.connect() as connection, migration_lock(connection, lock_timeout):
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
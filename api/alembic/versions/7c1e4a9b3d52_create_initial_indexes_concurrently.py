@@ -0,0 +1,188 @@
+"""create initial indexes concurrently
+
+Revision ID: 7c1e4a9b3d52
+Revises: 559fb8d7205a
+Create Date: 2026-10-16 09:00:00.000000
+
+The initial migration only creates tables; its indexes are built here with
+``CREATE INDEX CONCURRENTLY`` so that bootstrapping a populated clone or staging
+database does not hold ACCESS EXCLUSIVE locks and block writers.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4a9b3d52'
+down_revision: Union[str, Sequence[str], None] = '559fb8d7205a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table name, columns, unique)
+INITIAL_INDEXES: list[tuple[str, str, list[str], bool]] = [
+    ('ix_api_keys_application_id', 'api_keys', ['application_id'], False),
+    ('ix_api_keys_is_active', 'api_keys', ['is_active'], False),
+    ('ix_api_keys_key_hash', 'api_keys', ['key_hash'], True),
+    ('ix_applications_workflow_id', 'applications', ['workflow_id'], False),
+    ('ix_applications_workspace_id', 'applications', ['workspace_id'], False),
+    ('ix_audit_logs_action', 'audit_logs', ['action'], False),
+    ('ix_audit_logs_resource_id', 'audit_logs', ['resource_id'], False),
+    ('ix_audit_logs_resource_type', 'audit_logs', ['resource_type'], False),
+    ('ix_audit_logs_status', 'audit_logs', ['status'], False),
+    ('ix_audit_logs_user_id', 'audit_logs', ['user_id'], False),
+    ('ix_audit_logs_workspace_id', 'audit_logs', ['workspace_id'], False),
+    ('ix_bpm_approvals_approver_id', 'bpm_approvals', ['approver_id'], False),
+    ('ix_bpm_approvals_process_instance_id', 'bpm_approvals', ['process_instance_id'], False),
+    ('ix_bpm_approvals_task_id', 'bpm_approvals', ['task_id'], False),
+    ('ix_bpm_approvals_workspace_id', 'bpm_approvals', ['workspace_id'], False),
+    ('ix_bpm_form_data_process_instance_id', 'bpm_form_data', ['process_instance_id'], False),
+    ('ix_bpm_form_data_task_id', 'bpm_form_data', ['task_id'], False),
+    ('ix_bpm_form_data_workspace_id', 'bpm_form_data', ['workspace_id'], False),
+    ('ix_bpm_form_definitions_key', 'bpm_form_definitions', ['key'], True),
+    ('ix_bpm_form_definitions_workspace_id', 'bpm_form_definitions', ['workspace_id'], False),
+    ('ix_bpm_process_definitions_key', 'bpm_process_definitions', ['key'], False),
+    ('ix_bpm_process_definitions_workspace_id', 'bpm_process_definitions', ['workspace_id'], False),
+    ('ix_bpm_process_instances_business_key', 'bpm_process_instances', ['business_key'], False),
+    (
+        'ix_bpm_process_instances_process_definition_id',
+        'bpm_process_instances',
+        ['process_definition_id'],
+        False,
+    ),
+    ('ix_bpm_process_instances_process_key', 'bpm_process_instances', ['process_key'], False),
+    ('ix_bpm_process_instances_status', 'bpm_process_instances', ['status'], False),
+    (
+        'ix_bpm_process_instances_workflow_run_id',
+        'bpm_process_instances',
+        ['workflow_run_id'],
+        False,
+    ),
+    ('ix_bpm_process_instances_workspace_id', 'bpm_process_instances', ['workspace_id'], False),
+    ('ix_bpm_tasks_assignee', 'bpm_tasks', ['assignee'], False),
+    ('ix_bpm_tasks_process_instance_id', 'bpm_tasks', ['process_instance_id'], False),
+    ('ix_bpm_tasks_status', 'bpm_tasks', ['status'], False),
+    ('ix_bpm_tasks_workspace_id', 'bpm_tasks', ['workspace_id'], False),
+    ('ix_connections_source_node_id', 'connections', ['source_node_id'], False),
+    ('ix_connections_target_node_id', 'connections', ['target_node_id'], False),
+    ('ix_connections_workflow_id', 'connections', ['workflow_id'], False),
+    ('ix_conversations_application_id', 'conversations', ['application_id'], False),
+    ('ix_conversations_end_user_id', 'conversations', ['end_user_id'], False),
+    ('ix_conversations_status', 'conversations', ['status'], False),
+    ('ix_conversations_workspace_id', 'conversations', ['workspace_id'], False),
+    (
+        'ix_dataset_application_joins_application_id',
+        'dataset_application_joins',
+        ['application_id'],
+        False,
+    ),
+    ('ix_dataset_application_joins_dataset_id', 'dataset_application_joins', ['dataset_id'], False),
+    ('ix_datasets_name', 'datasets', ['name'], False),
+    ('ix_datasets_workspace_id', 'datasets', ['workspace_id'], False),
+    ('ix_document_segments_dataset_id', 'document_segments', ['dataset_id'], False),
+    ('ix_document_segments_document_id', 'document_segments', ['document_id'], False),
+    ('ix_document_segments_enabled', 'document_segments', ['enabled'], False),
+    ('ix_document_segments_position', 'document_segments', ['position'], False),
+    ('ix_document_segments_status', 'document_segments', ['status'], False),
+    ('ix_documents_archived', 'documents', ['archived'], False),
+    ('ix_documents_data_source_type', 'documents', ['data_source_type'], False),
+    ('ix_documents_dataset_id', 'documents', ['dataset_id'], False),
+    ('ix_documents_enabled', 'documents', ['enabled'], False),
+    ('ix_documents_file_id', 'documents', ['file_id'], False),
+    ('ix_documents_indexing_status', 'documents', ['indexing_status'], False),
+    ('ix_end_users_external_user_id', 'end_users', ['external_user_id'], False),
+    ('ix_end_users_is_anonymous', 'end_users', ['is_anonymous'], False),
+    ('ix_end_users_session_id', 'end_users', ['session_id'], False),
+    ('ix_end_users_workspace_id', 'end_users', ['workspace_id'], False),
+    ('ix_execution_records_started_at', 'execution_records', ['started_at'], False),
+    ('ix_execution_records_status', 'execution_records', ['status'], False),
+    ('ix_execution_records_workflow_id', 'execution_records', ['workflow_id'], False),
+    ('ix_file_references_file_id', 'file_references', ['file_id'], True),
+    ('ix_file_references_storage_type', 'file_references', ['storage_type'], False),
+    ('ix_file_references_uploaded_by', 'file_references', ['uploaded_by'], False),
+    ('ix_file_references_workspace_id', 'file_references', ['workspace_id'], False),
+    ('ix_installed_plugins_installed_at', 'installed_plugins', ['installed_at'], False),
+    ('ix_installed_plugins_installed_by', 'installed_plugins', ['installed_by'], False),
+    ('ix_installed_plugins_is_enabled', 'installed_plugins', ['is_enabled'], False),
+    ('ix_installed_plugins_plugin_id', 'installed_plugins', ['plugin_id'], False),
+    ('ix_installed_plugins_workspace_id', 'installed_plugins', ['workspace_id'], False),
+    ('ix_llm_providers_workspace_id', 'llm_providers', ['workspace_id'], False),
+    ('ix_message_annotations_annotated_by', 'message_annotations', ['annotated_by'], False),
+    ('ix_message_annotations_annotation_type', 'message_annotations', ['annotation_type'], False),
+    ('ix_message_annotations_application_id', 'message_annotations', ['application_id'], False),
+    ('ix_message_annotations_conversation_id', 'message_annotations', ['conversation_id'], False),
+    ('ix_message_annotations_message_id', 'message_annotations', ['message_id'], False),
+    ('ix_message_feedbacks_application_id', 'message_feedbacks', ['application_id'], False),
+    ('ix_message_feedbacks_conversation_id', 'message_feedbacks', ['conversation_id'], False),
+    ('ix_message_feedbacks_end_user_id', 'message_feedbacks', ['end_user_id'], False),
+    ('ix_message_feedbacks_message_id', 'message_feedbacks', ['message_id'], False),
+    ('ix_message_feedbacks_rating', 'message_feedbacks', ['rating'], False),
+    ('ix_messages_application_id', 'messages', ['application_id'], False),
+    ('ix_messages_conversation_id', 'messages', ['conversation_id'], False),
+    ('ix_messages_role', 'messages', ['role'], False),
+    ('ix_messages_status', 'messages', ['status'], False),
+    ('ix_messages_workflow_run_id', 'messages', ['workflow_run_id'], False),
+    (
+        'ix_node_execution_results_execution_record_id',
+        'node_execution_results',
+        ['execution_record_id'],
+        False,
+    ),
+    ('ix_node_execution_results_node_id', 'node_execution_results', ['node_id'], False),
+    ('ix_nodes_workflow_id', 'nodes', ['workflow_id'], False),
+    ('ix_organizations_name', 'organizations', ['name'], False),
+    ('ix_password_resets_token', 'password_resets', ['token'], True),
+    ('ix_password_resets_used', 'password_resets', ['used'], False),
+    ('ix_password_resets_user_id', 'password_resets', ['user_id'], False),
+    ('ix_plugins_category', 'plugins', ['category'], False),
+    ('ix_plugins_is_active', 'plugins', ['is_active'], False),
+    ('ix_plugins_is_verified', 'plugins', ['is_verified'], False),
+    ('ix_plugins_name', 'plugins', ['name'], True),
+    ('ix_plugins_plugin_type', 'plugins', ['plugin_type'], False),
+    ('ix_prompt_template_versions_template_id', 'prompt_template_versions', ['template_id'], False),
+    ('ix_prompt_templates_workspace_id', 'prompt_templates', ['workspace_id'], False),
+    ('ix_refresh_tokens_revoked', 'refresh_tokens', ['revoked'], False),
+    ('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], True),
+    ('ix_refresh_tokens_user_id', 'refresh_tokens', ['user_id'], False),
+    ('ix_subscriptions_plan_type', 'subscriptions', ['plan_type'], False),
+    ('ix_subscriptions_status', 'subscriptions', ['status'], False),
+    ('ix_subscriptions_workspace_id', 'subscriptions', ['workspace_id'], False),
+    ('ix_team_invitations_email', 'team_invitations', ['email'], False),
+    ('ix_team_invitations_invited_by', 'team_invitations', ['invited_by'], False),
+    ('ix_team_invitations_status', 'team_invitations', ['status'], False),
+    ('ix_team_invitations_team_id', 'team_invitations', ['team_id'], False),
+    ('ix_team_invitations_token', 'team_invitations', ['token'], True),
+    ('ix_team_members_team_id', 'team_members', ['team_id'], False),
+    ('ix_team_members_user_id', 'team_members', ['user_id'], False),
+    ('ix_teams_name', 'teams', ['name'], False),
+    ('ix_teams_organization_id', 'teams', ['organization_id'], False),
+    ('ix_usage_records_period_end', 'usage_records', ['period_end'], False),
+    ('ix_usage_records_period_start', 'usage_records', ['period_start'], False),
+    ('ix_usage_records_recorded_at', 'usage_records', ['recorded_at'], False),
+    ('ix_usage_records_resource_type', 'usage_records', ['resource_type'], False),
+    ('ix_usage_records_subscription_id', 'usage_records', ['subscription_id'], False),
+    ('ix_usage_records_workspace_id', 'usage_records', ['workspace_id'], False),
+    ('ix_users_email', 'users', ['email'], True),
+    ('ix_workflows_name', 'workflows', ['name'], False),
+    ('ix_workflows_workspace_id', 'workflows', ['workspace_id'], False),
+    ('ix_workspaces_name', 'workspaces', ['name'], False),
+    ('ix_workspaces_team_id', 'workspaces', ['team_id'], False),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, unique in INITIAL_INDEXES:
+            create_index_concurrently(index_name, table_name, columns, unique=unique)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _, _ in reversed(INITIAL_INDEXES):
+            drop_index_concurrently(index_name, table_name)
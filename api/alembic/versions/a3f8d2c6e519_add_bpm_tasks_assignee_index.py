@@ -0,0 +1,36 @@
+"""add bpm_tasks assignee/workspace/status index
+
+Revision ID: a3f8d2c6e519
+Revises: f41a6c2e9b87
+Create Date: 2025-12-10 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f8d2c6e519'
+down_revision: Union[str, None] = 'f41a6c2e9b87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """我的任务按 (assignee, workspace_id[, status]) 过滤，复合索引避免单列索引的位图合并"""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            'ix_bpm_tasks_assignee_workspace_status',
+            'bpm_tasks',
+            ['assignee', 'workspace_id', 'status'],
+        )
+
+
+def downgrade() -> None:
+    """删除我的任务索引"""
+    with op.get_context().autocommit_block():
+        drop_index_concurrently('ix_bpm_tasks_assignee_workspace_status', 'bpm_tasks')
@@ -0,0 +1,163 @@
+"""partition audit_logs by month
+
+Revision ID: a8c3e5f7d210
+Revises: f6d2b8e4a193
+Create Date: 2025-12-10 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.utils.migration import set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3e5f7d210'
+down_revision: Union[str, None] = 'f6d2b8e4a193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# audit_logs 上的索引：(名称, 列, 额外参数)。分区表上的索引会自动建到每个分区
+AUDIT_LOG_INDEXES = [
+    ('ix_audit_logs_action', ['action'], {}),
+    ('ix_audit_logs_resource_type', ['resource_type'], {}),
+    ('ix_audit_logs_status', ['status'], {}),
+    ('ix_audit_logs_user_id', ['user_id'], {}),
+    ('ix_audit_logs_workspace_id', ['workspace_id'], {}),
+    (
+        'ix_audit_logs_details_gin',
+        ['details'],
+        {'postgresql_using': 'gin', 'postgresql_ops': {'details': 'jsonb_path_ops'}},
+    ),
+    (
+        'ix_audit_logs_resource',
+        ['resource_type', 'resource_id'],
+        {'postgresql_where': sa.text('resource_id IS NOT NULL')},
+    ),
+    ('ix_audit_logs_created_at_brin', ['created_at'], {'postgresql_using': 'brin'}),
+]
+
+# 按 UTC 自然月建分区，覆盖 [start_at 所在月, end_at 所在月]；已存在的分区跳过
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_audit_log_partitions(start_at timestamptz, end_at timestamptz)
+RETURNS void AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', start_at AT TIME ZONE 'UTC');
+    last_month timestamp := date_trunc('month', end_at AT TIME ZONE 'UTC');
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_' || to_char(month_start, 'YYYY_MM'),
+            month_start AT TIME ZONE 'UTC',
+            (month_start + interval '1 month') AT TIME ZONE 'UTC'
+        );
+        month_start := month_start + interval '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# 预建的月份数与 AuditLogWriter 一致，取自 settings.audit_log_partition_months_ahead。
+# pg_cron 任务固定使用迁移执行时的取值，之后修改该配置需重新 cron.schedule 同名任务
+MONTHS_AHEAD = settings.audit_log_partition_months_ahead
+
+# 安装了 pg_cron 时每月 25 日预建后续分区；否则由 AuditLogWriter 启动时和每天首次写入时预建
+SCHEDULE_PARTITIONS = f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'audit_logs_partitions',
+            '0 0 25 * *',
+            $job$SELECT create_audit_log_partitions(
+                now(), now() + interval '{MONTHS_AHEAD} months'
+            )$job$
+        );
+    END IF;
+END;
+$$
+"""
+
+UNSCHEDULE_PARTITIONS = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule(jobid) FROM cron.job WHERE jobname = 'audit_logs_partitions';
+    END IF;
+END;
+$$
+"""
+
+
+def _create_indexes() -> None:
+    """在 audit_logs 上创建全部索引（表刚建好且在同一事务中，无需 CONCURRENTLY）"""
+    for index_name, columns, kwargs in AUDIT_LOG_INDEXES:
+        op.create_index(index_name, 'audit_logs', columns, **kwargs)
+
+
+def _create_updated_at_trigger() -> None:
+    """重新挂上 d9b4f7a2e6c3 创建的 set_updated_at 触发器"""
+    op.execute(
+        'CREATE TRIGGER set_updated_at BEFORE UPDATE ON audit_logs '
+        'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+    )
+
+
+def upgrade() -> None:
+    """将 audit_logs 改为按 created_at 月分区的分区表
+
+    分区表的主键必须包含分区键，因此主键变为 (id, created_at)。已有数据复制到对应月份的分区，
+    超出已建分区范围的数据落入 audit_logs_default。
+    """
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned')
+    op.execute(
+        'CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (created_at)'
+    )
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(
+        'SELECT create_audit_log_partitions('
+        'COALESCE((SELECT min(created_at) FROM audit_logs_unpartitioned), now()), '
+        f"now() + interval '{MONTHS_AHEAD} months')"
+    )
+    op.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+
+    op.execute('INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned')
+    op.execute('DROP TABLE audit_logs_unpartitioned')
+
+    # 旧表删除后再建约束和索引，名称不冲突
+    op.execute('ALTER TABLE audit_logs ADD CONSTRAINT pk_audit_logs PRIMARY KEY (id, created_at)')
+    _create_indexes()
+    _create_updated_at_trigger()
+    op.execute(SCHEDULE_PARTITIONS)
+
+
+def downgrade() -> None:
+    """恢复为普通表，主键恢复为 id"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    op.execute(UNSCHEDULE_PARTITIONS)
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_partitioned')
+    op.execute('CREATE TABLE audit_logs (LIKE audit_logs_partitioned INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned')
+    # 连同所有分区一起删除
+    op.execute('DROP TABLE audit_logs_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS create_audit_log_partitions(timestamptz, timestamptz)')
+
+    op.execute('ALTER TABLE audit_logs ADD CONSTRAINT pk_audit_logs PRIMARY KEY (id)')
+    _create_indexes()
+    _create_updated_at_trigger()
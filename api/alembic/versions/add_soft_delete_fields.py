@@ -1,7 +1,7 @@
 """add soft delete fields to missing tables
 
 Revision ID: add_soft_delete_001
-Revises: 559fb8d7205a
+Revises: 7c1e4a9b3d52
 Create Date: 2025-12-08 10:00:00.000000
 
 """
@@ -11,79 +11,89 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.utils.migration import (
+    add_columns,
+    create_indexes_concurrently,
+    drop_columns,
+    drop_index_concurrently,
+    run_with_lock_retry,
+    set_local_timeouts,
+)
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'add_soft_delete_001'
-down_revision: Union[str, None] = '559fb8d7205a'
+down_revision: Union[str, None] = '7c1e4a9b3d52'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# 需要添加软删除字段的表（排除不需要软删除的表）
+TABLES_NEED_SOFT_DELETE = [
+    # BPM相关
+    'bpm_form_definitions',
+    # 对话相关
+    'conversations',
+    'messages',
+    'end_users',
+    # 数据集相关
+    'documents',
+    'document_segments',
+    # 文件相关
+    'file_references',
+    # 插件相关
+    'installed_plugins',
+    # 工作流相关
+    'nodes',
+    # 提示词模板版本
+    'prompt_template_versions',
+]
+
+
 def upgrade() -> None:
     """添加软删除字段到需要的表"""
 
-    # 需要添加软删除字段的表（排除不需要软删除的表）
-    tables_need_soft_delete = [
-        # BPM相关
-        'bpm_form_definitions',
-        # 对话相关
-        'conversations',
-        'messages',
-        'end_users',
-        # 数据集相关
-        'documents',
-        'document_segments',
-        # 文件相关
-        'file_references',
-        # 插件相关
-        'installed_plugins',
-        # 工作流相关
-        'nodes',
-        # 提示词模板版本
-        'prompt_template_versions',
-    ]
-
-    # 为每个表添加软删除字段
-    for table_name in tables_need_soft_delete:
-        # 添加 deleted_at 字段
-        op.add_column(
-            table_name, sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True)
+    # 拿不到锁时快速失败，避免排在长查询后面阻塞所有写入
+    set_local_timeouts(lock_timeout='3s', statement_timeout='30s')
+
+    # 每个表用一条 ALTER TABLE 同时添加 deleted_at 和 is_deleted，只获取一次表锁；
+    # 单表锁超时只回滚到保存点并重试，不会中断整个迁移
+    for table_name in TABLES_NEED_SOFT_DELETE:
+        run_with_lock_retry(
+            lambda table_name=table_name: add_columns(
+                table_name,
+                sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+                sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
+            )
         )
 
-        # 添加 is_deleted 字段
-        op.add_column(
-            table_name,
-            sa.Column('is_deleted', sa.Boolean(), nullable=False, server_default='false'),
+    # 第二遍并发创建索引（提高软删除查询性能），不阻塞写入；
+    # 同一表的两个索引依次构建，不同表分散到多个连接上并行。
+    # 这两个索引随后由 b1d4e7a9c352 换成只覆盖未删除行的部分索引
+    with op.get_context().autocommit_block():
+        create_indexes_concurrently(
+            [
+                {
+                    'index_name': f'ix_{table_name}_{column}',
+                    'table_name': table_name,
+                    'columns': [column],
+                }
+                for table_name in TABLES_NEED_SOFT_DELETE
+                for column in ('deleted_at', 'is_deleted')
+            ]
         )
 
-        # 为 deleted_at 创建索引（提高软删除查询性能）
-        op.create_index(f'ix_{table_name}_deleted_at', table_name, ['deleted_at'])
-
-        # 为 is_deleted 创建索引
-        op.create_index(f'ix_{table_name}_is_deleted', table_name, ['is_deleted'])
-
 
 def downgrade() -> None:
     """移除软删除字段"""
 
-    tables_need_soft_delete = [
-        'bpm_form_definitions',
-        'conversations',
-        'messages',
-        'end_users',
-        'documents',
-        'document_segments',
-        'file_references',
-        'installed_plugins',
-        'nodes',
-        'prompt_template_versions',
-    ]
-
-    for table_name in tables_need_soft_delete:
-        # 删除索引
-        op.drop_index(f'ix_{table_name}_is_deleted', table_name=table_name)
-        op.drop_index(f'ix_{table_name}_deleted_at', table_name=table_name)
-
-        # 删除字段
-        op.drop_column(table_name, 'is_deleted')
-        op.drop_column(table_name, 'deleted_at')
+    with op.get_context().autocommit_block():
+        for table_name in TABLES_NEED_SOFT_DELETE:
+            drop_index_concurrently(f'ix_{table_name}_is_deleted', table_name)
+            drop_index_concurrently(f'ix_{table_name}_deleted_at', table_name)
+
+    set_local_timeouts(lock_timeout='3s', statement_timeout='30s')
+    for table_name in TABLES_NEED_SOFT_DELETE:
+        run_with_lock_retry(
+            lambda table_name=table_name: drop_columns(table_name, 'is_deleted', 'deleted_at')
+        )
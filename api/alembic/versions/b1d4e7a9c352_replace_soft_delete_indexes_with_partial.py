@@ -0,0 +1,79 @@
+"""replace soft delete indexes with partial active-row indexes
+
+Revision ID: b1d4e7a9c352
+Revises: a8c3e5f7d210
+Create Date: 2025-12-11 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import (
+    create_indexes_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1d4e7a9c352'
+down_revision: Union[str, None] = 'a8c3e5f7d210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# add_soft_delete_001 中添加了 deleted_at / is_deleted 的表
+TABLES_NEED_SOFT_DELETE = [
+    'bpm_form_definitions',
+    'conversations',
+    'messages',
+    'end_users',
+    'documents',
+    'document_segments',
+    'file_references',
+    'installed_plugins',
+    'nodes',
+    'prompt_template_versions',
+]
+
+
+def upgrade() -> None:
+    """is_deleted / deleted_at 单列索引换成只覆盖未删除行的部分索引
+
+    is_deleted 选择性极低，单独建 btree 索引几乎不会被使用，反而增加写入开销；
+    部分索引与软删除查询条件（is_deleted = false）一致。先建新索引再删旧索引。
+    """
+    with op.get_context().autocommit_block():
+        create_indexes_concurrently(
+            [
+                {
+                    'index_name': f'ix_{table_name}_active',
+                    'table_name': table_name,
+                    'columns': ['id'],
+                    'where': 'is_deleted = false',
+                }
+                for table_name in TABLES_NEED_SOFT_DELETE
+            ]
+        )
+        for table_name in TABLES_NEED_SOFT_DELETE:
+            drop_index_concurrently(f'ix_{table_name}_is_deleted', table_name)
+            drop_index_concurrently(f'ix_{table_name}_deleted_at', table_name)
+
+
+def downgrade() -> None:
+    """恢复 is_deleted / deleted_at 单列索引"""
+    with op.get_context().autocommit_block():
+        create_indexes_concurrently(
+            [
+                {
+                    'index_name': f'ix_{table_name}_{column}',
+                    'table_name': table_name,
+                    'columns': [column],
+                }
+                for table_name in TABLES_NEED_SOFT_DELETE
+                for column in ('deleted_at', 'is_deleted')
+            ]
+        )
+        for table_name in TABLES_NEED_SOFT_DELETE:
+            drop_index_concurrently(f'ix_{table_name}_active', table_name)
@@ -0,0 +1,78 @@
+"""convert bpm json columns to jsonb
+
+Revision ID: b4d27e8f1a63
+Revises: add_soft_delete_001
+Create Date: 2025-12-10 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils.migration import run_with_lock_retry, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d27e8f1a63'
+down_revision: Union[str, None] = 'add_soft_delete_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# BPM 表中原先以 json（文本）存储的列
+BPM_JSON_COLUMNS = {
+    'bpm_approvals': ['attachments'],
+    'bpm_form_data': ['data'],
+    'bpm_form_definitions': ['form_schema', 'ui_schema'],
+    'bpm_process_definitions': ['process_config', 'nodes', 'form_schema'],
+    'bpm_process_instances': ['variables', 'result'],
+    'bpm_tasks': ['candidate_users', 'candidate_groups', 'form_data', 'variables', 'result'],
+}
+
+
+def _json_columns(table_name: str, columns: list[str]) -> list[str]:
+    """返回仍为 json 类型、需要转换的列；新库由初始迁移直接建为 jsonb。"""
+    if op.get_context().as_sql:
+        return columns
+
+    existing = {
+        column['name']: column['type']
+        for column in sa.inspect(op.get_bind()).get_columns(table_name)
+    }
+    return [
+        name
+        for name in columns
+        if isinstance(existing.get(name), sa.JSON)
+        and not isinstance(existing.get(name), postgresql.JSONB)
+    ]
+
+
+def upgrade() -> None:
+    """将 BPM 的 json 列转换为 jsonb"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # 类型转换会重写整表，只限制等锁时间，不限制执行时间
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name, columns in BPM_JSON_COLUMNS.items():
+        to_convert = _json_columns(table_name, columns)
+        if not to_convert:
+            continue
+
+        # 同一张表的所有列放在一条 ALTER TABLE 中，只重写一次表
+        clauses = ', '.join(
+            f'ALTER COLUMN {name} TYPE jsonb USING {name}::jsonb' for name in to_convert
+        )
+        run_with_lock_retry(
+            lambda table_name=table_name, clauses=clauses: op.execute(
+                f'ALTER TABLE {table_name} {clauses}'
+            )
+        )
+
+
+def downgrade() -> None:
+    """无需回退：初始迁移已直接创建 jsonb 列"""
@@ -0,0 +1,59 @@
+"""add jsonb gin indexes
+
+Revision ID: b7e2d4a9c831
+Revises: a3f8d2c6e519
+Create Date: 2025-12-10 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import create_indexes_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a9c831'
+down_revision: Union[str, None] = 'a3f8d2c6e519'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (表, JSONB 列)：按 @> 包含查询的列
+GIN_INDEXED_COLUMNS = [
+    ('applications', 'config'),
+    ('llm_providers', 'config'),
+    ('prompt_templates', 'variables'),
+    ('audit_logs', 'details'),
+]
+
+
+def upgrade() -> None:
+    """为 JSONB 列创建 GIN(jsonb_path_ops) 索引，@> 查询不再全表扫描"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        create_indexes_concurrently(
+            [
+                {
+                    'index_name': f'ix_{table_name}_{column}_gin',
+                    'table_name': table_name,
+                    'columns': [column],
+                    'using': 'gin',
+                    'ops': {column: 'jsonb_path_ops'},
+                }
+                for table_name, column in GIN_INDEXED_COLUMNS
+            ]
+        )
+
+
+def downgrade() -> None:
+    """删除 JSONB GIN 索引"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for table_name, column in GIN_INDEXED_COLUMNS:
+            drop_index_concurrently(f'ix_{table_name}_{column}_gin', table_name)
@@ -0,0 +1,85 @@
+"""convert deleted_at to timestamptz
+
+Revision ID: c2e5f9a3b718
+Revises: b1d4e7a9c352
+Create Date: 2025-12-11 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migration import run_with_lock_retry, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e5f9a3b718'
+down_revision: Union[str, None] = 'b1d4e7a9c352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 初始迁移中以 timestamp without time zone 创建 deleted_at 的表；
+# add_soft_delete_001 添加的 deleted_at 已是 timestamptz
+NAIVE_DELETED_AT_TABLES = [
+    'applications',
+    'bpm_process_definitions',
+    'datasets',
+    'llm_providers',
+    'organizations',
+    'plugins',
+    'prompt_templates',
+    'subscriptions',
+    'teams',
+    'users',
+    'workflows',
+    'workspaces',
+]
+
+
+def _is_naive(table_name: str) -> bool:
+    """deleted_at 是否仍为 timestamp without time zone"""
+    if op.get_context().as_sql:
+        return True
+
+    for column in sa.inspect(op.get_bind()).get_columns(table_name):
+        if column['name'] == 'deleted_at':
+            return isinstance(column['type'], sa.DateTime) and not column['type'].timezone
+    return False
+
+
+def upgrade() -> None:
+    """将 deleted_at 转换为 timestamptz，soft_delete() 写入带时区的 UTC 时间"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # 已有数据按 UTC 写入（datetime.utcnow），转换时按 UTC 解释
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name in NAIVE_DELETED_AT_TABLES:
+        if not _is_naive(table_name):
+            continue
+        run_with_lock_retry(
+            lambda table_name=table_name: op.execute(
+                f'ALTER TABLE {table_name} '
+                f"ALTER COLUMN deleted_at TYPE timestamptz USING deleted_at AT TIME ZONE 'UTC'"
+            )
+        )
+
+
+def downgrade() -> None:
+    """恢复为 timestamp without time zone（按 UTC 取值）"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name in NAIVE_DELETED_AT_TABLES:
+        run_with_lock_retry(
+            lambda table_name=table_name: op.execute(
+                f'ALTER TABLE {table_name} '
+                f"ALTER COLUMN deleted_at TYPE timestamp USING deleted_at AT TIME ZONE 'UTC'"
+            )
+        )
@@ -0,0 +1,73 @@
+"""stamp event timestamps in database
+
+Revision ID: c5a1e8f3b274
+Revises: b7e2d4a9c831
+Create Date: 2025-12-10 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migration import run_with_lock_retry, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a1e8f3b274'
+down_revision: Union[str, None] = 'b7e2d4a9c831'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 表 -> 插入时由数据库 now() 写入的事件时间列
+EVENT_TIMESTAMP_COLUMNS = {
+    'bpm_form_data': 'submitted_at',
+    'installed_plugins': 'installed_at',
+    'usage_records': 'recorded_at',
+}
+
+
+def _is_naive(table_name: str, column_name: str) -> bool:
+    """列是否仍为 timestamp without time zone"""
+    if op.get_context().as_sql:
+        return True
+
+    for column in sa.inspect(op.get_bind()).get_columns(table_name):
+        if column['name'] == column_name:
+            return isinstance(column['type'], sa.DateTime) and not column['type'].timezone
+    return False
+
+
+def upgrade() -> None:
+    """将事件时间列转换为 timestamptz，默认值改为 now()"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # 已有数据按 UTC 写入（datetime.utcnow），转换时按 UTC 解释
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name, column_name in EVENT_TIMESTAMP_COLUMNS.items():
+        clauses = [f'ALTER COLUMN {column_name} SET DEFAULT now()']
+        if _is_naive(table_name, column_name):
+            clauses.insert(
+                0,
+                f"ALTER COLUMN {column_name} TYPE timestamptz "
+                f"USING {column_name} AT TIME ZONE 'UTC'",
+            )
+
+        run_with_lock_retry(
+            lambda table_name=table_name, clauses=', '.join(clauses): op.execute(
+                f'ALTER TABLE {table_name} {clauses}'
+            )
+        )
+
+
+def downgrade() -> None:
+    """去掉数据库默认值（列保留 timestamptz 类型）"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for table_name, column_name in EVENT_TIMESTAMP_COLUMNS.items():
+        op.execute(f'ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP DEFAULT')
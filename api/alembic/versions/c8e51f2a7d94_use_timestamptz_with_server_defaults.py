@@ -0,0 +1,145 @@
+"""use timestamptz with server defaults
+
+Revision ID: c8e51f2a7d94
+Revises: b4d27e8f1a63
+Create Date: 2025-12-10 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migration import run_with_lock_retry, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e51f2a7d94'
+down_revision: Union[str, None] = 'b4d27e8f1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# TimestampMixin 的表：created_at / updated_at 由数据库 now() 写入
+TIMESTAMP_MIXIN_TABLES = [
+    'api_keys',
+    'applications',
+    'audit_logs',
+    'bpm_form_definitions',
+    'bpm_process_definitions',
+    'bpm_process_instances',
+    'bpm_tasks',
+    'conversations',
+    'dataset_application_joins',
+    'datasets',
+    'document_segments',
+    'documents',
+    'end_users',
+    'file_references',
+    'installed_plugins',
+    'llm_providers',
+    'message_annotations',
+    'message_feedbacks',
+    'messages',
+    'organizations',
+    'password_resets',
+    'plugins',
+    'prompt_template_versions',
+    'prompt_templates',
+    'refresh_tokens',
+    'subscriptions',
+    'team_invitations',
+    'teams',
+    'users',
+    'workflows',
+    'workspaces',
+]
+
+# 表 -> [(列名, 是否使用 now() 作为默认值)]
+TIMESTAMP_COLUMNS = {
+    **{table: [('created_at', True), ('updated_at', True)] for table in TIMESTAMP_MIXIN_TABLES},
+    'team_members': [('joined_at', True)],
+    'execution_records': [('started_at', True), ('completed_at', False)],
+}
+TIMESTAMP_COLUMNS['bpm_process_instances'] += [('started_at', False), ('completed_at', False)]
+TIMESTAMP_COLUMNS['bpm_tasks'] += [
+    ('claimed_at', False),
+    ('started_at', False),
+    ('completed_at', False),
+]
+
+
+def _columns_with_timezone(
+    table_name: str, columns: list[tuple[str, bool]], timezone: bool
+) -> list[tuple[str, bool]]:
+    """返回 columns 中时区属性等于 timezone 的列；离线模式下原样返回。"""
+    if op.get_context().as_sql:
+        return columns
+
+    existing = {
+        column['name']: column['type']
+        for column in sa.inspect(op.get_bind()).get_columns(table_name)
+    }
+    return [
+        (name, server_now)
+        for name, server_now in columns
+        if isinstance(existing.get(name), sa.DateTime) and existing[name].timezone == timezone
+    ]
+
+
+def upgrade() -> None:
+    """将时间戳列转换为 timestamptz，并由数据库生成默认值"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # 已有数据按 UTC 写入（datetime.utcnow），转换时按 UTC 解释
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        # 新库由初始迁移直接建为 timestamptz，只转换仍为 timestamp without time zone 的列
+        to_convert = _columns_with_timezone(table_name, columns, timezone=False)
+        if not to_convert:
+            continue
+
+        clauses = []
+        for name, server_now in to_convert:
+            clauses.append(
+                f"ALTER COLUMN {name} TYPE timestamptz USING {name} AT TIME ZONE 'UTC'"
+            )
+            if server_now:
+                clauses.append(f'ALTER COLUMN {name} SET DEFAULT now()')
+
+        run_with_lock_retry(
+            lambda table_name=table_name, clauses=', '.join(clauses): op.execute(
+                f'ALTER TABLE {table_name} {clauses}'
+            )
+        )
+
+
+def downgrade() -> None:
+    """将时间戳列转换回 timestamp without time zone（按 UTC 取值），并移除 now() 默认值"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s', statement_timeout='0')
+
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        to_convert = _columns_with_timezone(table_name, columns, timezone=True)
+        if not to_convert:
+            continue
+
+        clauses = []
+        for name, server_now in to_convert:
+            if server_now:
+                clauses.append(f'ALTER COLUMN {name} DROP DEFAULT')
+            clauses.append(
+                f"ALTER COLUMN {name} TYPE timestamp without time zone "
+                f"USING {name} AT TIME ZONE 'UTC'"
+            )
+
+        run_with_lock_retry(
+            lambda table_name=table_name, clauses=', '.join(clauses): op.execute(
+                f'ALTER TABLE {table_name} {clauses}'
+            )
+        )
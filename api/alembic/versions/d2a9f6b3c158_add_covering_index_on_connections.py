@@ -0,0 +1,39 @@
+"""add covering index on connections
+
+Revision ID: d2a9f6b3c158
+Revises: c8e51f2a7d94
+Create Date: 2025-12-10 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9f6b3c158'
+down_revision: Union[str, None] = 'c8e51f2a7d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """按工作流读取连线时使用覆盖索引，并删除被其前缀覆盖的 workflow_id 单列索引"""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            'ix_connections_workflow_edges',
+            'connections',
+            ['workflow_id', 'source_node_id', 'target_node_id'],
+            include=['id', 'source_output', 'target_input'],
+        )
+        drop_index_concurrently('ix_connections_workflow_id', 'connections')
+
+
+def downgrade() -> None:
+    """恢复 workflow_id 单列索引"""
+    with op.get_context().autocommit_block():
+        create_index_concurrently('ix_connections_workflow_id', 'connections', ['workflow_id'])
+        drop_index_concurrently('ix_connections_workflow_edges', 'connections')
@@ -0,0 +1,115 @@
+"""add set_updated_at trigger
+
+Revision ID: d9b4f7a2e6c3
+Revises: c5a1e8f3b274
+Create Date: 2025-12-10 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migration import run_with_lock_retry, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b4f7a2e6c3'
+down_revision: Union[str, None] = 'c5a1e8f3b274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# TimestampMixin 的表（与 c8e51f2a7d94 相同）
+TIMESTAMP_MIXIN_TABLES = [
+    'api_keys',
+    'applications',
+    'audit_logs',
+    'bpm_form_definitions',
+    'bpm_process_definitions',
+    'bpm_process_instances',
+    'bpm_tasks',
+    'conversations',
+    'dataset_application_joins',
+    'datasets',
+    'document_segments',
+    'documents',
+    'end_users',
+    'file_references',
+    'installed_plugins',
+    'llm_providers',
+    'message_annotations',
+    'message_feedbacks',
+    'messages',
+    'organizations',
+    'password_resets',
+    'plugins',
+    'prompt_template_versions',
+    'prompt_templates',
+    'refresh_tokens',
+    'subscriptions',
+    'team_invitations',
+    'teams',
+    'users',
+    'workflows',
+    'workspaces',
+]
+
+# UPDATE 语句自己设置了 updated_at（ORM 的 touch()）时保留该值，否则由数据库写入 now()
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+        NEW.updated_at = now();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def _existing_tables() -> list[str]:
+    """返回已存在的表；离线模式下假定全部存在"""
+    if op.get_context().as_sql:
+        return TIMESTAMP_MIXIN_TABLES
+
+    inspector = sa.inspect(op.get_bind())
+    return [table_name for table_name in TIMESTAMP_MIXIN_TABLES if inspector.has_table(table_name)]
+
+
+def _create_trigger(table_name: str) -> None:
+    """（重新）创建表上的 set_updated_at 触发器；asyncpg 不支持一次执行多条语句"""
+    op.execute(f'DROP TRIGGER IF EXISTS set_updated_at ON {table_name}')
+    op.execute(
+        f'CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table_name} '
+        'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+    )
+
+
+def upgrade() -> None:
+    """创建 set_updated_at() 触发器函数，并挂到所有带 updated_at 的表上"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s')
+    op.execute(SET_UPDATED_AT_FUNCTION)
+
+    for table_name in _existing_tables():
+        run_with_lock_retry(lambda table_name=table_name: _create_trigger(table_name))
+
+
+def downgrade() -> None:
+    """删除触发器和触发器函数"""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    set_local_timeouts(lock_timeout='3s')
+
+    for table_name in _existing_tables():
+        run_with_lock_retry(
+            lambda table_name=table_name: op.execute(
+                f'DROP TRIGGER IF EXISTS set_updated_at ON {table_name}'
+            )
+        )
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
@@ -0,0 +1,69 @@
+"""promote llm provider config keys to columns
+
+Revision ID: e3c6a9d1f487
+Revises: d9b4f7a2e6c3
+Create Date: 2025-12-10 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migration import add_columns, drop_columns, set_local_timeouts
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3c6a9d1f487'
+down_revision: Union[str, None] = 'd9b4f7a2e6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """把 config 中的 base_url / model / timeout_ms 提升为独立列，并从 config 中移除"""
+    set_local_timeouts(lock_timeout='3s')
+    add_columns(
+        'llm_providers',
+        sa.Column('base_url', sa.String(length=500), nullable=True),
+        sa.Column('default_model', sa.String(length=255), nullable=True),
+        sa.Column('timeout_ms', sa.Integer(), nullable=True),
+    )
+
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    # 提供商配置按工作空间计，行数很少，一条 UPDATE 即可
+    op.execute(
+        """
+        UPDATE llm_providers
+        SET base_url = config->>'base_url',
+            default_model = COALESCE(config->>'default_model', config->>'model'),
+            timeout_ms = (config->>'timeout_ms')::integer,
+            config = config - 'base_url' - 'default_model' - 'model' - 'timeout_ms'
+        WHERE config ?| array['base_url', 'default_model', 'model', 'timeout_ms']
+        """
+    )
+
+
+def downgrade() -> None:
+    """把独立列的值写回 config，再删除这些列"""
+    set_local_timeouts(lock_timeout='3s')
+
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute(
+            """
+            UPDATE llm_providers
+            SET config = config || jsonb_strip_nulls(
+                jsonb_build_object(
+                    'base_url', base_url,
+                    'model', default_model,
+                    'timeout_ms', timeout_ms
+                )
+            )
+            WHERE base_url IS NOT NULL OR default_model IS NOT NULL OR timeout_ms IS NOT NULL
+            """
+        )
+
+    drop_columns('llm_providers', 'base_url', 'default_model', 'timeout_ms')
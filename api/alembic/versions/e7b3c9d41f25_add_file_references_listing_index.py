@@ -0,0 +1,36 @@
+"""add file_references listing index
+
+Revision ID: e7b3c9d41f25
+Revises: d2a9f6b3c158
+Create Date: 2025-12-10 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c9d41f25'
+down_revision: Union[str, None] = 'd2a9f6b3c158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """文件列表按 (workspace_id, created_at, id) 排序分页，游标分页可直接走索引"""
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            'ix_file_references_workspace_created',
+            'file_references',
+            ['workspace_id', 'created_at', 'id'],
+        )
+
+
+def downgrade() -> None:
+    """删除文件列表索引"""
+    with op.get_context().autocommit_block():
+        drop_index_concurrently('ix_file_references_workspace_created', 'file_references')
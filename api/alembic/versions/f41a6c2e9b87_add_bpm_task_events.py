@@ -0,0 +1,55 @@
+"""add bpm task events
+
+Revision ID: f41a6c2e9b87
+Revises: e7b3c9d41f25
+Create Date: 2025-12-10 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f41a6c2e9b87'
+down_revision: Union[str, None] = 'e7b3c9d41f25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """创建任务事件表，完成任务后由后台 worker 消费以推进流程"""
+    op.create_table(
+        'bpm_task_events',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('task_id', sa.Uuid(), nullable=False),
+        sa.Column('process_instance_id', sa.Uuid(), nullable=False),
+        sa.Column('kind', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('status', sqlmodel.sql.sqltypes.AutoString(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_bpm_task_events_task_id', 'bpm_task_events', ['task_id'])
+    op.create_index(
+        'ix_bpm_task_events_pending',
+        'bpm_task_events',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """删除任务事件表"""
+    op.drop_index('ix_bpm_task_events_pending', table_name='bpm_task_events')
+    op.drop_index('ix_bpm_task_events_task_id', table_name='bpm_task_events')
+    op.drop_table('bpm_task_events')
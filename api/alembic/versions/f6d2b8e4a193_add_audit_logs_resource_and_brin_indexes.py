@@ -0,0 +1,54 @@
+"""add audit_logs resource and brin indexes
+
+Revision ID: f6d2b8e4a193
+Revises: e3c6a9d1f487
+Create Date: 2025-12-10 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.utils.migration import (
+    create_index_concurrently,
+    create_indexes_concurrently,
+    drop_index_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d2b8e4a193'
+down_revision: Union[str, None] = 'e3c6a9d1f487'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """resource_id 单列索引换成 (resource_type, resource_id) 部分索引，created_at 加 BRIN 索引"""
+    with op.get_context().autocommit_block():
+        create_indexes_concurrently(
+            [
+                {
+                    'index_name': 'ix_audit_logs_resource',
+                    'table_name': 'audit_logs',
+                    'columns': ['resource_type', 'resource_id'],
+                    'where': 'resource_id IS NOT NULL',
+                },
+                {
+                    'index_name': 'ix_audit_logs_created_at_brin',
+                    'table_name': 'audit_logs',
+                    'columns': ['created_at'],
+                    'using': 'brin',
+                },
+            ]
+        )
+        drop_index_concurrently('ix_audit_logs_resource_id', 'audit_logs')
+
+
+def downgrade() -> None:
+    """恢复 resource_id 单列索引"""
+    with op.get_context().autocommit_block():
+        create_index_concurrently('ix_audit_logs_resource_id', 'audit_logs', ['resource_id'])
+        drop_index_concurrently('ix_audit_logs_created_at_brin', 'audit_logs')
+        drop_index_concurrently('ix_audit_logs_resource', 'audit_logs')
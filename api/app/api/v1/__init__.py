@@ -10,6 +10,7 @@ Description:
 """API v1 路由"""
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import (
     auth,
@@ -20,24 +21,34 @@ from app.api.v1 import (
     users,
     workflows,
 )
+from app.core.migrations import MIGRATION_STATUS
 
 router = APIRouter(prefix='/api/v1', tags=['API v1'])
 
-# 注册认证路由（公开接口）
-router.include_router(auth.router, tags=['Authentication'])
 
-# 注册用户管理路由（需要认证）
-router.include_router(users.router, tags=['User Management'])
-
-# 注册 BPM 路由
-router.include_router(bpm_processes.router, prefix='/bpm/processes', tags=['BPM Processes'])
-router.include_router(bpm_tasks.router, prefix='/bpm/tasks', tags=['BPM Tasks'])
-router.include_router(bpm_approvals.router, prefix='/bpm/approvals', tags=['BPM Approvals'])
-
-# 注册文件路由
-router.include_router(file_router.router, prefix='/files', tags=['Files'])
+@router.get('/healthz/migrations', tags=['Health'])
+async def migration_health() -> ORJSONResponse:
+    """数据库迁移状态（公开接口）"""
+    return ORJSONResponse(content=dict(MIGRATION_STATUS))
+
+
+# 路由注册表：(子路由, 前缀, 标签)
+ROUTES = (
+    # 认证路由（公开接口）
+    (auth.router, '', ['Authentication']),
+    # 用户管理路由（需要认证）
+    (users.router, '', ['User Management']),
+    # BPM 路由
+    (bpm_processes.router, '/bpm/processes', ['BPM Processes']),
+    (bpm_tasks.router, '/bpm/tasks', ['BPM Tasks']),
+    (bpm_approvals.router, '/bpm/approvals', ['BPM Approvals']),
+    # 文件路由
+    (file_router.router, '/files', ['Files']),
+    # 工作流路由
+    (workflows.router, '', ['Workflows']),
+)
 
-# 注册工作流路由
-router.include_router(workflows.router, tags=['Workflows'])
+for sub_router, prefix, tags in ROUTES:
+    router.include_router(sub_router, prefix=prefix, tags=tags)
 
 __all__ = ['router']
@@ -13,6 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.database import get_session
+from app.core.migrations import require_migrations_done
 from app.core.redis import RedisClient, get_redis
 from app.schemas.auth_schema import (
     LoginRequest,
@@ -26,15 +27,24 @@ from app.schemas.auth_schema import (
 )
 from app.services.auth_service import AuthService
 
-router = APIRouter(prefix='/auth', tags=['Authentication'])
+# 所有认证接口都会写库，迁移完成前返回 503
+router = APIRouter(
+    prefix='/auth',
+    tags=['Authentication'],
+    dependencies=[Depends(require_migrations_done)],
+)
 
 # 依赖注入定义
 DbSession = Annotated[AsyncSession, Depends(get_session)]
 Redis = Annotated[RedisClient, Depends(get_redis)]
 
 
-def get_auth_service(db: DbSession, redis: Redis) -> AuthService:
-    """获取认证服务实例"""
+async def get_auth_service(db: DbSession, redis: Redis) -> AuthService:
+    """获取认证服务实例
+
+    同一请求内由 FastAPI 缓存（use_cache 默认开启）；AuthService 只绑定 db/redis，
+    JWT 密钥、令牌有效期等不可变配置已在模块加载时解析。
+    """
     return AuthService(db, redis)
 
 
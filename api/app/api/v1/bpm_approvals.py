@@ -9,63 +9,88 @@ Description: 审批 API
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TASK_KEY, invalidate
+from app.core.database import get_session
+from app.core.migrations import require_migrations_done
+from app.engine.bpm import TaskNotActiveError, TaskNotFoundError
+from app.middleware.auth import get_current_user
+from app.models.auth.user import User
 from app.schemas.bpm_approval_schemas import ApprovalRequest, ApprovalResponse
 from app.services.bpm_approval_service import ApprovalService
 from app.services.bpm_task_service import TaskService
 
-router = APIRouter()
+# 审批接口都会写库，迁移完成前返回 503
+router = APIRouter(dependencies=[Depends(require_migrations_done)])
 
+# 依赖注入定义
+DbSession = Annotated[AsyncSession, Depends(get_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
 
-def get_session():
-    """获取数据库会话（待实现）"""
-    pass
 
+async def get_approval_service(session: DbSession) -> ApprovalService:
+    """获取审批服务实例（与请求共用同一个会话）"""
+    return ApprovalService(session)
 
-def get_current_user():
-    """获取当前用户（待实现）"""
-    pass
+
+async def get_task_service(session: DbSession) -> TaskService:
+    """获取任务服务实例（与请求共用同一个会话）"""
+    return TaskService(session)
+
+
+ApprovalServiceDep = Annotated[ApprovalService, Depends(get_approval_service)]
+TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
 
 
 @router.post('/{task_id}/approve', response_model=ApprovalResponse)
 async def approve_task(
     task_id: UUID,
     request: ApprovalRequest,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    approval_service: ApprovalServiceDep,
+    task_service: TaskServiceDep,
+    session: DbSession,
+    current_user: CurrentUser,
 ):
     """
     description: 审批通过
     param {UUID} task_id
     param {ApprovalRequest} request
-    param {Session} session
+    param {ApprovalService} approval_service
+    param {TaskService} task_service
+    param {AsyncSession} session
     param {*} current_user
     return {*}
     """
-    approval_service = ApprovalService(session)
-
-    # 创建审批记录
-    approval = await approval_service.approve_task(
-        task_id=task_id,
-        user_id=current_user.id,
-        user_name=current_user.name,
-        comment=request.comment,
-        workspace_id=current_user.workspace_id,
-    )
-
-    # 完成任务
-    task_service = TaskService(session)
-    await task_service.complete_task(
-        task_id=task_id,
-        user_id=current_user.id,
-        result={'approved': True},
-        comment=request.comment,
-    )
-
+    # 审批记录与任务完成在同一事务中提交，避免出现有审批记录但任务仍未完成的中间状态
+    try:
+        async with session.begin():
+            # 创建审批记录
+            approval = await approval_service.approve_task(
+                task_id=task_id,
+                user_id=current_user.id,
+                user_name=current_user.name,
+                comment=request.comment,
+                workspace_id=current_user.workspace_id,
+            )
+
+            # 完成任务（任务已结束时整个事务回滚，不留下审批记录）
+            await task_service.complete_task(
+                task_id=task_id,
+                user_id=current_user.id,
+                result={'approved': True},
+                comment=request.comment,
+            )
+    except TaskNotFoundError:
+        raise HTTPException(status_code=404, detail='Task not found')
+    except TaskNotActiveError:
+        raise HTTPException(status_code=409, detail='Task is already finished')
+
+    await invalidate(TASK_KEY.format(task_id))
     return approval
 
 
@@ -73,34 +98,42 @@ async def approve_task(
 async def reject_task(
     task_id: UUID,
     request: ApprovalRequest,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    approval_service: ApprovalServiceDep,
+    task_service: TaskServiceDep,
+    session: DbSession,
+    current_user: CurrentUser,
 ):
     """
     description: 审批拒绝
     param {UUID} task_id
     param {ApprovalRequest} request
-    param {Session} session
+    param {ApprovalService} approval_service
+    param {TaskService} task_service
+    param {AsyncSession} session
     param {*} current_user
     return {*}
     """
-    approval_service = ApprovalService(session)
-
-    approval = await approval_service.reject_task(
-        task_id=task_id,
-        user_id=current_user.id,
-        user_name=current_user.name,
-        comment=request.comment or '拒绝',
-        workspace_id=current_user.workspace_id,
-    )
-
-    # 完成任务
-    task_service = TaskService(session)
-    await task_service.complete_task(
-        task_id=task_id,
-        user_id=current_user.id,
-        result={'approved': False},
-        comment=request.comment,
-    )
-
+    try:
+        async with session.begin():
+            approval = await approval_service.reject_task(
+                task_id=task_id,
+                user_id=current_user.id,
+                user_name=current_user.name,
+                comment=request.comment or '拒绝',
+                workspace_id=current_user.workspace_id,
+            )
+
+            # 完成任务
+            await task_service.complete_task(
+                task_id=task_id,
+                user_id=current_user.id,
+                result={'approved': False},
+                comment=request.comment,
+            )
+    except TaskNotFoundError:
+        raise HTTPException(status_code=404, detail='Task not found')
+    except TaskNotActiveError:
+        raise HTTPException(status_code=409, detail='Task is already finished')
+
+    await invalidate(TASK_KEY.format(task_id))
     return approval
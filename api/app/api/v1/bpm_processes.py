@@ -9,39 +9,51 @@ Description: 流程 API
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
+from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import PROCESS_INSTANCE_KEY, get_or_load, invalidate
+from app.core.database import get_readonly_session, get_session
+from app.middleware.auth import current_user_ctx, ensure_authenticated
 from app.schemas.bpm_process_schemas import (
     ProcessInstanceCreate,
     ProcessInstanceResponse,
 )
 from app.services.bpm_process_service import ProcessService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(ensure_authenticated)])
 
+# 依赖注入定义
+DbSession = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_readonly_session)]
 
-# TODO: 实现依赖注入
-def get_session():
-    """获取数据库会话（待实现）"""
-    pass
 
+async def get_process_service(session: DbSession) -> ProcessService:
+    """获取流程服务实例（与请求共用同一个会话）"""
+    return ProcessService(session)
 
-def get_current_user():
-    """获取当前用户（待实现）"""
-    pass
+
+ProcessServiceDep = Annotated[ProcessService, Depends(get_process_service)]
+
+
+async def get_process_read_service(session: ReadOnlySession) -> ProcessService:
+    """获取只读会话上的流程服务实例（用于 GET 接口）"""
+    return ProcessService(session)
+
+
+ProcessReadServiceDep = Annotated[ProcessService, Depends(get_process_read_service)]
 
 
 @router.post('/start', response_model=ProcessInstanceResponse)
 async def start_process(
     request: ProcessInstanceCreate,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    service: ProcessServiceDep,
 ):
     """启动流程实例"""
-    service = ProcessService(session)
+    current_user = current_user_ctx.get()
 
     instance = await service.start_process(
         process_key=request.process_key,
@@ -58,16 +70,24 @@ async def start_process(
 @router.get('/{instance_id}', response_model=ProcessInstanceResponse)
 async def get_process_instance(
     instance_id: UUID,
-    session: Session = Depends(get_session),
+    service: ProcessReadServiceDep,
 ):
     """
     description: 获取流程实例详情
     param {UUID} instance_id
-    param {Session} session
+    param {ProcessService} service
     return {*}
     """
-    service = ProcessService(session)
-    instance = await service.get_process_instance(instance_id)
+
+    async def load():
+        instance = await service.get_process_instance(instance_id)
+        if instance:
+            return ProcessInstanceResponse.model_validate(instance, from_attributes=True)
+        return None
+
+    instance = await get_or_load(
+        PROCESS_INSTANCE_KEY.format(instance_id), ProcessInstanceResponse, load
+    )
 
     if not instance:
         raise HTTPException(status_code=404, detail='Process instance not found')
@@ -79,18 +99,17 @@ async def get_process_instance(
 async def cancel_process(
     instance_id: UUID,
     reason: str,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    service: ProcessServiceDep,
 ):
     """
     description: 取消流程
     param {UUID} instance_id
     param {str} reason
-    param {Session} session
-    param {*} current_user
+    param {ProcessService} service
     return {*}
     """
-    service = ProcessService(session)
+    current_user = current_user_ctx.get()
     await service.cancel_process(instance_id, current_user.id, reason)
+    await invalidate(PROCESS_INSTANCE_KEY.format(instance_id))
 
     return {'message': 'Process cancelled successfully'}
@@ -9,51 +9,109 @@ Description: 任务 API
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from typing import List
+from typing import Annotated, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
-
-from app.schemas.bpm_task_schemas import TaskCompleteRequest, TaskResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TASK_KEY, get_or_load, invalidate
+from app.core.database import get_readonly_session, get_session
+from app.engine.bpm import TaskNotActiveError, TaskNotFoundError
+from app.middleware.auth import current_user_ctx, ensure_authenticated
+from app.schemas.bpm_task_schemas import (
+    TaskBulkClaimRequest,
+    TaskBulkCompleteRequest,
+    TaskBulkResponse,
+    TaskCompleteRequest,
+    TaskResponse,
+)
 from app.services.bpm_task_service import TaskService
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(ensure_authenticated)])
+
+# 依赖注入定义
+DbSession = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_readonly_session)]
+
+
+async def get_task_service(session: DbSession) -> TaskService:
+    """获取任务服务实例（与请求共用同一个会话）"""
+    return TaskService(session)
+
 
+TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
 
-def get_session():
-    """获取数据库会话（待实现）"""
-    pass
 
+async def get_task_read_service(session: ReadOnlySession) -> TaskService:
+    """获取只读会话上的任务服务实例（用于 GET 接口）"""
+    return TaskService(session)
 
-def get_current_user():
-    """获取当前用户（待实现）"""
-    pass
+
+TaskReadServiceDep = Annotated[TaskService, Depends(get_task_read_service)]
+
+# 待办列表整体校验、序列化，避免逐条 model_validate（模块加载时构建一次）
+_TASK_LIST = TypeAdapter(List[TaskResponse])
 
 
 @router.get('/my-tasks', response_model=List[TaskResponse])
 async def get_my_tasks(
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    service: TaskReadServiceDep,
 ):
     """获取我的待办任务"""
-    service = TaskService(session)
+    current_user = current_user_ctx.get()
     tasks = await service.get_my_tasks(
         user_id=current_user.id,
         workspace_id=current_user.workspace_id,
     )
-    return tasks
+    return Response(
+        content=_TASK_LIST.dump_json(_TASK_LIST.validate_python(tasks, from_attributes=True)),
+        media_type='application/json',
+    )
+
+
+# 批量接口需注册在 /{task_id}/... 之前，否则 bulk 会被当作 task_id 匹配
+@router.post('/bulk/claim', response_model=TaskBulkResponse)
+async def bulk_claim_tasks(
+    request: TaskBulkClaimRequest,
+    service: TaskServiceDep,
+):
+    """批量认领任务"""
+    current_user = current_user_ctx.get()
+    claimed = await service.bulk_claim(current_user.id, request.task_ids)
+    await invalidate(*(TASK_KEY.format(task_id) for task_id in claimed))
+    return TaskBulkResponse(task_ids=claimed)
+
+
+@router.post('/bulk/complete', response_model=TaskBulkResponse)
+async def bulk_complete_tasks(
+    request: TaskBulkCompleteRequest,
+    service: TaskServiceDep,
+    session: DbSession,
+):
+    """批量完成任务"""
+    current_user = current_user_ctx.get()
+    async with session.begin():
+        tasks = await service.bulk_complete(
+            user_id=current_user.id,
+            task_ids=request.task_ids,
+            result=request.result,
+            comment=request.comment,
+        )
+    await invalidate(*(TASK_KEY.format(task.id) for task in tasks))
+    return TaskBulkResponse(task_ids=[task.id for task in tasks])
 
 
 @router.post('/{task_id}/claim')
 async def claim_task(
     task_id: UUID,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    service: TaskServiceDep,
 ):
     """认领任务"""
-    service = TaskService(session)
+    current_user = current_user_ctx.get()
     await service.claim_task(task_id, current_user.id)
+    await invalidate(TASK_KEY.format(task_id))
     return {'message': 'Task claimed successfully'}
 
 
@@ -61,28 +119,41 @@ async def claim_task(
 async def complete_task(
     task_id: UUID,
     request: TaskCompleteRequest,
-    session: Session = Depends(get_session),
-    current_user=Depends(get_current_user),
+    service: TaskServiceDep,
+    session: DbSession,
 ):
     """完成任务"""
-    service = TaskService(session)
-    await service.complete_task(
-        task_id=task_id,
-        user_id=current_user.id,
-        result=request.result,
-        comment=request.comment,
-    )
+    current_user = current_user_ctx.get()
+    try:
+        async with session.begin():
+            await service.complete_task(
+                task_id=task_id,
+                user_id=current_user.id,
+                result=request.result,
+                comment=request.comment,
+            )
+    except TaskNotFoundError:
+        raise HTTPException(status_code=404, detail='Task not found')
+    except TaskNotActiveError:
+        raise HTTPException(status_code=409, detail='Task is already finished')
+    await invalidate(TASK_KEY.format(task_id))
     return {'message': 'Task completed successfully'}
 
 
 @router.get('/{task_id}', response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
-    session: Session = Depends(get_session),
+    service: TaskReadServiceDep,
 ):
     """获取任务详情"""
-    service = TaskService(session)
-    task = await service.get_task(task_id)
+
+    async def load():
+        task = await service.get_task(task_id)
+        if task:
+            return TaskResponse.model_validate(task, from_attributes=True)
+        return None
+
+    task = await get_or_load(TASK_KEY.format(task_id), TaskResponse, load)
 
     if not task:
         raise HTTPException(status_code=404, detail='Task not found')
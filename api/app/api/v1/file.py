@@ -12,16 +12,35 @@ Description: 提供文件上传、下载、删除、列表等功能。
 提供文件上传、下载、删除、列表等功能。
 """
 
-from typing import Annotated
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from urllib.parse import quote
+from typing import Annotated, AsyncGenerator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.database import get_session
+from app.core.cache import FILE_METADATA_KEY, get_or_load, invalidate
+from app.core.database import get_readonly_session, get_session
 from app.core.logging import get_logger
 from app.core.storage.exceptions import FileNotFoundError
+from app.schemas.base import construct_from_orm
 from app.schemas.file import (
     FileDeleteResponse,
     FileListItem,
@@ -29,7 +48,7 @@ from app.schemas.file import (
     FileMetadataResponse,
     FileUploadResponse,
 )
-from app.services.file_server import FileService
+from app.services.file_server import FileService, encode_cursor
 
 logger = get_logger(__name__)
 
@@ -42,6 +61,13 @@ async def get_file_service(session: Annotated[AsyncSession, Depends(get_session)
     return FileService(session)
 
 
+async def get_file_read_service(
+    session: Annotated[AsyncSession, Depends(get_readonly_session)],
+) -> FileService:
+    """获取只读会话上的文件服务实例（用于 GET 接口）"""
+    return FileService(session)
+
+
 @router.post(
     '/upload',
     response_model=FileUploadResponse,
@@ -93,42 +119,159 @@ async def upload_file(
         ) from e
 
 
+def _parse_range(range_header: str, size: int) -> Optional[tuple[int, int]]:
+    """解析单区间 Range 头（bytes=start-end / bytes=start- / bytes=-suffix）
+
+    Args:
+        range_header: Range 请求头
+        size: 文件大小
+
+    Returns:
+        (start, end) 闭区间；多区间或格式不支持时返回 None（按完整文件返回）
+
+    Raises:
+        HTTPException: 区间无法满足时抛出 416 错误
+    """
+    unit, _, spec = range_header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        return None
+
+    first, sep, last = spec.strip().partition('-')
+    if not sep or not (first + last).isdigit():
+        return None
+
+    if first:
+        start, end = int(first), int(last) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+
+    if start >= size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={'Content-Range': f'bytes */{size}'},
+        )
+    return start, min(end, size - 1)
+
+
+@lru_cache(maxsize=4096)
+def _download_headers(
+    file_id: UUID, filename: str, updated_at: datetime
+) -> MappingProxyType[str, str]:
+    """下载响应中与请求无关的固定响应头，按文件缓存
+
+    ETag 由 file_id 和 updated_at 组成：内容按 file_id 不可变，文件名等元数据变更时 ETag 随之变化。
+    文件名按 RFC 6266/5987 同时给出 ASCII 回退和 UTF-8 编码形式，避免中文文件名无法写入响应头。
+    """
+    ascii_name = filename.encode('ascii', 'replace').decode().replace('"', '_')
+    return MappingProxyType(
+        {
+            'Content-Disposition': (
+                f'attachment; filename="{ascii_name}"; filename*=UTF-8\'\'{quote(filename)}'
+            ),
+            'Accept-Ranges': 'bytes',
+            'ETag': f'"{file_id}-{int(updated_at.timestamp())}"',
+            # 文件按工作空间隔离，只允许浏览器缓存，不允许共享代理缓存
+            'Cache-Control': 'private, max-age=3600',
+        }
+    )
+
+
+async def _prefetch(
+    stream: AsyncGenerator[bytes, None], first_chunk: bytes
+) -> AsyncGenerator[bytes, None]:
+    """双缓冲：向客户端发送当前块的同时从存储读取下一块
+
+    Args:
+        stream: 文件内容流
+        first_chunk: 返回响应前已读出的首块（空文件为 b''）
+    """
+    pending = asyncio.ensure_future(stream.__anext__())
+    try:
+        if first_chunk:
+            yield first_chunk
+        while True:
+            try:
+                chunk = await pending
+            except StopAsyncIteration:
+                return
+            pending = asyncio.ensure_future(stream.__anext__())
+            yield chunk
+    finally:
+        # 客户端断开时取消预读并关闭底层流
+        pending.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await pending
+        await stream.aclose()
+
+
 @router.get(
     '/{file_id}/download',
     response_class=StreamingResponse,
     summary='下载文件',
-    description='下载指定文件，支持流式传输',
+    description='下载指定文件，支持流式传输、Range 断点续传和 ETag 缓存校验',
 )
 async def download_file(
     file_id: Annotated[UUID, Path(description='文件 ID')],
-    file_service: Annotated[FileService, Depends(get_file_service)],
-) -> StreamingResponse:
+    file_service: Annotated[FileService, Depends(get_file_read_service)],
+    range_header: Annotated[Optional[str], Header(alias='Range')] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """下载文件
 
+    If-None-Match 命中时直接返回 304，不读取文件内容。
+
     Args:
         file_id: 文件 ID
         file_service: 文件服务实例
+        range_header: Range 请求头
+        if_none_match: If-None-Match 请求头
 
     Returns:
-        StreamingResponse: 文件流响应
+        StreamingResponse: 文件流响应（200 或 206），命中 ETag 时返回 304
 
     Raises:
-        HTTPException: 文件不存在时抛出 404 错误
+        HTTPException: 文件不存在时抛出 404 错误，区间无法满足时抛出 416 错误，
+            存储读取失败时抛出 500 错误
     """
-    try:
-        file_reference, file_stream = await file_service.download_file(file_id)
-
-        return StreamingResponse(
-            content=file_stream,
-            media_type=file_reference.content_type,
-            headers={
-                'Content-Disposition': f'attachment; filename="{file_reference.filename}"',
-                'Content-Length': str(file_reference.size_bytes),
-            },
+    file_reference = await file_service.get_file_metadata(file_id)
+    if not file_reference:
+        logger.warning('File not found for download', file_id=str(file_id))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'File not found: {file_id}',
         )
 
+    base_headers = _download_headers(
+        file_reference.file_id, file_reference.filename, file_reference.updated_at
+    )
+    etag = base_headers['ETag']
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(',')):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag, 'Cache-Control': base_headers['Cache-Control']},
+        )
+
+    size = file_reference.size_bytes
+    headers = dict(base_headers)
+    byte_range = _parse_range(range_header, size) if range_header else None
+    if byte_range:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+    else:
+        start, end = 0, None
+        status_code = status.HTTP_200_OK
+    headers['Content-Length'] = str((size if end is None else end + 1) - start)
+
+    # 返回响应前先读出首块：响应头一旦发出就无法再改状态码，
+    # 文件内容缺失或存储不可用必须在这里转换为 404 / 500
+    file_stream = file_service.stream_file(file_reference, start, end)
+    try:
+        first_chunk = await anext(file_stream)
+    except StopAsyncIteration:
+        first_chunk = b''
     except FileNotFoundError as e:
-        logger.warning('File not found for download', file_id=str(file_id))
+        logger.warning('File content missing for download', file_id=str(file_id))
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'File not found: {file_id}',
@@ -140,6 +283,13 @@ async def download_file(
             detail=f'Failed to download file: {str(e)}',
         ) from e
 
+    return StreamingResponse(
+        content=_prefetch(file_stream, first_chunk),
+        status_code=status_code,
+        media_type=file_reference.content_type,
+        headers=headers,
+    )
+
 
 @router.delete(
     '/{file_id}',
@@ -165,6 +315,7 @@ async def delete_file(
     """
     try:
         success = await file_service.delete_file(file_id)
+        await invalidate(FILE_METADATA_KEY.format(file_id))
 
         if not success:
             raise HTTPException(
@@ -194,7 +345,7 @@ async def delete_file(
 )
 async def get_file_metadata(
     file_id: Annotated[UUID, Path(description='文件 ID')],
-    file_service: Annotated[FileService, Depends(get_file_service)],
+    file_service: Annotated[FileService, Depends(get_file_read_service)],
 ) -> FileMetadataResponse:
     """获取文件元数据
 
@@ -208,42 +359,69 @@ async def get_file_metadata(
     Raises:
         HTTPException: 文件不存在时抛出 404 错误
     """
-    file_reference = await file_service.get_file_metadata(file_id)
+    async def load() -> Optional[FileMetadataResponse]:
+        file_reference = await file_service.get_file_metadata(file_id)
+        if file_reference:
+            return FileMetadataResponse.model_validate(file_reference)
+        return None
 
-    if not file_reference:
+    metadata = await get_or_load(FILE_METADATA_KEY.format(file_id), FileMetadataResponse, load)
+
+    if not metadata:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f'File not found: {file_id}',
         )
 
-    return FileMetadataResponse.model_validate(file_reference)
+    return metadata
 
 
 @router.get(
     '',
     response_model=FileListResponse,
     summary='列出文件',
-    description='列出指定工作空间的文件列表',
+    description='列出指定工作空间的文件列表；传入 cursor 时使用游标分页（推荐用于深翻页）',
 )
 async def list_files(
     workspace_id: Annotated[UUID, Query(description='工作空间 ID')],
-    file_service: Annotated[FileService, Depends(get_file_service)],
+    file_service: Annotated[FileService, Depends(get_file_read_service)],
     limit: Annotated[int, Query(ge=1, le=1000, description='每页数量')] = 100,
-    offset: Annotated[int, Query(ge=0, description='偏移量')] = 0,
-) -> FileListResponse:
+    offset: Annotated[int, Query(ge=0, description='偏移量（传入 cursor 时忽略）')] = 0,
+    cursor: Annotated[Optional[str], Query(description='上一页返回的 next_cursor')] = None,
+) -> Response:
     """列出文件
 
     Args:
         workspace_id: 工作空间 ID
         limit: 每页数量（1-1000）
         offset: 偏移量
+        cursor: 游标，传入时按 (created_at, id) 游标分页，不返回 total
         file_service: 文件服务实例
 
     Returns:
         FileListResponse: 文件列表响应
-    """
-    files = await file_service.list_files(workspace_id=workspace_id, limit=limit, offset=offset)
-
-    items = [FileListItem.model_validate(f) for f in files]
 
-    return FileListResponse(total=len(items), items=items, limit=limit, offset=offset)
+    Raises:
+        HTTPException: 游标无效时抛出 400 错误
+    """
+    total: Optional[int] = None
+    if cursor:
+        try:
+            files, next_cursor = await file_service.list_files_keyset(
+                workspace_id=workspace_id, after=cursor, limit=limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        offset = 0
+    else:
+        files, total = await file_service.list_files_with_count(
+            workspace_id=workspace_id, limit=limit, offset=offset
+        )
+        next_cursor = encode_cursor(files[-1]) if files and offset + len(files) < total else None
+
+    # 数据来自数据库，跳过逐条校验；整体直接序列化，避免 FastAPI 再校验一遍
+    items = [construct_from_orm(FileListItem, f) for f in files]
+    response = FileListResponse.model_construct(
+        total=total, items=items, limit=limit, offset=offset, next_cursor=next_cursor
+    )
+    return Response(content=response.model_dump_json(), media_type='application/json')
@@ -9,11 +9,11 @@ Description: 用户管理，增删改查
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, UploadFile, HTTPException, File, status
+from fastapi import APIRouter, Depends, UploadFile, HTTPException, File, Response, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.database import get_session
-from app.middleware.auth import get_current_user
+from app.middleware.auth import current_user_ctx, ensure_authenticated
 from app.services.user_service import UserService
 from app.schemas.user import (
     UserProfileResponse,
@@ -26,14 +26,17 @@ from app.schemas.user import (
 
 from app.models.auth.user import User
 
-router = APIRouter(prefix='/users', tags=['User Management'])
+router = APIRouter(
+    prefix='/users',
+    tags=['User Management'],
+    dependencies=[Depends(ensure_authenticated)],
+)
 
 # 依赖注入定义
 DbSession = Annotated[AsyncSession, Depends(get_session)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
-def get_user_service(session: DbSession) -> UserService:
+async def get_user_service(session: DbSession) -> UserService:
     """获取用户服务实例"""
     return UserService(session)
 
@@ -41,21 +44,41 @@ def get_user_service(session: DbSession) -> UserService:
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
-@router.get('/me', response_model=UserProfileResponse, summary='获取当前用户信息')
-async def get_current_user_info(current_user: CurrentUser) -> UserProfileResponse:
+def _profile_response(user: User) -> Response:
+    """直接用 Pydantic 序列化用户资料，跳过 FastAPI 对返回值的二次校验和 jsonable_encoder"""
+    profile = UserProfileResponse.model_validate(user)
+    return Response(
+        content=profile.model_dump_json(exclude_none=True),
+        media_type='application/json',
+    )
+
+
+@router.get(
+    '/me',
+    response_model=UserProfileResponse,
+    response_model_exclude_none=True,
+    summary='获取当前用户信息',
+)
+async def get_current_user_info() -> Response:
     """获取当前登陆用户的详细信息"""
-    return UserProfileResponse.model_validate(current_user)
+    current_user = current_user_ctx.get()
+    return _profile_response(current_user)
 
 
-@router.put('/me', response_model=UserProfileResponse, summary='更新用户资料')
+@router.put(
+    '/me',
+    response_model=UserProfileResponse,
+    response_model_exclude_none=True,
+    summary='更新用户资料',
+)
 async def update_user_profile(
     user_update: UserUpdateRequest,
-    current_user: CurrentUser,
     service: UserServiceDep,
-) -> UserProfileResponse:
+) -> Response:
     """更新用户资料（用户名、邮箱等）"""
+    current_user = current_user_ctx.get()
     updated_user = await service.update_user(user=current_user, update_data=user_update)
-    return UserProfileResponse.model_validate(updated_user)
+    return _profile_response(updated_user)
 
 
 @router.post(
@@ -65,10 +88,10 @@ async def update_user_profile(
 )
 async def change_password(
     password_data: PasswordChangeRequest,
-    current_user: CurrentUser,
     service: UserServiceDep,
 ) -> PasswordChangeResponse:
     """修改当前用户密码"""
+    current_user = current_user_ctx.get()
     success = await service.change_password(
         user=current_user,
         old_password=password_data.old_password,
@@ -92,11 +115,11 @@ async def change_password(
     summary='上传头像/更新头像',
 )
 async def upload_avatar(
-    current_user: CurrentUser,
     service: UserServiceDep,
     file: UploadFile = File(..., description='头像文件'),
 ) -> AvatarUploadResponse:
     """上传/更新头像"""
+    current_user = current_user_ctx.get()
     avatar_url = await service.update_avatar(user=current_user, file=file)
 
     return AvatarUploadResponse(
@@ -112,10 +135,10 @@ async def upload_avatar(
     summary='删除账户',
 )
 async def delete_account(
-    current_user: CurrentUser,
     service: UserServiceDep,
 ) -> UserDeleteResponse:
     """删除账号（软删除）"""
+    current_user = current_user_ctx.get()
     success = await service.soft_delete_user(user=current_user)
 
     return UserDeleteResponse(
@@ -14,16 +14,30 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_session
+from app.core.cache import (
+    WORKFLOW_CONNECTIONS_KEY,
+    WORKFLOW_KEY,
+    WORKFLOW_NODES_KEY,
+    get_or_load,
+    invalidate,
+)
+from app.core.database import get_readonly_session, get_session
 from app.middleware.auth import get_current_user
 from app.models.auth.user import User
+from app.models.workflow.workflow import Workflow
+from app.schemas.base import construct_from_orm
 from app.schemas.workflow import (
+    ConnectionBulkCreateRequest,
     ConnectionCreateRequest,
+    ConnectionListResponse,
     ConnectionResponse,
+    NodeBulkCreateRequest,
     NodeCreateRequest,
+    NodeListResponse,
     NodeResponse,
     NodeUpdateRequest,
     ValidationErrorDetail,
@@ -35,8 +49,8 @@ from app.schemas.workflow import (
     WorkflowResponse,
     WorkflowUpdateRequest,
 )
+from app.services.audit_log_writer import audit_log_writer
 from app.services.workflow_service import (
-    ConnectionNotFoundError,
     NodeNotFoundError,
     WorkflowNotFoundError,
     WorkflowService,
@@ -47,9 +61,47 @@ router = APIRouter(prefix='/workflows', tags=['Workflow Management'])
 
 # Dependency injection definitions
 DbSession = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_readonly_session)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
+async def get_workflow_service(session: DbSession) -> WorkflowService:
+    """Provide a WorkflowService bound to the request's session."""
+    return WorkflowService(session)
+
+
+WorkflowServiceDep = Annotated[WorkflowService, Depends(get_workflow_service)]
+
+
+async def get_workflow_read_service(session: ReadOnlySession) -> WorkflowService:
+    """Provide a WorkflowService on a read-only session for GET endpoints."""
+    return WorkflowService(session)
+
+
+WorkflowReadServiceDep = Annotated[WorkflowService, Depends(get_workflow_read_service)]
+
+
+def _graph_cache_keys(workflow_id: UUID) -> tuple[str, ...]:
+    """Cache keys derived from a workflow's graph; dropped on every write to it."""
+    return (
+        WORKFLOW_KEY.format(workflow_id),
+        WORKFLOW_NODES_KEY.format(workflow_id),
+        WORKFLOW_CONNECTIONS_KEY.format(workflow_id),
+    )
+
+
+def _audit(action: str, workflow: Workflow, current_user: User) -> None:
+    """Queue an audit log entry for a workflow write (inserted in batches later)."""
+    audit_log_writer.record(
+        action=action,
+        resource_type='WORKFLOW',
+        workspace_id=workflow.workspace_id,
+        user_id=current_user.id,
+        resource_id=workflow.id,
+        details={'name': workflow.name},
+    )
+
+
 # ============================================================================
 # Workflow Endpoints
 # ============================================================================
@@ -64,7 +116,7 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 async def create_workflow(
     workflow_data: WorkflowCreateRequest,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
     workspace_id: UUID,
 ) -> WorkflowResponse:
     """
@@ -73,25 +125,29 @@ async def create_workflow(
     Args:
         workflow_data: Workflow creation data
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
         workspace_id: ID of the workspace to create workflow in
 
     Returns:
         Created workflow
-    """
-    service = WorkflowService(session)
 
+    Raises:
+        HTTPException: 409 if the workflow violates a database constraint
+    """
     try:
         workflow = await service.create_workflow(
             workflow_data=workflow_data,
             workspace_id=workspace_id,
             created_by=current_user.id,
         )
+        _audit('CREATE', workflow, current_user)
         return WorkflowResponse.model_validate(workflow)
-    except Exception as e:
+    except IntegrityError as e:
+        # Retrying will not help; report a conflict instead of a 500.
+        # Anything unexpected propagates to the default error handler.
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f'Failed to create workflow: {str(e)}',
+            status_code=status.HTTP_409_CONFLICT,
+            detail='Workflow conflicts with an existing record',
         ) from e
 
 
@@ -103,33 +159,34 @@ async def create_workflow(
 async def list_workflows(
     workspace_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowReadServiceDep,
     skip: int = 0,
     limit: int = 100,
-) -> WorkflowListResponse:
+) -> Response:
     """
     List all workflows in the specified workspace.
 
     Args:
         workspace_id: ID of the workspace
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
         skip: Number of records to skip
         limit: Maximum number of records to return
 
     Returns:
         List of workflows and total count
     """
-    service = WorkflowService(session)
-
     workflows, total = await service.list_workflows(
         workspace_id=workspace_id, skip=skip, limit=limit
     )
 
-    return WorkflowListResponse(
-        workflows=[WorkflowResponse.model_validate(w) for w in workflows],
+    # Rows come straight from the database: skip per-item validation and serialize the
+    # whole page directly instead of letting FastAPI validate it again
+    response = WorkflowListResponse.model_construct(
+        workflows=[construct_from_orm(WorkflowResponse, w) for w in workflows],
         total=total,
     )
+    return Response(content=response.model_dump_json(), media_type='application/json')
 
 
 @router.get(
@@ -140,7 +197,7 @@ async def list_workflows(
 async def get_workflow(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowReadServiceDep,
 ) -> WorkflowDetailResponse:
     """
     Get detailed information about a workflow including nodes and connections.
@@ -148,23 +205,24 @@ async def get_workflow(
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Workflow details with nodes and connections
     """
-    service = WorkflowService(session)
-
-    try:
-        workflow = await service.get_workflow(workflow_id)
-        nodes = await service.list_nodes(workflow_id)
-        connections = await service.list_connections(workflow_id)
 
-        return WorkflowDetailResponse(
-            **workflow.model_dump(),
-            nodes=[NodeResponse.model_validate(n) for n in nodes],
-            connections=[ConnectionResponse.model_validate(c) for c in connections],
+    async def load() -> WorkflowDetailResponse:
+        workflow = await service.get_workflow_with_graph(workflow_id)
+        # Build straight from the ORM objects in one pass, without model_dump or validation
+        return construct_from_orm(
+            WorkflowDetailResponse,
+            workflow,
+            nodes=[construct_from_orm(NodeResponse, n) for n in workflow.nodes],
+            connections=[construct_from_orm(ConnectionResponse, c) for c in workflow.connections],
         )
+
+    try:
+        return await get_or_load(WORKFLOW_KEY.format(workflow_id), WorkflowDetailResponse, load)
     except WorkflowNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -181,7 +239,7 @@ async def update_workflow(
     workflow_id: UUID,
     workflow_data: WorkflowUpdateRequest,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> WorkflowResponse:
     """
     Update a workflow's properties.
@@ -190,15 +248,15 @@ async def update_workflow(
         workflow_id: ID of the workflow
         workflow_data: Workflow update data
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Updated workflow
     """
-    service = WorkflowService(session)
-
     try:
         workflow = await service.update_workflow(workflow_id, workflow_data)
+        await invalidate(*_graph_cache_keys(workflow_id))
+        _audit('UPDATE', workflow, current_user)
         return WorkflowResponse.model_validate(workflow)
     except WorkflowNotFoundError as e:
         raise HTTPException(
@@ -215,7 +273,7 @@ async def update_workflow(
 async def delete_workflow(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> WorkflowDeleteResponse:
     """
     Delete a workflow and all its associated data.
@@ -223,15 +281,15 @@ async def delete_workflow(
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Deletion confirmation
     """
-    service = WorkflowService(session)
-
     try:
-        await service.delete_workflow(workflow_id)
+        workflow = await service.delete_workflow(workflow_id)
+        await invalidate(*_graph_cache_keys(workflow_id))
+        _audit('DELETE', workflow, current_user)
         return WorkflowDeleteResponse(
             success=True,
             message='Workflow deleted successfully',
@@ -252,7 +310,7 @@ async def delete_workflow(
 async def validate_workflow(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> ValidationResultResponse:
     """
     Validate a workflow's completeness and correctness.
@@ -260,13 +318,11 @@ async def validate_workflow(
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Validation result
     """
-    service = WorkflowService(session)
-
     try:
         validation_result = await service.validate_workflow(workflow_id)
         return ValidationResultResponse(
@@ -288,7 +344,7 @@ async def validate_workflow(
 async def save_workflow(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> WorkflowResponse:
     """
     Save a workflow after validating its completeness.
@@ -296,7 +352,7 @@ async def save_workflow(
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Saved workflow
@@ -304,10 +360,9 @@ async def save_workflow(
     Raises:
         HTTPException: If workflow validation fails
     """
-    service = WorkflowService(session)
-
     try:
         workflow = await service.save_workflow(workflow_id)
+        await invalidate(*_graph_cache_keys(workflow_id))
         return WorkflowResponse.model_validate(workflow)
     except WorkflowNotFoundError as e:
         raise HTTPException(
@@ -339,7 +394,7 @@ async def add_node(
     workflow_id: UUID,
     node_data: NodeCreateRequest,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> NodeResponse:
     """
     Add a new node to a workflow.
@@ -348,15 +403,14 @@ async def add_node(
         workflow_id: ID of the workflow
         node_data: Node creation data
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Created node
     """
-    service = WorkflowService(session)
-
     try:
         node = await service.add_node(workflow_id, node_data)
+        await invalidate(*_graph_cache_keys(workflow_id))
         return NodeResponse.model_validate(node)
     except WorkflowNotFoundError as e:
         raise HTTPException(
@@ -373,6 +427,57 @@ async def add_node(
         ) from e
 
 
+@router.post(
+    '/{workflow_id}/nodes/bulk',
+    response_model=list[NodeResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary='Add several nodes to workflow',
+)
+async def bulk_add_nodes(
+    workflow_id: UUID,
+    request: NodeBulkCreateRequest,
+    current_user: CurrentUser,
+    service: WorkflowServiceDep,
+) -> Response:
+    """
+    Add several nodes to a workflow in one transaction (e.g. when cloning or importing).
+
+    Args:
+        workflow_id: ID of the workflow
+        request: Nodes to create
+        current_user: Current authenticated user
+        service: Workflow service
+
+    Returns:
+        Created nodes, in request order
+    """
+    try:
+        nodes = await service.bulk_add_nodes(workflow_id, request.nodes)
+    except WorkflowNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except WorkflowValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                'message': 'Node validation failed',
+                'errors': e.validation_result.errors,
+            },
+        ) from e
+
+    await invalidate(*_graph_cache_keys(workflow_id))
+    response = NodeListResponse.model_construct(
+        [construct_from_orm(NodeResponse, n) for n in nodes]
+    )
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type='application/json',
+    )
+
+
 @router.get(
     '/{workflow_id}/nodes',
     response_model=list[NodeResponse],
@@ -381,23 +486,29 @@ async def add_node(
 async def list_nodes(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
-) -> list[NodeResponse]:
+    service: WorkflowReadServiceDep,
+) -> Response:
     """
     List all nodes in a workflow.
 
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         List of nodes
     """
-    service = WorkflowService(session)
 
-    nodes = await service.list_nodes(workflow_id)
-    return [NodeResponse.model_validate(n) for n in nodes]
+    async def load() -> NodeListResponse:
+        nodes = await service.list_nodes(workflow_id)
+        # Rows only carry scalar columns, so they are built without validation
+        return NodeListResponse.model_construct(
+            [construct_from_orm(NodeResponse, n) for n in nodes]
+        )
+
+    nodes = await get_or_load(WORKFLOW_NODES_KEY.format(workflow_id), NodeListResponse, load)
+    return Response(content=nodes.model_dump_json(), media_type='application/json')
 
 
 @router.get(
@@ -409,7 +520,7 @@ async def get_node(
     workflow_id: UUID,
     node_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowReadServiceDep,
 ) -> NodeResponse:
     """
     Get details of a specific node.
@@ -418,27 +529,18 @@ async def get_node(
         workflow_id: ID of the workflow
         node_id: ID of the node
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Node details
     """
-    service = WorkflowService(session)
-
-    try:
-        node = await service.get_node(node_id)
-        # Verify node belongs to the workflow
-        if node.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f'Node {node_id} not found in workflow {workflow_id}',
-            )
-        return NodeResponse.model_validate(node)
-    except NodeNotFoundError as e:
+    node = await service.get_node_or_none(workflow_id, node_id)
+    if node is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+            detail=f'Node {node_id} not found in workflow {workflow_id}',
+        )
+    return NodeResponse.model_validate(node)
 
 
 @router.put(
@@ -451,7 +553,7 @@ async def update_node(
     node_id: UUID,
     node_data: NodeUpdateRequest,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> NodeResponse:
     """
     Update a node's properties.
@@ -461,24 +563,13 @@ async def update_node(
         node_id: ID of the node
         node_data: Node update data
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Updated node
     """
-    service = WorkflowService(session)
-
     try:
-        node = await service.get_node(node_id)
-        # Verify node belongs to the workflow
-        if node.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f'Node {node_id} not found in workflow {workflow_id}',
-            )
-
-        updated_node = await service.update_node(node_id, node_data)
-        return NodeResponse.model_validate(updated_node)
+        updated_node = await service.update_node(node_id, node_data, workflow_id=workflow_id)
     except NodeNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -493,6 +584,9 @@ async def update_node(
             },
         ) from e
 
+    await invalidate(*_graph_cache_keys(workflow_id))
+    return NodeResponse.model_validate(updated_node)
+
 
 @router.delete(
     '/{workflow_id}/nodes/{node_id}',
@@ -503,7 +597,7 @@ async def delete_node(
     workflow_id: UUID,
     node_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> None:
     """
     Delete a node from a workflow.
@@ -512,25 +606,17 @@ async def delete_node(
         workflow_id: ID of the workflow
         node_id: ID of the node
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
     """
-    service = WorkflowService(session)
-
-    try:
-        node = await service.get_node(node_id)
-        # Verify node belongs to the workflow
-        if node.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f'Node {node_id} not found in workflow {workflow_id}',
-            )
-
-        await service.delete_node(node_id)
-    except NodeNotFoundError as e:
+    node = await service.get_node_or_none(workflow_id, node_id)
+    if node is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+            detail=f'Node {node_id} not found in workflow {workflow_id}',
+        )
+
+    await service.delete_node(node_id)
+    await invalidate(*_graph_cache_keys(workflow_id))
 
 
 # ============================================================================
@@ -548,7 +634,7 @@ async def create_connection(
     workflow_id: UUID,
     connection_data: ConnectionCreateRequest,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> ConnectionResponse:
     """
     Create a connection between two nodes in a workflow.
@@ -557,15 +643,14 @@ async def create_connection(
         workflow_id: ID of the workflow
         connection_data: Connection creation data
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         Created connection
     """
-    service = WorkflowService(session)
-
     try:
         connection = await service.connect_nodes(workflow_id, connection_data)
+        await invalidate(*_graph_cache_keys(workflow_id))
         return ConnectionResponse.model_validate(connection)
     except (WorkflowNotFoundError, NodeNotFoundError) as e:
         raise HTTPException(
@@ -582,6 +667,57 @@ async def create_connection(
         ) from e
 
 
+@router.post(
+    '/{workflow_id}/connections/bulk',
+    response_model=list[ConnectionResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary='Create several connections',
+)
+async def bulk_create_connections(
+    workflow_id: UUID,
+    request: ConnectionBulkCreateRequest,
+    current_user: CurrentUser,
+    service: WorkflowServiceDep,
+) -> Response:
+    """
+    Create several connections in a workflow in one transaction.
+
+    Args:
+        workflow_id: ID of the workflow
+        request: Connections to create
+        current_user: Current authenticated user
+        service: Workflow service
+
+    Returns:
+        Created connections, in request order
+    """
+    try:
+        connections = await service.bulk_connect_nodes(workflow_id, request.connections)
+    except WorkflowNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        ) from e
+    except WorkflowValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                'message': 'Connection validation failed',
+                'errors': e.validation_result.errors,
+            },
+        ) from e
+
+    await invalidate(*_graph_cache_keys(workflow_id))
+    response = ConnectionListResponse.model_construct(
+        [construct_from_orm(ConnectionResponse, c) for c in connections]
+    )
+    return Response(
+        content=response.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type='application/json',
+    )
+
+
 @router.get(
     '/{workflow_id}/connections',
     response_model=list[ConnectionResponse],
@@ -590,23 +726,30 @@ async def create_connection(
 async def list_connections(
     workflow_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
-) -> list[ConnectionResponse]:
+    service: WorkflowReadServiceDep,
+) -> Response:
     """
     List all connections in a workflow.
 
     Args:
         workflow_id: ID of the workflow
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
 
     Returns:
         List of connections
     """
-    service = WorkflowService(session)
 
-    connections = await service.list_connections(workflow_id)
-    return [ConnectionResponse.model_validate(c) for c in connections]
+    async def load() -> ConnectionListResponse:
+        connections = await service.list_connections(workflow_id)
+        return ConnectionListResponse.model_construct(
+            [construct_from_orm(ConnectionResponse, c) for c in connections]
+        )
+
+    connections = await get_or_load(
+        WORKFLOW_CONNECTIONS_KEY.format(workflow_id), ConnectionListResponse, load
+    )
+    return Response(content=connections.model_dump_json(), media_type='application/json')
 
 
 @router.delete(
@@ -618,7 +761,7 @@ async def delete_connection(
     workflow_id: UUID,
     connection_id: UUID,
     current_user: CurrentUser,
-    session: DbSession,
+    service: WorkflowServiceDep,
 ) -> None:
     """
     Delete a connection between nodes.
@@ -627,22 +770,14 @@ async def delete_connection(
         workflow_id: ID of the workflow
         connection_id: ID of the connection
         current_user: Current authenticated user
-        session: Database session
+        service: Workflow service
     """
-    service = WorkflowService(session)
-
-    try:
-        connection = await service.get_connection(connection_id)
-        # Verify connection belongs to the workflow
-        if connection.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f'Connection {connection_id} not found in workflow {workflow_id}',
-            )
-
-        await service.delete_connection(connection_id)
-    except ConnectionNotFoundError as e:
+    connection = await service.get_connection_or_none(workflow_id, connection_id)
+    if connection is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        ) from e
+            detail=f'Connection {connection_id} not found in workflow {workflow_id}',
+        )
+
+    await service.delete_connection(connection_id)
+    await invalidate(*_graph_cache_keys(workflow_id))
@@ -0,0 +1,191 @@
+"""Cache-aside helpers for read-heavy GET-by-id endpoints.
+
+Responses are cached as serialized Pydantic models in two tiers:
+
+- L1: a small per-process ``TTLCache`` for ultra-hot IDs. It is only cleared on
+  the worker that performed the write, so other workers may serve a stale value
+  for up to ``settings.cache_local_ttl`` seconds. Callers get deep copies of the
+  L1 entries, so mutating a returned model never changes the cached one.
+- L2: Redis, shared by all workers, with ``settings.cache_ttl`` expiry.
+
+Redis values are stored as ``"<refresh_at>|<json>"``. Once ``refresh_at`` (80% of
+the TTL) has passed, readers refresh early with a probability that grows towards
+expiry; a ``SET <key>:lock NX EX 5`` lock makes sure only one of them hits the
+database. On a cold miss the same lock is used so concurrent readers wait for
+the first loader instead of stampeding Postgres.
+
+Every key has a generation counter ``<key>:gen`` that ``invalidate()`` bumps. A
+loader reads the generation before querying the database and only writes its
+result back if the generation is unchanged, so a value loaded before a
+concurrent write cannot overwrite the invalidation and live for the full TTL.
+
+Redis errors never fail a read: the loader is called directly instead.
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from cachetools import TTLCache
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_client
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+# Cache keys (format with the entity ID)
+WORKFLOW_KEY = 'v1:wf:{}'
+WORKFLOW_NODES_KEY = 'v1:wf:{}:nodes'
+WORKFLOW_CONNECTIONS_KEY = 'v1:wf:{}:conns'
+PROCESS_INSTANCE_KEY = 'v1:bpm:inst:{}'
+TASK_KEY = 'v1:bpm:task:{}'
+FILE_METADATA_KEY = 'v1:file:meta:{}'
+
+_EARLY_REFRESH_RATIO = 0.8
+_LOCK_TTL = 5  # seconds
+_LOCK_POLL_INTERVAL = 0.05  # seconds
+_LOCK_POLL_ATTEMPTS = 10
+
+# Write the value only if the key's generation still matches the one read before loading.
+# KEYS: value key, generation key; ARGV: expected generation ('' if unset), value, ttl
+_SET_IF_GENERATION = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+_local_cache: TTLCache = TTLCache(
+    maxsize=settings.cache_local_maxsize, ttl=settings.cache_local_ttl
+)
+
+
+def _decode(raw: bytes, schema: Type[ModelT]) -> Tuple[float, ModelT]:
+    """Split a stored value into its refresh deadline and model."""
+    refresh_at, _, payload = raw.partition(b'|')
+    return float(refresh_at), schema.model_validate_json(payload)
+
+
+def _should_refresh(refresh_at: float, ttl: int) -> bool:
+    """Decide whether this reader refreshes a value that is close to expiry."""
+    now = time.time()
+    if now < refresh_at:
+        return False
+    window = ttl * (1 - _EARLY_REFRESH_RATIO)
+    return random.random() < (now - refresh_at) / window
+
+
+async def _acquire_lock(key: str) -> bool:
+    """Try to become the single loader for ``key``."""
+    return bool(await redis_client.redis.set(f'{key}:lock', '1', nx=True, ex=_LOCK_TTL))
+
+
+async def _load_and_store(
+    key: str, loader: Callable[[], Awaitable[Optional[ModelT]]], ttl: int
+) -> Optional[ModelT]:
+    """Run the loader while holding the lock and write the result to both tiers.
+
+    The result is returned either way, but only cached if no ``invalidate()`` for
+    ``key`` ran while the loader was reading the database.
+    """
+    try:
+        generation = await redis_client.get_bytes(f'{key}:gen') or b''
+        value = await loader()
+        if value is not None:
+            refresh_at = time.time() + ttl * _EARLY_REFRESH_RATIO
+            stored = await redis_client.redis.eval(
+                _SET_IF_GENERATION,
+                2,
+                key,
+                f'{key}:gen',
+                generation,
+                f'{refresh_at}|{value.model_dump_json()}',
+                ttl,
+            )
+            if stored:
+                _local_cache[key] = value.model_copy(deep=True)
+        return value
+    finally:
+        await redis_client.delete(f'{key}:lock')
+
+
+async def get_or_load(
+    key: str,
+    schema: Type[ModelT],
+    loader: Callable[[], Awaitable[Optional[ModelT]]],
+    ttl: Optional[int] = None,
+) -> Optional[ModelT]:
+    """Return the cached value for ``key``, loading and caching it on a miss.
+
+    Args:
+        key: Cache key, e.g. ``WORKFLOW_KEY.format(workflow_id)``
+        schema: Response model used to deserialize the cached JSON
+        loader: Coroutine factory that reads the value from the database; a
+            ``None`` result (not found) is not cached
+        ttl: Redis expiry in seconds, defaults to ``settings.cache_ttl``
+
+    Returns:
+        The cached or freshly loaded value, or None if the loader found nothing
+    """
+    value = _local_cache.get(key)
+    if value is not None:
+        return value.model_copy(deep=True)
+
+    if redis_client.redis is None:
+        return await loader()
+
+    ttl = ttl or settings.cache_ttl
+    try:
+        raw = await redis_client.get_bytes(key)
+        if raw is not None:
+            refresh_at, value = _decode(raw, schema)
+            if _should_refresh(refresh_at, ttl) and await _acquire_lock(key):
+                return await _load_and_store(key, loader, ttl)
+            _local_cache[key] = value
+            return value.model_copy(deep=True)
+
+        # Cold miss: one reader loads, the others wait briefly for its result
+        for _ in range(_LOCK_POLL_ATTEMPTS):
+            if await _acquire_lock(key):
+                return await _load_and_store(key, loader, ttl)
+            await asyncio.sleep(_LOCK_POLL_INTERVAL)
+            raw = await redis_client.get_bytes(key)
+            if raw is not None:
+                return _decode(raw, schema)[1]
+    except RedisError as e:
+        logger.warning('Cache unavailable, reading from database', key=key, error=str(e))
+
+    return await loader()
+
+
+async def invalidate(*keys: str) -> None:
+    """Drop ``keys`` from both cache tiers after a write.
+
+    Also bumps each key's generation, so a load that started before the write
+    does not store its now-stale result.
+
+    Args:
+        keys: Cache keys to delete
+    """
+    for key in keys:
+        _local_cache.pop(key, None)
+
+    if redis_client.redis is None or not keys:
+        return
+    try:
+        async with redis_client.redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(f'{key}:gen')
+                # Outlive any load in flight; an expired counter only causes a skipped write
+                pipe.expire(f'{key}:gen', settings.cache_ttl)
+            pipe.delete(*keys)
+            await pipe.execute()
+    except RedisError as e:
+        logger.error('Failed to invalidate cache', keys=list(keys), error=str(e))
@@ -1,6 +1,7 @@
 """Application configuration using pydantic-settings."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Literal, Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -31,18 +32,58 @@ class Settings(BaseSettings):
     # Database - PostgreSQL
     database_url: str = Field(..., description='PostgreSQL connection URL')
     database_echo: bool = False
-    database_pool_size: int = 5
+    # Per worker process: keep workers * (pool_size + max_overflow) below Postgres
+    # max_connections (minus superuser_reserved_connections and other clients)
+    database_pool_size: int = 20
     database_max_overflow: int = 10
+    database_pool_timeout: int = 30  # seconds to wait for a free connection
+    database_pool_recycle: int = 1800  # seconds; recycle before server/LB idle timeouts
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode: the app then
+    # keeps no pool of its own (the pool_* settings are ignored) and disables asyncpg's
+    # prepared statement caches. Migrations still need a direct URL (MIGRATION_DATABASE_URL).
+    database_pgbouncer: bool = False
+    # Startup migrations: async runs Alembic in the background, sync blocks startup,
+    # skip leaves the schema alone and falls back to create_all
+    migration_mode: Literal['async', 'sync', 'skip'] = 'skip'
+    migration_lock_timeout: int = 300  # seconds to wait for another replica's migration
 
     # MongoDB
     mongodb_url: str = Field(..., description='MongoDB connection URL')
     mongodb_database: str = 'lowcode_platform'
+    # One process-wide client; each GridFS download holds a pooled socket while streaming
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 4  # kept warm so bursts don't pay connection setup
+    mongodb_server_selection_timeout_ms: int = 3000  # fail fast instead of pymongo's 30s
+    # GridFS chunkSize for new files (the 255KB default means ~4000 fs.chunks documents per
+    # GB). Each chunk is one BSON document, so it must stay well below the 16MB limit.
+    gridfs_chunk_size: int = 1024 * 1024
+    # Bytes read from GridFS per download step, rounded down to a multiple of the file's
+    # chunkSize. Two reads are in flight per download (see file API prefetch), so memory per
+    # concurrent download is about twice this value.
+    gridfs_download_chunk_size: int = 8 * 1024 * 1024
 
     # Redis
     redis_url: str = Field(..., description='Redis connection URL')
     redis_db: int = 0
     redis_max_connections: int = 10
 
+    # Cache-aside for GET-by-id endpoints
+    cache_ttl: int = 300  # seconds in Redis
+    cache_local_ttl: int = 60  # seconds in the per-process L1; not invalidated across workers
+    cache_local_maxsize: int = 1024
+
+    # BPM task events: background worker that advances process instances
+    bpm_event_poll_interval: float = 1.0  # seconds to sleep when the queue is drained
+    bpm_event_batch_size: int = 50
+    bpm_event_max_attempts: int = 5
+
+    # Audit logs: buffered in memory and inserted in batches by a background writer
+    audit_log_batch_size: int = 500
+    audit_log_flush_interval: float = 1.0  # max seconds an entry waits before being written
+    audit_log_queue_size: int = 10000  # entries beyond this are dropped with a warning
+    audit_log_flush_attempts: int = 8  # failed batch inserts are retried with backoff
+    audit_log_partition_months_ahead: int = 3  # monthly audit_logs partitions created ahead
+
     # Celery
     celery_broker_url: Optional[str] = None
     celery_result_backend: Optional[str] = None
@@ -87,5 +128,19 @@ class Settings(BaseSettings):
         return v or ''
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, reading .env and the environment only once.
+
+    Use ``Depends(get_settings)`` in endpoints that need settings so tests can
+    override them with ``app.dependency_overrides[get_settings]``.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance (module-level access for non-request code)
+settings = get_settings()
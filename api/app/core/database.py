@@ -1,18 +1,56 @@
 """PostgreSQL database connection and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from uuid import uuid4
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 from app.core.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (int dict keys allowed, as with json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _engine_options() -> dict[str, Any]:
+    """Pool and driver options for the async engine."""
+    if settings.database_pgbouncer:
+        # PgBouncer (transaction pooling) multiplexes connections itself, so the app keeps no
+        # pool of its own. A server connection may change between transactions, so asyncpg
+        # must not cache prepared statements or reuse their names.
+        return {
+            'poolclass': NullPool,
+            'connect_args': {
+                'statement_cache_size': 0,
+                'prepared_statement_cache_size': 0,
+                'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            },
+        }
+
+    return {
+        'pool_size': settings.database_pool_size,
+        'max_overflow': settings.database_max_overflow,
+        'pool_timeout': settings.database_pool_timeout,
+        'pool_pre_ping': True,
+        'pool_recycle': settings.database_pool_recycle,
+        # Hand out the most recently returned connection: a small hot set stays warm and the
+        # rest idle out, instead of round-robining every connection in the pool
+        'pool_use_lifo': True,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,
+    # JSON/JSONB columns are encoded and decoded with orjson instead of the stdlib json module
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options(),
 )
 
 # Create async session factory
@@ -24,6 +62,17 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only session factory for GET endpoints. Shares the pool with the main engine; asyncpg
+# opens the transaction as BEGIN READ ONLY (no extra round trip) and the connection is reset
+# when it goes back to the pool.
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -33,10 +82,20 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         AsyncSession: Database session
     """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a session whose transactions are READ ONLY.
+
+    Use for GET endpoints only; any write raises an error from PostgreSQL.
+
+    Yields:
+        AsyncSession: Read-only database session
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
 
 
 async def init_db() -> None:
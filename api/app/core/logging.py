@@ -1,14 +1,26 @@
-"""Structured logging configuration using structlog."""
+"""Structured logging configuration using structlog.
+
+Log calls on the request path only run the cheap structlog processors (context,
+level, timestamp) and enqueue the record. Rendering — exception formatting, JSON
+or console output — and the write to stdout happen on a background
+``QueueListener`` thread, so a burst of errors (e.g. a storage outage) does not
+block the event loop.
+"""
 
 import logging
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Optional
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
 from app.core.config import settings
 
+_listener: Optional[QueueListener] = None
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add application context to log entries."""
@@ -17,48 +29,98 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
+def capture_exc_info(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Resolve ``exc_info=True`` in the caller; the listener thread has no active exception."""
+    if event_dict.get('exc_info') is True:
+        event_dict['exc_info'] = sys.exc_info()
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """JSONRenderer serializer: orjson with structlog's fallback for unknown types."""
+    return orjson.dumps(obj, default=default).decode()
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The default ``prepare`` formats the record before enqueueing it, which is
+    exactly the work we want off the event loop. The queue never leaves the
+    process, so the record is passed through as-is and formatted by the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def configure_logging() -> None:
     """Configure structured logging with structlog."""
+    global _listener
+
+    # Cheap processors, run synchronously by the caller
+    shared_processors: list[Processor] = [
+        structlog.contextvars.merge_contextvars,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt='iso'),
+        add_app_context,
+        capture_exc_info,
+    ]
 
-    # Determine processors based on format
+    # Determine renderer based on format
     if settings.log_format == 'json':
-        processors: list[Processor] = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt='iso'),
-            add_app_context,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+        renderers: list[Processor] = [
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
     else:
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt='iso'),
-            add_app_context,
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.dev.ConsoleRenderer(),
-        ]
+        renderers = [structlog.dev.ConsoleRenderer()]
 
     structlog.configure(
-        processors=processors,
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format='%(message)s',
-        stream=sys.stdout,
-        level=getattr(logging, settings.log_level.upper()),
+    # Rendering processors, run on the listener thread
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            *renderers,
+        ],
     )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue: SimpleQueue = SimpleQueue()
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    # Configure standard library logging
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_LocalQueueHandler(log_queue)]
+    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
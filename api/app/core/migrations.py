@@ -0,0 +1,86 @@
+"""Alembic migration runner used at application startup."""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from alembic import command
+from alembic.config import Config
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# api/alembic.ini
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / 'alembic.ini'
+
+# Shared migration state, read by the health endpoint and the write-endpoint guard.
+# state: pending | running | succeeded | failed | skipped
+MIGRATION_STATUS: Dict[str, Any] = {'state': 'pending', 'error': None}
+
+
+def _alembic_config() -> Config:
+    """Build the Alembic config without letting env.py reconfigure app logging."""
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.attributes['configure_logger'] = False
+    config.attributes['lock_timeout'] = settings.migration_lock_timeout
+    return config
+
+
+def run_migrations() -> None:
+    """Upgrade the database schema to head (blocking).
+
+    Updates MIGRATION_STATUS as it goes; exceptions are recorded and re-raised.
+    """
+    MIGRATION_STATUS.update(state='running', error=None)
+    logger.info('Running database migrations')
+    try:
+        command.upgrade(_alembic_config(), 'head')
+    except Exception as e:
+        MIGRATION_STATUS.update(state='failed', error=str(e))
+        logger.error('Database migrations failed', error=str(e))
+        raise
+    MIGRATION_STATUS['state'] = 'succeeded'
+    logger.info('Database migrations finished')
+
+
+async def start_migrations() -> Optional[asyncio.Task]:
+    """Run migrations according to ``settings.migration_mode``.
+
+    - ``sync``: block until the upgrade finishes.
+    - ``async``: run the upgrade in a worker thread and return the task so the
+      application can start serving immediately.
+    - ``skip``: do nothing.
+
+    Returns:
+        The background task in ``async`` mode, otherwise None
+    """
+    mode = settings.migration_mode
+    if mode == 'skip':
+        MIGRATION_STATUS['state'] = 'skipped'
+        return None
+
+    if mode == 'sync':
+        await asyncio.to_thread(run_migrations)
+        return None
+
+    task = asyncio.create_task(asyncio.to_thread(run_migrations))
+    # The failure is already logged and stored in MIGRATION_STATUS; retrieve it so
+    # asyncio does not warn about an unretrieved task exception.
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+async def require_migrations_done() -> None:
+    """Dependency that rejects requests until the schema is up to date.
+
+    Raises:
+        HTTPException: 503 while migrations are pending, running or failed
+    """
+    if MIGRATION_STATUS['state'] not in ('succeeded', 'skipped'):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail='Database migrations in progress',
+        )
@@ -20,7 +20,12 @@ class MongoDBClient:
     async def connect(self) -> None:
         """Connect to MongoDB."""
         try:
-            self.client = AsyncIOMotorClient(settings.mongodb_url)
+            self.client = AsyncIOMotorClient(
+                settings.mongodb_url,
+                maxPoolSize=settings.mongodb_max_pool_size,
+                minPoolSize=settings.mongodb_min_pool_size,
+                serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            )
             self.database = self.client[settings.mongodb_database]
             self.gridfs_bucket = AsyncIOMotorGridFSBucket(self.database)
 
@@ -1,8 +1,8 @@
 """Redis connection and cache management."""
 
-import json
-from typing import Any, Optional
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
+import orjson
 from redis.asyncio import ConnectionPool, Redis
 from redis.exceptions import RedisError
 
@@ -18,13 +18,19 @@ class RedisClient:
         self.redis: Optional[Redis] = None
 
     async def connect(self) -> None:
-        """Connect to Redis."""
+        """Connect to Redis.
+
+        redis-py picks the hiredis C parser automatically when the ``hiredis``
+        package is installed (``redis[hiredis]``); no parser_class is needed.
+        """
         try:
             self.pool = ConnectionPool.from_url(
                 settings.redis_url,
                 db=settings.redis_db,
                 max_connections=settings.redis_max_connections,
-                decode_responses=True,
+                # Replies stay bytes: JSON payloads go straight to orjson / pydantic, and only
+                # the string API (get) decodes
+                decode_responses=False,
             )
             self.redis = Redis(connection_pool=self.pool)
 
@@ -52,11 +58,41 @@ class RedisClient:
         Returns:
             Cached value or None
         """
+        value = await self.get_bytes(key)
+        return value.decode() if value is not None else None
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get the raw value from cache, without decoding it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None
+        """
         if not self.redis:
             raise RuntimeError('Redis not connected')
         return await self.redis.get(key)
 
-    async def set(self, key: str, value: str, expire: Optional[int] = None) -> bool:
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """
+        Get several values in a single MGET.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Decoded values in key order, None for missing keys
+        """
+        if not self.redis:
+            raise RuntimeError('Redis not connected')
+        if not keys:
+            return []
+        values = await self.redis.mget(keys)
+        return [value.decode() if value is not None else None for value in values]
+
+    async def set(self, key: str, value: Union[str, bytes], expire: Optional[int] = None) -> bool:
         """
         Set value in cache.
 
@@ -72,19 +108,35 @@ class RedisClient:
             raise RuntimeError('Redis not connected')
         return await self.redis.set(key, value, ex=expire)
 
-    async def delete(self, key: str) -> int:
+    async def set_many(self, items: Sequence[Tuple[str, str, Optional[int]]]) -> None:
         """
-        Delete key from cache.
+        Set several values in one round-trip using a non-transactional pipeline.
 
         Args:
-            key: Cache key
+            items: (key, value, expire) tuples; expire is in seconds or None
+        """
+        if not self.redis:
+            raise RuntimeError('Redis not connected')
+        if not items:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value, expire in items:
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> int:
+        """
+        Delete keys from cache in a single command.
+
+        Args:
+            keys: Cache keys
 
         Returns:
             Number of keys deleted
         """
         if not self.redis:
             raise RuntimeError('Redis not connected')
-        return await self.redis.delete(key)
+        return await self.redis.delete(*keys)
 
     async def exists(self, key: str) -> bool:
         """
@@ -110,9 +162,9 @@ class RedisClient:
         Returns:
             Deserialized JSON value or None
         """
-        value = await self.get(key)
+        value = await self.get_bytes(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
     async def set_json(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
@@ -127,8 +179,10 @@ class RedisClient:
         Returns:
             True if successful
         """
-        json_value = json.dumps(value)
-        return await self.set(key, json_value, expire)
+        if not self.redis:
+            raise RuntimeError('Redis not connected')
+        # orjson returns bytes, which redis-py sends as-is without another str -> bytes encode
+        return await self.redis.set(key, orjson.dumps(value), ex=expire)
 
 
 # Global Redis client instance
@@ -35,11 +35,15 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    async def download(self, file_id: str) -> AsyncGenerator[bytes, None]:
+    async def download(
+        self, file_id: str, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
         """从存储系统下载文件
 
         Args:
             file_id: 存储系统的文件 ID
+            start: 起始字节偏移（含）
+            end: 结束字节偏移（含），None 表示读到文件末尾
 
         Yields:
             bytes: 文件内容的二进制流（分块传输）
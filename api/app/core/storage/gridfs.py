@@ -14,11 +14,12 @@ GridFS 自动将大文件分块存储，支持流式读写。
 """
 
 from typing import AsyncGenerator, Any, Optional
-from datetime import datetime
 from bson import ObjectId
+from gridfs.errors import NoFile
 from fastapi import UploadFile
-from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorGridFSBucket
 
+from app.core.config import settings
 from app.core.mongodb import mongodb_client
 from app.core.storage.base import StorageBackend
 from app.core.storage.exceptions import (
@@ -29,19 +30,29 @@ from app.core.storage.exceptions import (
     StorageConnectionError,
 )
 from app.core.logging import get_logger
+from app.utils.time import utcnow
 
 logger = get_logger(__name__)
 
+# get_metadata 需要的 files 文档字段（_id 默认返回）
+METADATA_PROJECTION = {'filename': 1, 'length': 1, 'chunkSize': 1, 'uploadDate': 1, 'metadata': 1}
+
+
 
 class GridFSBackend(StorageBackend):
     """MongoDB GridFS 存储后端
     特点：
-    - 自动分块存储（默认 255KB/块）
+    - 自动分块存储（块大小由 settings.gridfs_chunk_size 决定，默认 1MB/块）
     - 支持大文件（无大小限制）
     - 支持流式上传/下载
     - 自动处理文件元数据
+
+    bucket 实例按 (MongoDB 客户端, 数据库, bucket 名称) 在类级别缓存，
+    每个请求新建的后端实例共享同一个 bucket。
     """
 
+    _bucket_cache: dict[tuple[int, str, str], AsyncIOMotorGridFSBucket] = {}
+
     def __init__(self, bucket_name: str = 'fs'):
         """初始化 GridFS 存储后端
 
@@ -49,7 +60,6 @@ class GridFSBackend(StorageBackend):
             bucket_name: GridFS bucket 名称（默认 "fs"）
         """
         self.bucket_name = bucket_name
-        self._bucket: Optional[AsyncIOMotorGridFSBucket] = None
 
     @property
     def bucket(self) -> AsyncIOMotorGridFSBucket:
@@ -61,16 +71,36 @@ class GridFSBackend(StorageBackend):
         Raises:
             StorageConnectionError: MongoDB 未连接
         """
-        if self._bucket is None:
-            if mongodb_client.client is None:
-                raise StorageConnectionError(
-                    backend='GridFS', reason='MongoDB client is not connected'
-                )
+        if mongodb_client.database is None:
+            raise StorageConnectionError(backend='GridFS', reason='MongoDB client is not connected')
+
+        key = (id(mongodb_client.client), settings.mongodb_database, self.bucket_name)
+        bucket = self._bucket_cache.get(key)
+        if bucket is None:
+            bucket = AsyncIOMotorGridFSBucket(
+                mongodb_client.database,
+                bucket_name=self.bucket_name,
+                chunk_size_bytes=settings.gridfs_chunk_size,
+            )
+            self._bucket_cache[key] = bucket
 
-            db = mongodb_client.client[mongodb_client.db_name]
-            self._bucket = AsyncIOMotorGridFSBucket(db, bucket_name=self.bucket_name)
+        return bucket
 
-        return self._bucket
+    @property
+    def files_collection(self) -> AsyncIOMotorCollection:
+        """获取 bucket 的 files 集合（直接查询文件元数据用）
+
+        Raises:
+            StorageConnectionError: MongoDB 未连接
+        """
+        if mongodb_client.database is None:
+            raise StorageConnectionError(backend='GridFS', reason='MongoDB client is not connected')
+        return mongodb_client.database[f'{self.bucket_name}.files']
+
+    @classmethod
+    def clear_bucket_cache(cls) -> None:
+        """清空 bucket 缓存（MongoDB 连接关闭后调用）"""
+        cls._bucket_cache.clear()
 
     async def upload(self, file: UploadFile, metadata: Optional[dict[str, Any]] = None) -> str:
         """上传文件到 GridFS
@@ -87,20 +117,34 @@ class GridFSBackend(StorageBackend):
             file_metadata = {
                 'filename': file.filename,
                 'content_type': file.content_type,
-                'upload_date': datetime.utcnow(),
+                'upload_date': utcnow(),
                 **(metadata or {}),
             }
 
-            # 流式上传到 GridFS
-            file_id = await self.bucket.upload_from_stream(
-                filename=file.filename or 'unknown', source=file.file, metadata=file_metadata
+            # 每次读取一个 GridFS 块大小的数据并写入，每次 write 正好落成一个 fs.chunks 文档；
+            # 内存占用与文件大小无关
+            chunk_size = settings.gridfs_chunk_size
+            grid_in = self.bucket.open_upload_stream(
+                file.filename or 'unknown', chunk_size_bytes=chunk_size, metadata=file_metadata
             )
+            size = 0
+            try:
+                while chunk := await file.read(chunk_size):
+                    await grid_in.write(chunk)
+                    size += len(chunk)
+                await grid_in.close()
+            except BaseException:
+                # 清理已写入的分块
+                await grid_in.abort()
+                raise
+
+            file_id = grid_in._id
 
             logger.info(
                 'File uploaded to GridFS',
                 file_id=str(file_id),
                 filename=file.filename,
-                size=file.size,
+                size=size,
             )
 
             return str(file_id)
@@ -109,11 +153,15 @@ class GridFSBackend(StorageBackend):
             logger.error('Failed to upload file to GridFS', filename=file.filename, error=str(e))
             raise FileUploadError(filename=file.filename or 'unknown', reason=str(e)) from e
 
-    async def download(self, file_id: str) -> AsyncGenerator[bytes, None]:
+    async def download(
+        self, file_id: str, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
         """从 GridFS 下载文件（流式）
 
         Args:
             file_id: GridFS file_id
+            start: 起始字节偏移（含）
+            end: 结束字节偏移（含），None 表示读到文件末尾
 
         Yields:
             bytes: 文件内容分块
@@ -123,15 +171,27 @@ class GridFSBackend(StorageBackend):
             if not ObjectId.is_valid(file_id):
                 raise FileNotFoundError(file_id)
 
-            # 打开 GridFS 文件流
-            grid_out = await self.bucket.open_download_stream(ObjectId(file_id))
-
-            # 分块读取（每次 1MB）
-            chunk_size = 1024 * 1024
-            while True:
-                chunk: bytes = await grid_out.read(chunk_size)
+            # 打开 GridFS 文件流（元数据仍在但内容已丢失时抛出 NoFile）
+            try:
+                grid_out = await self.bucket.open_download_stream(ObjectId(file_id))
+            except NoFile:
+                raise FileNotFoundError(file_id)
+            if start:
+                grid_out.seek(start)
+            remaining = None if end is None else end - start + 1
+
+            # 每次读取若干个完整的 GridFS 块（默认约 8MB），减少与 MongoDB 的往返次数；
+            # 预读下一块由调用方（下载接口的 _prefetch）负责
+            chunk_size = max(
+                settings.gridfs_download_chunk_size // grid_out.chunk_size, 1
+            ) * grid_out.chunk_size
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk: bytes = await grid_out.read(size)
                 if not chunk:
                     break
+                if remaining is not None:
+                    remaining -= len(chunk)
                 yield chunk
 
             logger.info('File downloaded from GridFS', file_id=file_id)
@@ -156,16 +216,14 @@ class GridFSBackend(StorageBackend):
             if not ObjectId.is_valid(file_id):
                 return False
 
-            # 检查文件是否存在
-            if not await self.exists(file_id):
-                return False
-
-            # 删除文件
+            # 直接删除，文件不存在时 GridFS 抛出 NoFile，无需先查询一次
             await self.bucket.delete(ObjectId(file_id))
 
             logger.info('File deleted from GridFS', file_id=file_id)
             return True
 
+        except NoFile:
+            return False
         except Exception as e:
             logger.error('Failed to delete file from GridFS', file_id=file_id, error=str(e))
             raise FileDeletionError(file_id=file_id, reason=str(e)) from e
@@ -183,9 +241,11 @@ class GridFSBackend(StorageBackend):
             if not ObjectId.is_valid(file_id):
                 return False
 
-            # 尝试查找文件
-            file_doc = await self.bucket.find({'_id': ObjectId(file_id)}).to_list(length=1)
-            return len(file_doc) > 0
+            # 只取 _id，不创建游标、不传输元数据
+            file_doc = await self.files_collection.find_one(
+                {'_id': ObjectId(file_id)}, projection={'_id': 1}
+            )
+            return file_doc is not None
 
         except Exception as e:
             logger.error('Failed to check file existence in GridFS', file_id=file_id, error=str(e))
@@ -204,14 +264,13 @@ class GridFSBackend(StorageBackend):
             if not ObjectId.is_valid(file_id):
                 raise FileNotFoundError(file_id)
 
-            # 查找文件
-            files = await self.bucket.find({'_id': ObjectId(file_id)}).to_list(length=1)
+            file_doc = await self.files_collection.find_one(
+                {'_id': ObjectId(file_id)}, projection=METADATA_PROJECTION
+            )
 
-            if not files:
+            if file_doc is None:
                 raise FileNotFoundError(file_id)
 
-            file_doc = files[0]
-
             return {
                 'file_id': str(file_doc['_id']),
                 'filename': file_doc.get('filename'),
@@ -9,7 +9,7 @@ Description: BPM 执行引擎
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from app.engine.bpm.executor import ProcessExecutor
+from app.engine.bpm.executor import ProcessExecutor, TaskNotActiveError, TaskNotFoundError
 from app.engine.bpm.task_dispatcher import TaskDispatcher
 
-__all__ = ['ProcessExecutor', 'TaskDispatcher']
+__all__ = ['ProcessExecutor', 'TaskDispatcher', 'TaskNotActiveError', 'TaskNotFoundError']
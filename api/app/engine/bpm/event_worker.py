@@ -0,0 +1,114 @@
+"""任务事件消费者
+
+在应用进程内后台轮询 bpm_task_events，按事件推进流程实例。多个副本可同时运行：
+事件通过 FOR UPDATE SKIP LOCKED 领取，不会被重复处理；同一流程实例的推进由
+continue_process 对实例行加锁串行化。
+"""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from app.core.cache import PROCESS_INSTANCE_KEY, invalidate
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.core.migrations import MIGRATION_STATUS
+from app.engine.bpm.executor import ProcessExecutor
+from app.models.bpm import TaskEvent, TaskEventStatus
+
+logger = get_logger(__name__)
+
+
+class TaskEventWorker:
+    """任务事件消费者 - 由 lifespan 启动和停止"""
+
+    def __init__(
+        self,
+        poll_interval: float = settings.bpm_event_poll_interval,
+        batch_size: int = settings.bpm_event_batch_size,
+        max_attempts: int = settings.bpm_event_max_attempts,
+    ):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """启动后台轮询"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台轮询，当前批次未提交的事件会在下次启动时重新领取"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """轮询循环：队列未清空时连续处理，否则休眠 poll_interval"""
+        while True:
+            processed = 0
+            # 迁移完成前表可能还不存在
+            if MIGRATION_STATUS['state'] in ('succeeded', 'skipped'):
+                try:
+                    processed = await self.process_batch()
+                except Exception as e:
+                    logger.error('Failed to process task events', error=str(e))
+            if processed < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def process_batch(self) -> int:
+        """领取并处理一批待处理事件
+
+        每个事件在独立的 savepoint 中推进流程，单个失败不影响同批其他事件；
+        失败次数达到 max_attempts 后标记为 failed。
+
+        Returns:
+            本批领取的事件数
+        """
+        advanced = set()
+        async with AsyncSessionLocal() as session, session.begin():
+            statement = (
+                select(TaskEvent)
+                .where(TaskEvent.status == TaskEventStatus.PENDING)
+                .order_by(TaskEvent.created_at)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = (await session.execute(statement)).scalars().all()
+            executor = ProcessExecutor(session)
+
+            # 按实例排序（同一实例内保持创建顺序），各副本以相同顺序锁实例行，避免互相死锁
+            for event in sorted(events, key=lambda e: e.process_instance_id):
+                try:
+                    async with session.begin_nested():
+                        await executor.continue_process(event.process_instance_id, event.payload)
+                except Exception as e:
+                    event.attempts += 1
+                    event.error = str(e)
+                    if event.attempts >= self.max_attempts:
+                        event.status = TaskEventStatus.FAILED
+                    logger.warning(
+                        'Task event failed',
+                        event_id=str(event.id),
+                        task_id=str(event.task_id),
+                        attempts=event.attempts,
+                        error=str(e),
+                    )
+                    continue
+
+                event.status = TaskEventStatus.PROCESSED
+                event.processed_at = func.now()
+                advanced.add(event.process_instance_id)
+
+        if advanced:
+            await invalidate(*(PROCESS_INSTANCE_KEY.format(i) for i in advanced))
+        return len(events)
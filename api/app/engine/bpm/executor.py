@@ -9,19 +9,73 @@ Description: 流程执行器
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from datetime import datetime
-from typing import Optional
+from typing import List, NamedTuple, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from cachetools import TTLCache
+from sqlalchemy import exists, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
-from app.models.bpm import ProcessDefinition, ProcessInstance, ProcessStatus, Task, TaskStatus
+from app.models.bpm import (
+    ProcessDefinition,
+    ProcessInstance,
+    ProcessStatus,
+    Task,
+    TaskEvent,
+    TaskEventKind,
+    TaskStatus,
+)
+from app.utils.time import utcnow
+
+
+class _NodeIndex(NamedTuple):
+    """流程定义节点索引，加载定义时构建一次，避免每次推进都线性扫描节点列表"""
+
+    start: Optional[dict]
+    user_tasks: List[dict]
+    by_id: dict[str, dict]
+
+
+def _build_index(nodes: list) -> _NodeIndex:
+    """按节点类型和 ID 建立索引（保持节点在定义中的顺序）"""
+    return _NodeIndex(
+        start=next((n for n in nodes if n.get('type') == 'start'), None),
+        user_tasks=[n for n in nodes if n.get('type') == 'user_task'],
+        by_id={n['id']: n for n in nodes if 'id' in n},
+    )
+
+
+class _DefinitionSnapshot(NamedTuple):
+    """启动流程所需的流程定义字段（最新且启用的版本）"""
+
+    id: UUID
+    version: int
+    nodes: list
+    index: _NodeIndex
+
+
+# 尚未结束、仍可完成的任务状态
+_ACTIVE_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.IN_PROGRESS)
+
+
+class TaskNotFoundError(ValueError):
+    """任务不存在"""
+
+
+class TaskNotActiveError(ValueError):
+    """任务已结束（已完成、已拒绝或已取消），不能再次完成"""
+
+
+# process_key -> 最新启用版本的流程定义（进程内缓存）。TTL 是唯一的过期方式：
+# 定义在发布、停用后最多 60 秒内各进程才会读到新版本
+_definition_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
 
 
 class ProcessExecutor:
     """流程执行引擎"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def start_process(
@@ -31,22 +85,16 @@ class ProcessExecutor:
         started_by: UUID,
         variables: dict,
         business_key: Optional[str] = None,
+        business_type: Optional[str] = None,
     ) -> ProcessInstance:
         """
         description: 启动流程实例
+
+        实例、首个任务和实例状态在同一个事务中写入，只提交一次。
         :param {UUID} task_id
         :param {UUID} assignee_id
         """
-        # 获取流程定义
-        statement = select(ProcessDefinition).where(
-            ProcessDefinition.key == process_key,
-            ProcessDefinition.is_latest,
-            ProcessDefinition.is_active,
-        )
-        process_def = self.session.exec(statement).first()
-
-        if not process_def:
-            raise ValueError(f'Process definition not found: {process_key}')
+        process_def = await self._get_definition(process_key)
 
         # 创建流程实例
         instance = ProcessInstance(
@@ -54,33 +102,58 @@ class ProcessExecutor:
             process_key=process_key,
             process_version=process_def.version,
             business_key=business_key,
+            business_type=business_type,
             workspace_id=workspace_id,
             started_by=started_by,
             variables=variables,
             status=ProcessStatus.RUNNING,
-            started_at=datetime.utcnow(),
+            started_at=utcnow(),
         )
 
+        # flush 先插入实例（任务引用其 ID），服务端时间戳随 RETURNING 取回，无需 refresh
         self.session.add(instance)
-        self.session.commit()
-        self.session.refresh(instance)
+        await self.session.flush()
 
         # 执行第一个节点
         await self._execute_next_node(instance, process_def)
+        await self.session.commit()
 
         return instance
 
-    async def _execute_next_node(self, instance: ProcessInstance, process_def: ProcessDefinition):
-        """执行下一个节点"""
-        nodes = process_def.nodes
+    async def _get_definition(self, process_key: str) -> _DefinitionSnapshot:
+        """获取最新启用的流程定义，优先读取进程内缓存"""
+        snapshot = _definition_cache.get(process_key)
+        if snapshot is not None:
+            return snapshot
 
-        # 找到开始节点
-        start_node = next((n for n in nodes if n.get('type') == 'start'), None)
-        if not start_node:
+        statement = select(
+            ProcessDefinition.id, ProcessDefinition.version, ProcessDefinition.nodes
+        ).where(
+            ProcessDefinition.key == process_key,
+            ProcessDefinition.is_latest,
+            ProcessDefinition.is_active,
+        )
+        row = (await self.session.execute(statement)).first()
+
+        if not row:
+            raise ValueError(f'Process definition not found: {process_key}')
+
+        snapshot = _DefinitionSnapshot(row.id, row.version, row.nodes, _build_index(row.nodes))
+        _definition_cache[process_key] = snapshot
+        return snapshot
+
+    async def _execute_next_node(
+        self, instance: ProcessInstance, process_def: _DefinitionSnapshot
+    ):
+        """执行下一个节点（不提交，由调用方负责事务边界）"""
+        index = process_def.index
+
+        # 开始节点
+        if not index.start:
             raise ValueError('Start node not found')
 
-        # 找到第一个用户任务
-        first_task_node = next((n for n in nodes if n.get('type') == 'user_task'), None)
+        # 第一个用户任务
+        first_task_node = index.user_tasks[0] if index.user_tasks else None
 
         if first_task_node:
             # 创建任务
@@ -90,10 +163,9 @@ class ProcessExecutor:
         else:
             # 没有任务，直接完成
             instance.status = ProcessStatus.COMPLETED
-            instance.completed_at = datetime.utcnow()
+            instance.completed_at = utcnow()
 
         self.session.add(instance)
-        self.session.commit()
 
     async def _create_task(self, instance: ProcessInstance, node: dict):
         """创建任务"""
@@ -107,47 +179,108 @@ class ProcessExecutor:
         )
 
         self.session.add(task)
-        self.session.commit()
         return task
 
     async def complete_task(
         self, task_id: UUID, user_id: UUID, result: dict, comment: Optional[str] = None
     ):
-        """完成任务"""
-        task = self.session.get(Task, task_id)
+        """完成任务
+
+        一条 UPDATE ... RETURNING 更新任务，并写入一条 completed 事件；流程推进由
+        TaskEventWorker 异步完成，接口不再等待。与 complete_tasks 相同只更新未结束的任务，
+        重复完成不会覆盖结果，也不会再写一条事件。
+        只 flush 不提交，调用方负责事务边界（例如与审批记录在同一事务中提交）。
+        返回已完成的任务。
+
+        Raises:
+            TaskNotFoundError: 任务不存在
+            TaskNotActiveError: 任务已结束
+        """
+        statement = (
+            update(Task)
+            .where(Task.id == task_id)
+            .where(Task.status.in_(_ACTIVE_TASK_STATUSES))
+            .values(
+                status=TaskStatus.COMPLETED,
+                completed_at=utcnow(),
+                result=result,
+                comment=comment,
+            )
+            .returning(Task)
+        )
+        task = (await self.session.execute(statement)).scalar_one_or_none()
         if not task:
-            raise ValueError('Task not found')
+            # 仅在失败时再查一次，区分任务不存在和任务已结束
+            if await self.session.get(Task, task_id) is None:
+                raise TaskNotFoundError('Task not found')
+            raise TaskNotActiveError('Task is not active')
 
-        # 更新任务状态
-        task.status = TaskStatus.COMPLETED
-        task.completed_at = datetime.utcnow()
-        task.result = result
-        task.comment = comment
+        self.session.add(self._completed_event(task, result))
+        await self.session.flush()
+        return task
 
-        self.session.add(task)
-        self.session.commit()
+    async def complete_tasks(
+        self, task_ids: List[UUID], user_id: UUID, result: dict, comment: Optional[str] = None
+    ) -> List[Task]:
+        """批量完成任务
 
-        # 继续流程
-        await self._continue_process(task.process_instance_id, result)
+        一条 UPDATE 完成所有未结束的任务，并为每个任务写入 completed 事件。
+        与 complete_task 相同，只 flush 不提交，由调用方负责事务边界。
+        返回实际完成的任务。
+        """
+        statement = (
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .where(Task.status.in_(_ACTIVE_TASK_STATUSES))
+            .values(
+                status=TaskStatus.COMPLETED,
+                completed_at=utcnow(),
+                result=result,
+                comment=comment,
+            )
+            .returning(Task)
+        )
+        completed = list((await self.session.execute(statement)).scalars().all())
 
-    async def _continue_process(self, instance_id: UUID, task_result: dict):
-        """继续执行流程"""
-        instance = self.session.get(ProcessInstance, instance_id)
-        if not instance:
+        self.session.add_all([self._completed_event(task, result) for task in completed])
+        await self.session.flush()
+        return completed
+
+    @staticmethod
+    def _completed_event(task: Task, result: dict) -> TaskEvent:
+        """构造任务完成事件"""
+        return TaskEvent(
+            task_id=task.id,
+            process_instance_id=task.process_instance_id,
+            kind=TaskEventKind.COMPLETED,
+            payload=result,
+        )
+
+    async def continue_process(self, instance_id: UUID, task_result: dict):
+        """继续执行流程（由 TaskEventWorker 在处理 completed 事件时调用）
+
+        先对实例行加 FOR UPDATE 锁：多个副本或同一实例的多个事件会在此串行执行，
+        后到者能看到前者提交的状态，流程不会被重复完成。
+        """
+        instance = await self.session.get(ProcessInstance, instance_id, with_for_update=True)
+        if not instance or instance.status == ProcessStatus.COMPLETED:
             return
 
-        # 检查是否所有任务完成
-        statement = select(Task).where(
-            Task.process_instance_id == instance_id,
-            Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
+        # 检查是否所有任务完成：只需判断是否存在未完成任务，用 EXISTS 而不加载 Task 行
+        has_pending = await self.session.scalar(
+            exists()
+            .where(
+                Task.process_instance_id == instance_id,
+                Task.status.in_(_ACTIVE_TASK_STATUSES),
+            )
+            .select()
         )
-        pending_tasks = self.session.exec(statement).all()
 
-        if not pending_tasks:
+        if not has_pending:
             # 所有任务完成，流程结束
             instance.status = ProcessStatus.COMPLETED
-            instance.completed_at = datetime.utcnow()
+            instance.completed_at = utcnow()
             instance.result = task_result
 
             self.session.add(instance)
-            self.session.commit()
+            await self.session.flush()
@@ -9,19 +9,21 @@ Description: 任务分发器
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
 from app.models.bpm import Task, TaskStatus
+from app.utils.time import utcnow
 
 
 class TaskDispatcher:
     """任务分发器 - 负责任务分配和通知"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def assign_task(self, task_id: UUID, assignee_id: UUID) -> None:
@@ -31,15 +33,17 @@ class TaskDispatcher:
         :param {UUID} assignee_id: 任务处理人的id
         return {*}
         """
-        task = self.session.get(Task, task_id)
+        statement = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(assignee=assignee_id, status=TaskStatus.ASSIGNED)
+            .returning(Task)
+        )
+        task = (await self.session.execute(statement)).scalar_one_or_none()
         if not task:
             raise ValueError('Task not found')
 
-        task.assignee = assignee_id
-        task.status = TaskStatus.ASSIGNED
-
-        self.session.add(task)
-        self.session.commit()
+        await self.session.commit()
 
         # TODO: 发送通知
         await self._notify_assignee(task, assignee_id)
@@ -50,20 +54,46 @@ class TaskDispatcher:
 
         :param {UUID} task_id 任务ID
         :param {UUID} user_id 用户ID
+
+        一条条件 UPDATE 完成认领，两个用户并发认领时只有一个能成功
         """
-        task = self.session.get(Task, task_id)
-        if not task:
-            raise ValueError('Task not found')
+        statement = (
+            update(Task)
+            .where(Task.id == task_id)
+            .where(or_(Task.assignee.is_(None), Task.assignee == user_id))
+            .values(assignee=user_id, status=TaskStatus.IN_PROGRESS, claimed_at=utcnow())
+            .returning(Task.id)
+        )
+        claimed = (await self.session.execute(statement)).scalar_one_or_none()
 
-        if task.assignee and task.assignee != user_id:
+        if not claimed:
+            # 仅在失败时再查一次，区分任务不存在和已被他人认领
+            await self.session.rollback()
+            if not await self.session.get(Task, task_id):
+                raise ValueError('Task not found')
             raise ValueError('Task already assigned to another user')
 
-        task.assignee = user_id
-        task.status = TaskStatus.IN_PROGRESS
-        task.claimed_at = datetime.utcnow()
+        await self.session.commit()
 
-        self.session.add(task)
-        self.session.commit()
+    async def claim_tasks(self, task_ids: List[UUID], user_id: UUID) -> List[UUID]:
+        """
+        description: 批量认领任务，一条 UPDATE 完成
+        :param {List[UUID]} task_ids 任务ID列表
+        :param {UUID} user_id 用户ID
+        return {List[UUID]} 认领成功的任务ID（已结束或已分配给他人的任务会被跳过）
+        """
+        statement = (
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .where(Task.status.in_([TaskStatus.PENDING, TaskStatus.ASSIGNED]))
+            .where(or_(Task.assignee.is_(None), Task.assignee == user_id))
+            .values(assignee=user_id, status=TaskStatus.IN_PROGRESS, claimed_at=utcnow())
+            .returning(Task.id)
+        )
+        result = await self.session.execute(statement)
+        claimed = list(result.scalars().all())
+        await self.session.commit()
+        return claimed
 
     async def get_user_tasks(
         self, user_id: UUID, workspace_id: UUID, status: Optional[TaskStatus] = None
@@ -82,8 +112,8 @@ class TaskDispatcher:
         if status:
             statement = statement.where(Task.status == status)
 
-        tasks = self.session.exec(statement).all()
-        return list(tasks)
+        result = await self.session.execute(statement)
+        return list(result.scalars().all())
 
     async def _notify_assignee(self, task: Task, assignee_id: UUID):
         """通知任务处理人"""
@@ -1,20 +1,25 @@
 """FastAPI application initialization."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import router as api_v1_router
 from app.core.config import settings
 from app.core.database import close_db, init_db
-from app.core.logging import configure_logging, get_logger
+from app.core.logging import configure_logging, get_logger, shutdown_logging
+from app.core.migrations import start_migrations
 from app.core.mongodb import mongodb_client
 from app.core.redis import redis_client
 from app.core.sentry import init_sentry
+from app.core.storage.gridfs import GridFSBackend
+from app.engine.bpm.event_worker import TaskEventWorker
 from app.middleware.auth import AuthMiddleware
+from app.services.audit_log_writer import audit_log_writer
 
 # Configure logging
 configure_logging()
@@ -24,6 +29,48 @@ logger = get_logger(__name__)
 init_sentry()
 
 
+async def _init_database(app: FastAPI) -> None:
+    """Initialize the database schema or start migrations."""
+    if settings.migration_mode == 'skip':
+        await init_db()
+        logger.info('Database initialized')
+    # Also records the 'skipped' state that the migration guard and the task event
+    # worker wait for; in async mode the task keeps running while the app serves traffic
+    app.state.migration_task = await start_migrations()
+
+
+async def _connect_mongodb() -> None:
+    """Connect to MongoDB."""
+    await mongodb_client.connect()
+    logger.info('MongoDB connected')
+
+
+async def _connect_redis() -> None:
+    """Connect to Redis."""
+    await redis_client.connect()
+    logger.info('Redis connected')
+
+
+async def _run_concurrently(action: str, steps: dict[str, Awaitable[None]]) -> list[Exception]:
+    """
+    Await independent steps concurrently and log each failure.
+
+    Args:
+        action: What the steps do, used in the log message
+        steps: Step name -> awaitable
+
+    Returns:
+        The exceptions raised by failed steps
+    """
+    results = await asyncio.gather(*steps.values(), return_exceptions=True)
+    errors = []
+    for name, result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.error('Lifespan step failed', action=action, component=name, error=str(result))
+            errors.append(result)
+    return errors
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -35,17 +82,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info('Starting application', app_name=settings.app_name)
 
     try:
-        # Initialize database
-        await init_db()
-        logger.info('Database initialized')
-
-        # Connect to MongoDB
-        await mongodb_client.connect()
-        logger.info('MongoDB connected')
-
-        # Connect to Redis
-        await redis_client.connect()
-        logger.info('Redis connected')
+        # The stores are independent, so connect to all of them at once
+        errors = await _run_concurrently(
+            'initialize application',
+            {
+                'database': _init_database(app),
+                'mongodb': _connect_mongodb(),
+                'redis': _connect_redis(),
+            },
+        )
+        if errors:
+            raise errors[0]
+
+        # Advance BPM process instances from completed-task events in the background
+        app.state.task_event_worker = TaskEventWorker()
+        app.state.task_event_worker.start()
+
+        # Buffer audit logs and insert them in batches
+        audit_log_writer.start()
 
     except Exception as e:
         logger.error('Failed to initialize application', error=str(e))
@@ -57,12 +111,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info('Shutting down application')
 
     try:
-        await close_db()
-        await mongodb_client.close()
-        await redis_client.close()
-        logger.info('All connections closed')
+        if getattr(app.state, 'task_event_worker', None):
+            await app.state.task_event_worker.stop()
+        # Write out buffered audit logs before the database pool closes
+        await audit_log_writer.stop()
+        errors = await _run_concurrently(
+            'close connection',
+            {
+                'database': close_db(),
+                'mongodb': mongodb_client.close(),
+                'redis': redis_client.close(),
+            },
+        )
+        GridFSBackend.clear_bucket_cache()
+        if not errors:
+            logger.info('All connections closed')
     except Exception as e:
         logger.error('Error during shutdown', error=str(e))
+    finally:
+        shutdown_logging()
 
 
 # Create FastAPI application
@@ -73,6 +140,8 @@ app = FastAPI(
     docs_url='/docs',
     redoc_url='/redoc',
     openapi_url='/openapi.json',
+    # orjson serializes large list responses (files, workflows, tasks) several times faster
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -90,14 +159,14 @@ app.add_middleware(AuthMiddleware)
 
 
 @app.get('/health', tags=['Health'])
-async def health_check() -> JSONResponse:
+async def health_check() -> ORJSONResponse:
     """
     Health check endpoint.
 
     Returns:
         Health status
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             'status': 'healthy',
             'app': settings.app_name,
@@ -107,14 +176,14 @@ async def health_check() -> JSONResponse:
 
 
 @app.get('/', tags=['Root'])
-async def root() -> JSONResponse:
+async def root() -> ORJSONResponse:
     """
     Root endpoint.
 
     Returns:
         Welcome message
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             'message': 'Welcome to Low-Code Platform Backend API',
             'docs': '/docs',
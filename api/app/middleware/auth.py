@@ -1,84 +1,109 @@
 """Authentication middleware for FastAPI."""
 
-from typing import Callable, Optional
+from contextvars import ContextVar
+from typing import Optional
 
-from fastapi import HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.core.database import get_session
+from app.core.database import AsyncSessionLocal
 from app.core.redis import get_redis
 from app.models import User
 from app.services.auth_service import AuthService
 
 security = HTTPBearer()
 
+# 由路由级依赖 ensure_authenticated 写入，路由函数通过 current_user_ctx.get() 读取
+current_user_ctx: ContextVar[User] = ContextVar('current_user')
+
+
+# Paths that never require authentication
+PUBLIC_PATHS = frozenset(
+    {
+        '/docs',
+        '/redoc',
+        '/openapi.json',
+        '/health',
+        '/api/v1/healthz/migrations',
+        '/',
+        '/api/v1/auth/register',
+        '/api/v1/auth/login',
+        '/api/v1/auth/refresh',
+        '/api/v1/auth/reset-password',
+        '/api/v1/auth/confirm-reset-password',
+    }
+)
+# Swagger UI / ReDoc static assets
+PUBLIC_PREFIXES = ('/docs/', '/redoc/')
+
+
+class AuthMiddleware:
+    """Pure ASGI middleware for authentication.
+
+    Avoids BaseHTTPMiddleware's per-request task group and body streaming bridge.
+    """
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware for authentication."""
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process request and verify authentication.
+        Extract the bearer token; it is verified lazily by the auth dependencies.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware/handler
-
-        Returns:
-            Response from next handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip authentication for public endpoints
-        public_paths = [
-            '/docs',
-            '/redoc',
-            '/openapi.json',
-            '/health',
-            '/',
-            '/api/v1/auth/register',
-            '/api/v1/auth/login',
-            '/api/v1/auth/refresh',
-            '/api/v1/auth/reset-password',
-            '/api/v1/auth/confirm-reset-password',
-        ]
-
-        if request.url.path in public_paths:
-            return await call_next(request)
-
-        # Get authorization header
-        auth_header = request.headers.get('Authorization')
-
-        if not auth_header or not auth_header.startswith('Bearer '):
-            # Allow request to proceed - individual endpoints can enforce auth
-            return await call_next(request)
-
-        # Extract token
-        token = auth_header.replace('Bearer ', '')
-
-        # Verify token and attach user to request state
-        try:
-            # Get database session using async generator
-            session_gen = get_session()
-            db = await anext(session_gen)
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        path = scope['path']
+        if path in PUBLIC_PATHS or path.startswith(PUBLIC_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        # Only remember the token here; endpoints that need the user verify it
+        # through get_current_user, so endpoints without auth never touch DB/Redis.
+        # scope['state'] is what request.state reads from.
+        auth_header = next((v for k, v in scope['headers'] if k == b'authorization'), b'')
+        if auth_header.startswith(b'Bearer '):
+            token = auth_header[len(b'Bearer ') :].decode('latin-1')
+            scope.setdefault('state', {})['token'] = token
+
+        await self.app(scope, receive, send)
+
+
+async def _resolve_user(request: Request) -> Optional[User]:
+    """
+    Verify the request's bearer token once and memoize the user on request.state.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        Authenticated user or None
+    """
+    if hasattr(request.state, 'user'):
+        return request.state.user
 
-            try:
+    user = None
+    token = getattr(request.state, 'token', None)
+    if token:
+        try:
+            # The session context manager closes the session on exit
+            async with AsyncSessionLocal() as db:
                 redis = await get_redis()
-                auth_service = AuthService(db, redis)
-                user = await auth_service.verify_access_token(token)
-
-                if user:
-                    request.state.user = user
-                    request.state.token = token
-            finally:
-                # Close the session properly
-                await session_gen.aclose()
+                user = await AuthService(db, redis).verify_access_token(token)
         except (ValueError, RuntimeError, ConnectionError):
             # If verification fails, continue without user
-            pass
+            user = None
 
-        response = await call_next(request)
-        return response
+    request.state.user = user
+    return user
 
 
 async def get_current_user(request: Request) -> User:
@@ -94,7 +119,7 @@ async def get_current_user(request: Request) -> User:
     Raises:
         HTTPException: If user is not authenticated
     """
-    user = getattr(request.state, 'user', None)
+    user = await _resolve_user(request)
 
     if not user:
         raise HTTPException(
@@ -106,6 +131,23 @@ async def get_current_user(request: Request) -> User:
     return user
 
 
+async def ensure_authenticated(request: Request) -> None:
+    """
+    Router-level dependency that requires an authenticated user.
+
+    Stores the user in ``current_user_ctx`` so routes can read it without
+    declaring their own ``Depends(get_current_user)``. Must stay ``async`` so it
+    runs in the same context as the endpoint rather than in the threadpool.
+
+    Args:
+        request: FastAPI request
+
+    Raises:
+        HTTPException: If user is not authenticated
+    """
+    current_user_ctx.set(await get_current_user(request))
+
+
 async def get_current_user_optional(request: Request) -> Optional[User]:
     """
     Dependency to get current user if authenticated.
@@ -116,19 +158,19 @@ async def get_current_user_optional(request: Request) -> Optional[User]:
     Returns:
         Current user or None
     """
-    return getattr(request.state, 'user', None)
+    return await _resolve_user(request)
 
 
 async def verify_token_dependency(
-    credentials: HTTPAuthorizationCredentials = security,
-    db: Session = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Optional[AsyncSession] = None,
 ) -> User:
     """
     Dependency to verify token and return user.
 
     Args:
         credentials: HTTP authorization credentials
-        db: Database session
+        db: Async database session; a short-lived one is opened when omitted
 
     Returns:
         Authenticated user
@@ -136,14 +178,13 @@ async def verify_token_dependency(
     Raises:
         HTTPException: If token is invalid
     """
-    from app.core.redis import redis_client
-
-    if not db:
-        db = next(get_session())
-
-    auth_service = AuthService(db, redis_client)
+    redis = await get_redis()
 
-    user = await auth_service.verify_access_token(credentials.credentials)
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            user = await AuthService(session, redis).verify_access_token(credentials.credentials)
+    else:
+        user = await AuthService(db, redis).verify_access_token(credentials.credentials)
 
     if not user:
         raise HTTPException(
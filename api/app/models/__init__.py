@@ -12,12 +12,12 @@
 6. 对话域 (conversation/) - 对话、消息、标注、终端用户（5张表）
 7. 知识库域 (dataset/) - 知识库、文档、段落（4张表）
 8. 插件域 (plugin/) - 插件系统（2张表）
-9. BPM域 (bpm/) - 业务流程管理（6张表）
+9. BPM域 (bpm/) - 业务流程管理（7张表）
 10. 计费域 (billing/) - 订阅和用量（2张表）
 11. 文件域 (file/) - 文件引用（1张表）
 12. 审计域 (audit/) - 审计日志（1张表）
 
-总计：37张核心表（31张主业务表 + 6张BPM表）+ MongoDB文件存储
+总计：38张核心表（31张主业务表 + 7张BPM表）+ MongoDB文件存储
 """
 
 # 基础模型
@@ -72,6 +72,7 @@ from app.models.bpm import (
     ProcessInstance,
     ProcessStatus,
     Task,
+    TaskEvent,
     TaskStatus,
     TaskType,
     Approval,
@@ -137,6 +138,7 @@ __all__ = [
     'ProcessInstance',
     'ProcessStatus',
     'Task',
+    'TaskEvent',
     'TaskStatus',
     'TaskType',
     'Approval',
@@ -12,6 +12,7 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field
 
@@ -47,6 +48,15 @@ class Application(
     """
 
     __tablename__ = 'applications'
+    __table_args__ = (
+        # 按配置项筛选应用（config @> ...）
+        Index(
+            'ix_applications_config_gin',
+            'config',
+            postgresql_using='gin',
+            postgresql_ops={'config': 'jsonb_path_ops'},
+        ),
+    )
 
     name: str = Field(max_length=255)
     workflow_id: UUID = Field(index=True)  # Logical FK to workflows
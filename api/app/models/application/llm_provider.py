@@ -9,6 +9,9 @@ Description: 本模块定义了LLM提供商配置的数据模型。支持多种L
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
+from typing import Optional
+
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field, SQLModel
 
@@ -36,14 +39,30 @@ class LLMProvider(
         name: 配置名称（用户自定义）
         provider_type: 提供商类型（OPENAI/ANTHROPIC/AZURE等）
         api_key_encrypted: 加密的API密钥
-        config: 提供商特定配置（JSONB格式）
+        base_url: API 地址（为空时使用提供商默认地址）
+        default_model: 默认模型名称
+        timeout_ms: 请求超时（毫秒）
+        config: 其余提供商特定配置（JSONB格式）；常用项已提升为上面的独立列
 
     """
 
     __tablename__ = 'llm_providers'
+    __table_args__ = (
+        # 按配置项筛选提供商（config @> ...）
+        Index(
+            'ix_llm_providers_config_gin',
+            'config',
+            postgresql_using='gin',
+            postgresql_ops={'config': 'jsonb_path_ops'},
+        ),
+    )
     name: str = Field(max_length=255)
     provider_type: str = Field(max_length=50)  # OPENAI, ANTHROPIC, AZURE, etc.
     api_key_encrypted: str = Field(max_length=500)
+    # 每次调用都要读取的配置项单独存列，读取时无需解析整个 config
+    base_url: Optional[str] = Field(default=None, max_length=500)
+    default_model: Optional[str] = Field(default=None, max_length=255)
+    timeout_ms: Optional[int] = Field(default=None)
     config: dict = Field(default_factory=dict, sa_column=Column(JSONB))
 
 
@@ -16,6 +16,7 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field
 
@@ -48,6 +49,15 @@ class PromptTemplate(
     """
 
     __tablename__ = 'prompt_templates'
+    __table_args__ = (
+        # 按变量查找模板（variables @> ...）
+        Index(
+            'ix_prompt_templates_variables_gin',
+            'variables',
+            postgresql_using='gin',
+            postgresql_ops={'variables': 'jsonb_path_ops'},
+        ),
+    )
     name: str = Field(max_length=255)
     content: str
     variables: dict = Field(default_factory=dict, sa_column=Column(JSONB))
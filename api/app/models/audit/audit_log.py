@@ -15,6 +15,7 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Column, Field
 
@@ -50,18 +51,37 @@ class AuditLog(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
     业务规则：
         - 所有重要操作都应记录审计日志
         - 日志只能创建，不能修改或删除
-        - 定期归档旧日志以控制表大小
+        - 定期归档旧日志以控制表大小：表按 created_at 月分区（audit_logs_YYYY_MM），
+          归档时 DETACH PARTITION 即可；数据库主键为 (id, created_at)
         - 支持按时间范围、用户、资源类型等维度查询
     """
 
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # 审计日志按详情字段检索（details @> ...），jsonb_path_ops 只支持 @> 但索引更小
+        Index(
+            'ix_audit_logs_details_gin',
+            'details',
+            postgresql_using='gin',
+            postgresql_ops={'details': 'jsonb_path_ops'},
+        ),
+        # 按资源查审计记录；LOGIN/LOGOUT 等无资源的行不进索引
+        Index(
+            'ix_audit_logs_resource',
+            'resource_type',
+            'resource_id',
+            postgresql_where=text('resource_id IS NOT NULL'),
+        ),
+        # 只追加的表按时间顺序写入，BRIN 足以支持时间范围查询，体积远小于 btree
+        Index('ix_audit_logs_created_at_brin', 'created_at', postgresql_using='brin'),
+    )
 
     user_id: Optional[UUID] = Field(default=None, index=True)  # Logical FK to users
     action: str = Field(
         max_length=100, index=True
     )  # CREATE, UPDATE, DELETE, EXECUTE, LOGIN, LOGOUT
     resource_type: str = Field(max_length=50, index=True)  # WORKFLOW, APPLICATION, USER, TEAM, etc.
-    resource_id: Optional[UUID] = Field(default=None, index=True)
+    resource_id: Optional[UUID] = Field(default=None)  # 见 ix_audit_logs_resource
     details: dict = Field(default_factory=dict, sa_column=Column(JSONB))
     ip_address: Optional[str] = Field(default=None, max_length=50)
     user_agent: Optional[str] = Field(default=None, max_length=500)
@@ -1,11 +1,88 @@
 """Base model classes and mixins for the application."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional
-from uuid import UUID, uuid4
+from functools import cache
+from operator import attrgetter
+from types import UnionType
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin
+from uuid import UUID
 
+from sqlalchemy import DateTime, func
 from sqlmodel import Field, SQLModel
 
+from app.models.ids import uuid7
+from app.utils.time import utcnow
+
+# Deterministic constraint names so autogenerate does not churn on unnamed constraints.
+NAMING_CONVENTION: Dict[str, str] = {
+    'ix': 'ix_%(column_0_label)s',
+    'uq': 'uq_%(table_name)s_%(column_0_name)s',
+    'ck': 'ck_%(table_name)s_%(constraint_name)s',
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+    'pk': 'pk_%(table_name)s',
+}
+
+SQLModel.metadata.naming_convention = NAMING_CONVENTION
+
+# Converts one field value for to_dict; None means the value is returned as-is
+_Converter = Optional[Callable[[Any], Any]]
+
+
+def _convert_any(value: Any) -> Any:
+    """Fallback for fields whose annotation does not pin the type down."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _converter_for(annotation: Any) -> _Converter:
+    """Pick the to_dict converter for a field from its type annotation."""
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _convert_any
+        annotation = args[0]
+
+    if annotation is UUID:
+        return str
+    if annotation is datetime:
+        return datetime.isoformat
+    if annotation is Any:
+        return _convert_any
+    return None
+
+
+@cache
+def _to_dict_plan(cls: type) -> Tuple[Tuple[str, _Converter], ...]:
+    """Per-model list of (field name, converter), computed once per class."""
+    return tuple(
+        (name, _converter_for(field.annotation)) for name, field in cls.model_fields.items()
+    )
+
+
+@cache
+def _fields_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    """Per-model getter returning all field values at once."""
+    names = tuple(cls.model_fields)
+    if len(names) == 1:
+        # attrgetter with a single name returns the bare value, not a tuple
+        get_one = attrgetter(names[0])
+        return lambda obj: (get_one(obj),)
+    return attrgetter(*names)
+
+
+@cache
+def _updatable_fields(cls: type) -> frozenset[str]:
+    """Per-model set of field names update_from_dict may assign."""
+    return frozenset(cls.model_fields)
+
+
+def _values(obj: Any) -> Tuple[Any, ...]:
+    """All field values of a model instance, in model_fields order."""
+    return _fields_getter(obj.__class__)(obj)
+
 
 class BaseModel(SQLModel):
     """Abstract base class for all data models.
@@ -13,7 +90,7 @@ class BaseModel(SQLModel):
     Provides common fields and behaviors that all models should have.
     """
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary representation.
@@ -22,29 +99,28 @@ class BaseModel(SQLModel):
             Dictionary containing all model fields and their values.
         """
         result = {}
-        for field_name in self.__class__.model_fields:
+        for field_name, convert in _to_dict_plan(self.__class__):
             value = getattr(self, field_name)
-            if isinstance(value, UUID):
-                result[field_name] = str(value)
-            elif isinstance(value, datetime):
-                result[field_name] = value.isoformat()
-            else:
-                result[field_name] = value
+            result[field_name] = value if convert is None or value is None else convert(value)
         return result
 
     def update_from_dict(self, data: Dict[str, Any]) -> None:
         """Update model instance from dictionary data.
 
+        Keys that are not model fields are ignored. Values go through setattr so
+        SQLAlchemy still records the change for the next flush.
+
         Args:
             data: Dictionary containing field names and new values.
         """
+        updatable = _updatable_fields(self.__class__)
         for field_name, value in data.items():
-            if hasattr(self, field_name):
+            if field_name in updatable:
                 setattr(self, field_name, value)
 
         # Update timestamp if available
-        if hasattr(self, 'updated_at'):
-            self.updated_at = datetime.utcnow()
+        if 'updated_at' in updatable:
+            self.updated_at = utcnow()
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on all field values.
@@ -58,34 +134,53 @@ class BaseModel(SQLModel):
         if not isinstance(other, self.__class__):
             return False
 
-        for field_name in self.__class__.model_fields:
-            if getattr(self, field_name) != getattr(other, field_name):
-                return False
+        return _values(self) == _values(other)
 
-        return True
+
+def server_timestamp_field(*, index: bool = False) -> Any:
+    """Create a TIMESTAMPTZ field that PostgreSQL stamps with now() on insert.
+
+    The value is None on a fresh instance and is fetched back via RETURNING when
+    the row is flushed, so no datetime is built in Python on the insert path.
+
+    Args:
+        index: Whether to index the column
+
+    Returns:
+        SQLModel field definition
+    """
+    return Field(
+        default=None,
+        nullable=False,
+        index=index,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={'server_default': func.now()},
+    )
 
 
 class TimestampMixin:
     """Mixin class providing timestamp fields and related methods."""
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = server_timestamp_field()
+    # The set_updated_at trigger stamps now() on any UPDATE that leaves updated_at unchanged
+    # (bulk/Core updates); ORM writes keep setting it via touch() so the in-memory value matches
+    updated_at: datetime = server_timestamp_field()
 
     def touch(self) -> None:
         """Update the updated_at timestamp to current time."""
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utcnow()
 
 
 class SoftDeleteMixin:
     """Mixin class providing soft delete functionality."""
 
-    deleted_at: Optional[datetime] = Field(default=None)
+    deleted_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
     is_deleted: bool = Field(default=False)
 
     def soft_delete(self) -> None:
         """Mark the record as deleted without removing it from database."""
         self.is_deleted = True
-        self.deleted_at = datetime.utcnow()
+        self.deleted_at = utcnow()
 
     def restore(self) -> None:
         """Restore a soft-deleted record."""
@@ -10,7 +10,13 @@ from typing import Optional
 from sqlmodel import Field, Column
 from sqlalchemy.dialects.postgresql import JSONB
 from decimal import Decimal
-from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, SoftDeleteMixin
+from app.models.base import (
+    BaseModel,
+    TimestampMixin,
+    WorkspaceMixin,
+    SoftDeleteMixin,
+    server_timestamp_field,
+)
 
 
 class Subscription(BaseModel, TimestampMixin, WorkspaceMixin, SoftDeleteMixin, table=True):
@@ -118,6 +124,6 @@ class UsageRecord(BaseModel, WorkspaceMixin, table=True):
     unit: str = Field(max_length=20)  # count, token, gb, mb
     cost: Decimal = Field(default=Decimal('0.00'), max_digits=10, decimal_places=4)
     custom_metadata: Optional[dict] = Field(default=None, sa_column=Column(JSONB))
-    recorded_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    recorded_at: datetime = server_timestamp_field(index=True)
     period_start: datetime = Field(index=True)
     period_end: datetime = Field(index=True)
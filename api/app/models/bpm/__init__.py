@@ -1,7 +1,14 @@
 """BPM 数据模型"""
 
 from app.models.bpm.process import ProcessDefinition, ProcessInstance, ProcessStatus
-from app.models.bpm.task import Task, TaskStatus, TaskType
+from app.models.bpm.task import (
+    Task,
+    TaskEvent,
+    TaskEventKind,
+    TaskEventStatus,
+    TaskStatus,
+    TaskType,
+)
 from app.models.bpm.approval import Approval, ApprovalAction
 from app.models.bpm.form import FormDefinition, FormData
 
@@ -10,6 +17,9 @@ __all__ = [
     'ProcessInstance',
     'ProcessStatus',
     'Task',
+    'TaskEvent',
+    'TaskEventKind',
+    'TaskEventStatus',
     'TaskStatus',
     'TaskType',
     'Approval',
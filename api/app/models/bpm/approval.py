@@ -5,8 +5,10 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Field, Column, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Column, Field
 from app.models.base import BaseModel, WorkspaceMixin
+from app.models.ids import uuid7
 
 
 class ApprovalAction(str, Enum):
@@ -23,7 +25,7 @@ class Approval(BaseModel, WorkspaceMixin, table=True):
     """审批记录表 - 记录每次审批操作
 
     已经继承
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
 
     # 租户隔离
     workspace_id: UUID = Field(foreign_key="workspaces.id", index=True)
@@ -47,7 +49,7 @@ class Approval(BaseModel, WorkspaceMixin, table=True):
     comment: Optional[str] = Field(default=None, description='审批意见')
 
     # 附件
-    attachments: dict = Field(default_factory=dict, sa_column=Column(JSON), description='附件列表')
+    attachments: dict = Field(default_factory=dict, sa_column=Column(JSONB), description='附件列表')
 
     # 转交/委托信息（逻辑外键）
     transfer_to: Optional[UUID] = Field(default=None, description='转交给用户ID')
@@ -11,10 +11,19 @@ Description: 添加了softdelete软删除字段
 
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlmodel import Field, SQLModel, Column, JSON
-from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, AuditMixin, SoftDeleteMixin
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Column, Field, SQLModel
+from app.models.base import (
+    BaseModel,
+    TimestampMixin,
+    WorkspaceMixin,
+    AuditMixin,
+    SoftDeleteMixin,
+    server_timestamp_field,
+)
+from app.models.ids import uuid7
 
 
 class FormDefinition(
@@ -23,7 +32,7 @@ class FormDefinition(
     """表单定义表"""
     """
     已经继承
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     # 租户隔离
     workspace_id: Optional[UUID] = Field(default=None, foreign_key="workspaces.id", index=True)
     deleted_at: Optional[datetime] = Field(default=None)
@@ -44,10 +53,10 @@ class FormDefinition(
     description: Optional[str] = Field(default=None, description='表单描述')
 
     # 表单 Schema（JSON Schema）
-    form_schema: dict = Field(sa_column=Column(JSON), description='表单结构定义')
+    form_schema: dict = Field(sa_column=Column(JSONB), description='表单结构定义')
 
     # UI Schema（表单渲染配置）
-    ui_schema: Optional[dict] = Field(default=None, sa_column=Column(JSON), description='UI配置')
+    ui_schema: Optional[dict] = Field(default=None, sa_column=Column(JSONB), description='UI配置')
 
     # 版本
     version: int = Field(default=1, description='版本号')
@@ -61,7 +70,7 @@ class FormData(SQLModel, table=True):
 
     __tablename__ = 'bpm_form_data'
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
 
     # 关联（逻辑外键）
     process_instance_id: UUID = Field(index=True, description='流程实例ID')
@@ -69,11 +78,11 @@ class FormData(SQLModel, table=True):
     form_definition_id: UUID = Field(description='表单定义ID')
 
     # 表单数据
-    data: dict = Field(sa_column=Column(JSON), description='表单数据')
+    data: dict = Field(sa_column=Column(JSONB), description='表单数据')
 
     # 提交信息（逻辑外键）
     submitted_by: UUID = Field(description='提交人用户ID')
-    submitted_at: datetime = Field(default_factory=datetime.utcnow)
+    submitted_at: datetime = server_timestamp_field()
 
     # 租户隔离（逻辑外键）
     workspace_id: UUID = Field(index=True, description='工作空间ID')
@@ -4,8 +4,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 from uuid import UUID
-from sqlmodel import Field, Column, JSON
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Column, Field
 from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, AuditMixin, SoftDeleteMixin
+from app.models.ids import uuid7
 
 
 class ProcessDefinition(
@@ -30,16 +33,16 @@ class ProcessDefinition(
     # 流程定义
     bpmn_xml: Optional[str] = Field(default=None, description='BPMN 2.0 XML 定义')
     process_config: dict = Field(
-        default_factory=dict, sa_column=Column(JSON), description='流程配置（JSON）'
+        default_factory=dict, sa_column=Column(JSONB), description='流程配置（JSON）'
     )
 
     # 节点定义
-    nodes: dict = Field(default_factory=dict, sa_column=Column(JSON), description='流程节点列表')
+    nodes: dict = Field(default_factory=dict, sa_column=Column(JSONB), description='流程节点列表')
 
 
     # 表单配置
     form_schema: Optional[dict] = Field(
-        default=None, sa_column=Column(JSON), description='表单 Schema'
+        default=None, sa_column=Column(JSONB), description='表单 Schema'
     )
 
     # 状态
@@ -87,7 +90,7 @@ class ProcessInstance(BaseModel, WorkspaceMixin, TimestampMixin, table=True):
     """流程定义表 - 定义可重用的流程模板
 
     已经继承
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     # 租户隔离
     workspace_id: Optional[UUID] = Field(default=None, foreign_key="workspaces.id", index=True)
     # 创建信息
@@ -122,7 +125,7 @@ class ProcessInstance(BaseModel, WorkspaceMixin, TimestampMixin, table=True):
     status: ProcessStatus = Field(default=ProcessStatus.PENDING, index=True)
 
     # 流程变量
-    variables: dict = Field(default_factory=dict, sa_column=Column(JSON), description='流程变量')
+    variables: dict = Field(default_factory=dict, sa_column=Column(JSONB), description='流程变量')
 
 
     # 当前节点
@@ -131,13 +134,17 @@ class ProcessInstance(BaseModel, WorkspaceMixin, TimestampMixin, table=True):
 
 
     # 执行信息
-    started_at: Optional[datetime] = Field(default=None, description='启动时间')
-    completed_at: Optional[datetime] = Field(default=None, description='完成时间')
+    started_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='启动时间'
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='完成时间'
+    )
     duration_seconds: Optional[int] = Field(default=None, description='执行时长（秒）')
 
 
     # 结果
-    result: Optional[dict] = Field(default=None, sa_column=Column(JSON), description='执行结果')
+    result: Optional[dict] = Field(default=None, sa_column=Column(JSONB), description='执行结果')
     error_message: Optional[str] = Field(default=None, description='错误信息')
     # 创建信息（逻辑外键）
     started_by: UUID = Field(description='启动者用户ID')
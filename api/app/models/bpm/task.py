@@ -5,9 +5,12 @@ from enum import StrEnum
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import JSON, Column, Field
+from sqlalchemy import DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Column, Field
 
-from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin
+from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, server_timestamp_field
+from app.models.ids import uuid7
 
 
 class TaskStatus(StrEnum):
@@ -35,7 +38,7 @@ class Task(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
     """任务表 - 流程中的具体任务（待办事项）
 
     已经继承
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     # 租户隔离
     workspace_id: UUID = Field(foreign_key="workspaces.id", index=True)
 
@@ -46,6 +49,10 @@ class Task(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
     """
 
     __tablename__ = 'bpm_tasks'
+    __table_args__ = (
+        # 我的任务：按处理人 + 工作区（可选状态）过滤
+        Index('ix_bpm_tasks_assignee_workspace_status', 'assignee', 'workspace_id', 'status'),
+    )
 
     # 关联流程实例（逻辑外键）
     process_instance_id: UUID = Field(index=True, description='流程实例ID')
@@ -61,7 +68,7 @@ class Task(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
     # 任务分配（逻辑外键）
     assignee: Optional[UUID] = Field(default=None, index=True, description='任务处理人用户ID')
     candidate_users: dict = Field(
-        default_factory=dict, sa_column=Column(JSON), description='候选用户列表'
+        default_factory=dict, sa_column=Column(JSONB), description='候选用户列表'
     )
 
     # 任务状态
@@ -76,19 +83,25 @@ class Task(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
 
     # 表单数据
     form_key: Optional[str] = Field(default=None, description='表单键')
-    form_data: Optional[dict] = Field(default=None, sa_column=Column(JSON), description='表单数据')
+    form_data: Optional[dict] = Field(default=None, sa_column=Column(JSONB), description='表单数据')
 
     # 任务变量
-    variables: dict = Field(default_factory=dict, sa_column=Column(JSON), description='任务变量')
+    variables: dict = Field(default_factory=dict, sa_column=Column(JSONB), description='任务变量')
 
     # 执行信息
-    claimed_at: Optional[datetime] = Field(default=None, description='认领时间')
-    started_at: Optional[datetime] = Field(default=None, description='开始时间')
-    completed_at: Optional[datetime] = Field(default=None, description='完成时间')
+    claimed_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='认领时间'
+    )
+    started_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='开始时间'
+    )
+    completed_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='完成时间'
+    )
     duration_seconds: Optional[int] = Field(default=None, description='处理时长（秒）')
 
     # 结果
-    result: Optional[dict] = Field(default=None, sa_column=Column(JSON), description='任务结果')
+    result: Optional[dict] = Field(default=None, sa_column=Column(JSONB), description='任务结果')
     comment: Optional[str] = Field(default=None, description='处理意见')
 
     class Config:
@@ -104,3 +117,48 @@ class Task(BaseModel, TimestampMixin, WorkspaceMixin, table=True):
                 'form_data': {'workspace_name': '新工作空间', 'applicant': '张三'},
             }
         }
+
+
+class TaskEventKind(StrEnum):
+    """任务事件类型"""
+
+    COMPLETED = 'completed'  # 任务已完成，需推进流程
+
+
+class TaskEventStatus(StrEnum):
+    """任务事件处理状态"""
+
+    PENDING = 'pending'  # 待处理
+    PROCESSED = 'processed'  # 已处理
+    FAILED = 'failed'  # 重试耗尽
+
+
+class TaskEvent(BaseModel, table=True):
+    """任务事件表 - 任务状态变更后待执行的流程推进步骤
+
+    完成任务的接口只写任务行和一条事件，由后台 TaskEventWorker 消费事件并推进流程实例。
+    """
+
+    __tablename__ = 'bpm_task_events'
+    __table_args__ = (
+        # worker 按创建时间轮询待处理事件，只索引 pending 行
+        Index(
+            'ix_bpm_task_events_pending',
+            'created_at',
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    task_id: UUID = Field(index=True, description='任务ID')
+    process_instance_id: UUID = Field(description='流程实例ID')
+    kind: str = Field(max_length=20, description='事件类型')
+    payload: dict = Field(default_factory=dict, sa_column=Column(JSONB), description='事件数据')
+
+    status: str = Field(default=TaskEventStatus.PENDING, max_length=20, description='处理状态')
+    attempts: int = Field(default=0, description='已尝试次数')
+    error: Optional[str] = Field(default=None, description='最近一次失败原因')
+
+    created_at: datetime = server_timestamp_field()
+    processed_at: Optional[datetime] = Field(
+        default=None, sa_type=DateTime(timezone=True), description='处理时间'
+    )
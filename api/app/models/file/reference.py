@@ -14,6 +14,7 @@ Description:实现了softdelete软删除的基础类继承
 """
 
 from uuid import UUID
+from sqlalchemy import Index
 from sqlmodel import Field
 from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, SoftDeleteMixin
 
@@ -48,6 +49,10 @@ class FileReference(BaseModel, WorkspaceMixin, TimestampMixin, SoftDeleteMixin,
     """
 
     __tablename__ = 'file_references'
+    __table_args__ = (
+        # 文件列表按 created_at 倒序分页（含游标分页），id 用于同一时间戳内的稳定排序
+        Index('ix_file_references_workspace_created', 'workspace_id', 'created_at', 'id'),
+    )
     file_id: UUID = Field(unique=True, index=True)  # 关联到MongoDB
 
     filename: str = Field(max_length=255)
@@ -9,7 +9,13 @@ from uuid import UUID
 from typing import Optional
 from sqlmodel import Field, Column
 from sqlalchemy.dialects.postgresql import JSONB
-from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, SoftDeleteMixin
+from app.models.base import (
+    BaseModel,
+    TimestampMixin,
+    WorkspaceMixin,
+    SoftDeleteMixin,
+    server_timestamp_field,
+)
 
 
 class Plugin(BaseModel, TimestampMixin, SoftDeleteMixin, table=True):
@@ -102,4 +108,4 @@ class InstalledPlugin(BaseModel, TimestampMixin, WorkspaceMixin, SoftDeleteMixin
     config: dict = Field(default_factory=dict, sa_column=Column(JSONB))
     is_enabled: bool = Field(default=True, index=True)
     installed_by: UUID = Field(index=True)  # Logical FK to users
-    installed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    installed_at: datetime = server_timestamp_field(index=True)
@@ -15,7 +15,13 @@ from uuid import UUID
 from typing import Optional
 from sqlmodel import Field, Column
 from sqlalchemy.dialects.postgresql import JSONB
-from app.models.base import BaseModel, TimestampMixin, AuditMixin, SoftDeleteMixin
+from app.models.base import (
+    BaseModel,
+    TimestampMixin,
+    AuditMixin,
+    SoftDeleteMixin,
+    server_timestamp_field,
+)
 
 
 class Organization(BaseModel, TimestampMixin, AuditMixin, SoftDeleteMixin, table=True):
@@ -128,4 +134,4 @@ class TeamMember(BaseModel, table=True):
     team_id: UUID = Field(index=True)  # Logical FK to teams
     user_id: UUID = Field(index=True)  # Logical FK to users
     role: str = Field(default='MEMBER', max_length=16)  # ADMIN, MEMBER, GUEST
-    joined_at: datetime = Field(default_factory=datetime.utcnow)
+    joined_at: datetime = server_timestamp_field()
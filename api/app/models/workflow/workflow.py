@@ -14,8 +14,16 @@ from datetime import datetime
 from uuid import UUID
 from typing import Optional, List
 from sqlmodel import Field, Column, Relationship
+from sqlalchemy import DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
-from app.models.base import BaseModel, TimestampMixin, WorkspaceMixin, AuditMixin, SoftDeleteMixin
+from app.models.base import (
+    BaseModel,
+    TimestampMixin,
+    WorkspaceMixin,
+    AuditMixin,
+    SoftDeleteMixin,
+    server_timestamp_field,
+)
 
 
 class Workflow(BaseModel, TimestampMixin, AuditMixin, WorkspaceMixin, SoftDeleteMixin, table=True):
@@ -46,6 +54,20 @@ class Workflow(BaseModel, TimestampMixin, AuditMixin, WorkspaceMixin, SoftDelete
     input_schema: dict = Field(default_factory=dict, sa_column=Column(JSONB))
     output_schema: dict = Field(default_factory=dict, sa_column=Column(JSONB))
 
+    # Relationships（只读，用于详情页一次性预加载整张图；节点/连线仍通过各自接口维护）
+    nodes: List['Node'] = Relationship(
+        sa_relationship_kwargs={
+            'primaryjoin': 'and_(Workflow.id == foreign(Node.workflow_id), ~Node.is_deleted)',
+            'viewonly': True,
+        },
+    )
+    connections: List['Connection'] = Relationship(
+        sa_relationship_kwargs={
+            'primaryjoin': 'Workflow.id == foreign(Connection.workflow_id)',
+            'viewonly': True,
+        },
+    )
+
 
 class Node(BaseModel, SoftDeleteMixin, table=True):
     """节点表 - 工作流中的处理节点。
@@ -93,8 +115,18 @@ class Connection(BaseModel, table=True):
     """
 
     __tablename__ = 'connections'
+    __table_args__ = (
+        # 覆盖索引：按工作流读取全部连线时可走 index-only scan，同时取代 workflow_id 单列索引
+        Index(
+            'ix_connections_workflow_edges',
+            'workflow_id',
+            'source_node_id',
+            'target_node_id',
+            postgresql_include=['id', 'source_output', 'target_input'],
+        ),
+    )
 
-    workflow_id: UUID = Field(index=True)  # Logical FK to workflows
+    workflow_id: UUID = Field()  # Logical FK to workflows
     source_node_id: UUID = Field(index=True)  # Logical FK to nodes
     target_node_id: UUID = Field(index=True)  # Logical FK to nodes
     source_output: str = Field(max_length=255)
@@ -128,8 +160,8 @@ class ExecutionRecord(BaseModel, table=True):
     outputs: Optional[dict] = Field(default=None, sa_column=Column(JSONB))
     status: str = Field(max_length=20, index=True)  # PENDING, RUNNING, SUCCESS, FAILED
     error: Optional[str] = None
-    started_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    completed_at: Optional[datetime] = None
+    started_at: datetime = server_timestamp_field(index=True)
+    completed_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
     duration_ms: Optional[int] = None
 
     # Relationships
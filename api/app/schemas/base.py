@@ -0,0 +1,32 @@
+"""Schema 公共工具"""
+
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+SchemaT = TypeVar('SchemaT', bound=BaseModel)
+
+
+@cache
+def _field_names(schema: type[BaseModel]) -> tuple[str, ...]:
+    """响应模型的字段名，每个 schema 只计算一次"""
+    return tuple(schema.model_fields)
+
+
+def construct_from_orm(schema: type[SchemaT], obj: Any, **values: Any) -> SchemaT:
+    """用刚从数据库读出的 ORM 对象构造响应模型，不执行校验。
+
+    仅用于可信来源（数据库读取结果）的列表场景，省去逐条 model_validate 的开销；
+    单条读取和用户输入仍应使用 model_validate。ORM 对象缺少 schema 字段时抛出 AttributeError。
+
+    Args:
+        schema: 响应模型类
+        obj: ORM 对象
+        values: 直接指定的字段值（如已构造好的嵌套列表），不再从 obj 读取
+
+    Returns:
+        未经校验构造的响应模型实例
+    """
+    fields = {name: getattr(obj, name) for name in _field_names(schema) if name not in values}
+    return schema.model_construct(**fields, **values)
@@ -1,7 +1,7 @@
 """任务相关 Schemas"""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -32,3 +32,25 @@ class TaskCompleteRequest(BaseModel):
 
     result: dict = Field(..., description='任务结果')
     comment: Optional[str] = Field(None, description='处理意见')
+
+
+# 批量接口单次最多处理的任务数
+BULK_TASK_LIMIT = 500
+
+
+class TaskBulkClaimRequest(BaseModel):
+    """批量认领任务请求"""
+
+    task_ids: List[UUID] = Field(..., min_length=1, max_length=BULK_TASK_LIMIT)
+
+
+class TaskBulkCompleteRequest(TaskCompleteRequest):
+    """批量完成任务请求（所有任务使用同一结果和处理意见）"""
+
+    task_ids: List[UUID] = Field(..., min_length=1, max_length=BULK_TASK_LIMIT)
+
+
+class TaskBulkResponse(BaseModel):
+    """批量操作响应"""
+
+    task_ids: List[UUID] = Field(..., description='实际处理成功的任务ID')
@@ -13,6 +13,7 @@ Description: 定义文件上传、下载、列表等操作的数据传输对象
 """
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -90,10 +91,11 @@ class FileListItem(BaseModel):
 class FileListResponse(BaseModel):
     """文件列表响应"""
 
-    total: int = Field(..., description='总文件数')
+    total: Optional[int] = Field(None, description='总文件数（游标分页时不返回）')
     items: list[FileListItem] = Field(..., description='文件列表')
     limit: int = Field(..., description='每页数量')
     offset: int = Field(..., description='偏移量')
+    next_cursor: Optional[str] = Field(None, description='下一页游标，没有更多数据时为空')
 
     class Config:
         json_schema_extra = {
@@ -110,6 +112,7 @@ class FileListResponse(BaseModel):
                 ],
                 'limit': 100,
                 'offset': 0,
+                'next_cursor': 'MjAyNS0xMi0wNVQxMDozMDowMCswMDowMHw1NTBlODQwMA==',
             }
         }
 
@@ -9,7 +9,10 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, RootModel, field_validator
+
+# Maximum number of nodes / connections accepted by one bulk request
+BULK_GRAPH_LIMIT = 500
 
 # ============================================================================
 # Node Schemas
@@ -83,6 +86,12 @@ class NodeCreateRequest(BaseModel):
         return v
 
 
+class NodeBulkCreateRequest(BaseModel):
+    """Request schema for adding several nodes in one call."""
+
+    nodes: List[NodeCreateRequest] = Field(..., min_length=1, max_length=BULK_GRAPH_LIMIT)
+
+
 class NodeUpdateRequest(BaseModel):
     """Request schema for updating a node."""
 
@@ -105,6 +114,10 @@ class NodeResponse(BaseModel):
     model_config = {'from_attributes': True}
 
 
+class NodeListResponse(RootModel[List[NodeResponse]]):
+    """Response schema for the nodes of a workflow (serialized as a plain JSON array)."""
+
+
 # ============================================================================
 # Connection Schemas
 # ============================================================================
@@ -119,6 +132,14 @@ class ConnectionCreateRequest(BaseModel):
     target_input: str = Field(..., min_length=1, max_length=255, description='Target input port')
 
 
+class ConnectionBulkCreateRequest(BaseModel):
+    """Request schema for creating several connections in one call."""
+
+    connections: List[ConnectionCreateRequest] = Field(
+        ..., min_length=1, max_length=BULK_GRAPH_LIMIT
+    )
+
+
 class ConnectionResponse(BaseModel):
     """Response schema for a connection."""
 
@@ -132,6 +153,10 @@ class ConnectionResponse(BaseModel):
     model_config = {'from_attributes': True}
 
 
+class ConnectionListResponse(RootModel[List[ConnectionResponse]]):
+    """Response schema for the connections of a workflow (serialized as a plain JSON array)."""
+
+
 # ============================================================================
 # Workflow Schemas
 # ============================================================================
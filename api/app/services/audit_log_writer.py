@@ -0,0 +1,185 @@
+"""审计日志批量写入
+
+审计日志只追加、量大，逐条 INSERT 时每条都要一次数据库往返。record() 只把日志放入内存队列，
+后台任务每凑满 audit_log_batch_size 条或等待 audit_log_flush_interval 秒后，用一条多行
+INSERT 写入一批。写入失败时按指数退避重试同一批，重试期间不再从队列取新日志
+（新日志在队列中等待，队列满后才丢弃）。
+
+audit_logs 按月分区：写入器每天首次写入前预建当前及后续 audit_log_partition_months_ahead 个月
+的分区，避免新月份的日志落入 default 分区。
+"""
+
+import asyncio
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import insert, text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.models.audit import AuditLog
+from app.models.ids import uuid7
+from app.utils.time import utcnow
+
+logger = get_logger(__name__)
+
+_RETRY_DELAY = 0.5  # seconds before the first retry, doubled after each failure
+_MAX_RETRY_DELAY = 30.0
+
+_CREATE_PARTITIONS = text(
+    'SELECT create_audit_log_partitions(now(), now() + make_interval(months => :months))'
+)
+
+
+class AuditLogWriter:
+    """审计日志后台写入器 - 由 lifespan 启动和停止"""
+
+    def __init__(
+        self,
+        batch_size: int = settings.audit_log_batch_size,
+        flush_interval: float = settings.audit_log_flush_interval,
+        max_queue_size: int = settings.audit_log_queue_size,
+        flush_attempts: int = settings.audit_log_flush_attempts,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_attempts = flush_attempts
+        # None 为停止信号
+        self._queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue(max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._partitions_checked_on: Optional[date] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """启动后台写入"""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台写入，队列中已有的日志会先写完（停止期间写入失败不再退避重试）"""
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # 队列已满时不阻塞：写入循环看到 _stopping 后写完队列中的日志自行退出
+            pass
+        await self._task
+        self._task = None
+
+    def record(
+        self,
+        *,
+        action: str,
+        resource_type: str,
+        workspace_id: UUID,
+        user_id: Optional[UUID] = None,
+        resource_id: Optional[UUID] = None,
+        details: Optional[dict] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        status: str = 'SUCCESS',
+        error_message: Optional[str] = None,
+    ) -> None:
+        """记录一条审计日志（不等待写入数据库）
+
+        队列已满时丢弃该条日志并记录警告，不阻塞请求。
+        """
+        entry = {
+            'id': uuid7(),
+            'workspace_id': workspace_id,
+            'user_id': user_id,
+            'action': action,
+            'resource_type': resource_type,
+            'resource_id': resource_id,
+            'details': details or {},
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'status': status,
+            'error_message': error_message,
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            logger.warning('Audit log queue full, dropping entry', action=action)
+
+    async def _run(self) -> None:
+        """写入循环：等到第一条日志后，在 flush_interval 内尽量凑满一批"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            if self._stopping and self._queue.empty():
+                return
+            entry = await self._queue.get()
+            if entry is None:
+                return
+
+            batch = [entry]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """一条多行 INSERT 写入一批日志
+
+        失败时退避后重试同一批；重试 flush_attempts 次仍失败（或正在停止）才丢弃并记录错误。
+        """
+        await self._ensure_partitions()
+        delay = _RETRY_DELAY
+        for attempt in range(1, self.flush_attempts + 1):
+            try:
+                async with AsyncSessionLocal() as session, session.begin():
+                    await session.execute(insert(AuditLog), batch)
+                return
+            except Exception as e:
+                if attempt == self.flush_attempts or self._stopping:
+                    logger.error(
+                        'Failed to write audit logs, dropping batch',
+                        count=len(batch),
+                        attempts=attempt,
+                        error=str(e),
+                    )
+                    return
+                logger.warning(
+                    'Failed to write audit logs, retrying',
+                    count=len(batch),
+                    attempt=attempt,
+                    error=str(e),
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+    async def _ensure_partitions(self) -> None:
+        """每天一次预建后续月份的分区（已存在的分区会被跳过）"""
+        today = utcnow().date()
+        if self._partitions_checked_on == today:
+            return
+        # 失败也只记录一次，当天不再重试
+        self._partitions_checked_on = today
+        try:
+            async with AsyncSessionLocal() as session, session.begin():
+                await session.execute(
+                    _CREATE_PARTITIONS, {'months': settings.audit_log_partition_months_ahead}
+                )
+        except Exception as e:
+            logger.warning('Failed to create audit log partitions', error=str(e))
+
+
+# Global audit log writer instance
+audit_log_writer = AuditLogWriter()
@@ -9,7 +9,8 @@ Description: Authentication service for user registration, login, and token mana
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from datetime import datetime
+import hashlib
+import time
 from typing import Optional
 from uuid import UUID
 
@@ -28,6 +29,7 @@ from app.schemas.auth_schema import (
     UserResponse,
 )
 from app.utils.password import get_password_hash, verify_password
+from app.utils.time import utcnow
 from app.utils.token import (
     TokenType,
     generate_access_token,
@@ -35,9 +37,26 @@ from app.utils.token import (
     verify_token,
 )
 
+# Lifetime of an access token in seconds, reported to clients with every token pair
+ACCESS_TOKEN_EXPIRES_IN = settings.access_token_expire_minutes * 60
+
+# How long a verified access token maps to its user id in Redis, in seconds
+AUTH_CACHE_TTL = 60
+
+
+def _auth_cache_key(token: str) -> str:
+    """Redis key for a verified access token (hashed so the raw token is not stored)."""
+    return f'auth:{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}'
+
 
 class AuthService:
-    """Service for handling authentication operations."""
+    """Service for handling authentication operations.
+
+    Instances only bind the per-request session and Redis client; all immutable
+    configuration is resolved once at import time.
+    """
+
+    __slots__ = ('db', 'redis')
 
     def __init__(self, db: AsyncSession, redis: RedisClient):
         """
@@ -175,26 +194,18 @@ class AuthService:
         access_payload = verify_token(access_token, token_type=TokenType.ACCESS)
         refresh_payload = verify_token(refresh_token, token_type=TokenType.REFRESH)
 
-        # Calculate remaining TTL for tokens
-        if access_payload:
-            access_exp = access_payload.get('exp')
-            if access_exp:
-                access_ttl = max(0, access_exp - int(datetime.utcnow().timestamp()))
-                await self.redis.set(
-                    f'revoked_token:{access_token}',
-                    '1',
-                    expire=access_ttl,
-                )
-
-        if refresh_payload:
-            refresh_exp = refresh_payload.get('exp')
-            if refresh_exp:
-                refresh_ttl = max(0, refresh_exp - int(datetime.utcnow().timestamp()))
-                await self.redis.set(
-                    f'revoked_token:{refresh_token}',
-                    '1',
-                    expire=refresh_ttl,
-                )
+        # Calculate remaining TTL for tokens and write both keys in one round-trip
+        now = int(time.time())
+        revocations = []
+        for token, payload in ((access_token, access_payload), (refresh_token, refresh_payload)):
+            if payload and payload.get('exp'):
+                ttl = payload['exp'] - now
+                # An already-expired token is rejected anyway; Redis also refuses EX 0
+                if ttl > 0:
+                    revocations.append((f'revoked_token:{token}', '1', ttl))
+
+        await self.redis.set_many(revocations)
+        await self.redis.delete(_auth_cache_key(access_token))
 
     async def reset_password(self, email: str) -> None:
         """
@@ -262,7 +273,7 @@ class AuthService:
 
         # Update password
         user.password_hash = get_password_hash(new_password)
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
 
         self.db.add(user)
         await self.db.commit()
@@ -280,24 +291,39 @@ class AuthService:
         Returns:
             User if token is valid, None otherwise
         """
-        # Check if token is revoked
-        revoked_key = f'revoked_token:{token}'
-        if await self.redis.exists(revoked_key):
+        # A recently verified token maps straight to its user id. The revocation marker is
+        # read in the same MGET on every path: a request that verified the token just before
+        # a concurrent logout may still write the cache entry after logout deleted it
+        cache_key = _auth_cache_key(token)
+        cached_user_id, revoked = await self.redis.mget([cache_key, f'revoked_token:{token}'])
+        if revoked:
             return None
 
-        # Verify token
-        payload = verify_token(token, token_type=TokenType.ACCESS)
+        if cached_user_id:
+            user_id = UUID(cached_user_id)
+            payload = None
+        else:
+            # Verify token
+            payload = verify_token(token, token_type=TokenType.ACCESS)
 
-        if not payload:
-            return None
+            if not payload:
+                return None
 
-        user_id = UUID(payload['user_id'])
+            user_id = UUID(payload['user_id'])
 
         # Get user from database
         user = await self.db.get(User, user_id)
-        if user and user.is_deleted:
+        if not user or user.is_deleted:
             return None
 
+        if payload:
+            # Never keep the entry past the token's own expiry
+            ttl = AUTH_CACHE_TTL
+            if payload.get('exp'):
+                ttl = min(ttl, payload['exp'] - int(time.time()))
+            if ttl > 0:
+                await self.redis.set(cache_key, str(user_id), expire=ttl)
+
         return user
 
     async def _generate_token_pair(self, user_id: UUID) -> TokenPair:
@@ -317,5 +343,5 @@ class AuthService:
             access_token=access_token,
             refresh_token=refresh_token,
             token_type='bearer',
-            expires_in=settings.access_token_expire_minutes * 60,
+            expires_in=ACCESS_TOKEN_EXPIRES_IN,
         )
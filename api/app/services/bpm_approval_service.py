@@ -12,15 +12,21 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.engine.bpm import TaskNotFoundError
 from app.models.bpm import Approval, ApprovalAction, Task
 
+# 审批记录只写不改，直接走 INSERT（语句在模块级构建一次，编译结果由 SQLAlchemy 缓存复用），
+# 不经过 ORM 工作单元的变更追踪
+_INSERT_APPROVAL = insert(Approval)
+
 
 class ApprovalService:
     """审批服务"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     async def approve_task(
@@ -68,10 +74,16 @@ class ApprovalService:
         comment: Optional[str],
         workspace_id: UUID,
     ) -> Approval:
-        """创建审批记录"""
-        task = self.session.get(Task, task_id)
+        """创建审批记录
+
+        不提交，由调用方在同一事务中与任务完成一起提交。
+
+        Raises:
+            TaskNotFoundError: 任务不存在
+        """
+        task = await self.session.get(Task, task_id)
         if not task:
-            raise ValueError('Task not found')
+            raise TaskNotFoundError('Task not found')
 
         approval = Approval(
             task_id=task_id,
@@ -83,8 +95,6 @@ class ApprovalService:
             workspace_id=workspace_id,
         )
 
-        self.session.add(approval)
-        self.session.commit()
-        self.session.refresh(approval)
+        await self.session.execute(_INSERT_APPROVAL, [approval.model_dump()])
 
         return approval
@@ -12,16 +12,16 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.engine.bpm import ProcessExecutor
-from app.models.bpm import ProcessInstance
+from app.models.bpm import ProcessInstance, ProcessStatus
 
 
 class ProcessService:
     """流程服务 - 业务逻辑层"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
         self.executor = ProcessExecutor(session)
 
@@ -49,13 +49,9 @@ class ProcessService:
             started_by=user_id,
             variables=variables,
             business_key=business_key,
+            business_type=business_type,
         )
 
-        if business_type:
-            instance.business_type = business_type
-            self.session.add(instance)
-            self.session.commit()
-
         return instance
 
     async def cancel_process(self, instance_id: UUID, user_id: UUID, reason: str):
@@ -67,17 +63,15 @@ class ProcessService:
         param {str} reason
         return {*}
         """
-        instance = self.session.get(ProcessInstance, instance_id)
+        instance = await self.session.get(ProcessInstance, instance_id)
         if not instance:
             raise ValueError('Process instance not found')
 
-        from app.bpm.models import ProcessStatus
-
         instance.status = ProcessStatus.CANCELLED
         instance.error_message = reason
 
         self.session.add(instance)
-        self.session.commit()
+        await self.session.commit()
 
     async def get_process_instance(self, instance_id: UUID) -> Optional[ProcessInstance]:
         """
@@ -87,4 +81,4 @@ class ProcessService:
         return {*}
         """
 
-        return self.session.get(ProcessInstance, instance_id)
+        return await self.session.get(ProcessInstance, instance_id)
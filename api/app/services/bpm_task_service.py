@@ -12,7 +12,7 @@ Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 from typing import List, Optional
 from uuid import UUID
 
-from sqlmodel import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.engine.bpm import TaskDispatcher
 from app.models.bpm import Task, TaskStatus
@@ -21,7 +21,7 @@ from app.models.bpm import Task, TaskStatus
 class TaskService:
     """任务服务"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
         self.dispatcher = TaskDispatcher(session)
 
@@ -56,6 +56,19 @@ class TaskService:
         executor = ProcessExecutor(self.session)
         return await executor.complete_task(task_id, user_id, result, comment)
 
+    async def bulk_claim(self, user_id: UUID, task_ids: List[UUID]) -> List[UUID]:
+        """批量认领任务，返回认领成功的任务ID"""
+        return await self.dispatcher.claim_tasks(task_ids, user_id)
+
+    async def bulk_complete(
+        self, user_id: UUID, task_ids: List[UUID], result: dict, comment: Optional[str] = None
+    ) -> List[Task]:
+        """批量完成任务，返回实际完成的任务"""
+        from app.engine.bpm import ProcessExecutor
+
+        executor = ProcessExecutor(self.session)
+        return await executor.complete_tasks(task_ids, user_id, result, comment)
+
     async def get_task(self, task_id: UUID) -> Optional[Task]:
         """获取任务详情"""
-        return self.session.get(Task, task_id)
+        return await self.session.get(Task, task_id)
@@ -16,10 +16,14 @@ Description: "文件服务 - 协调 PostgreSQL 元数据和 MongoDB 文件存储
 4. 处理事务一致性（元数据和文件内容同步）
 """
 
+import logging
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from typing import Optional, AsyncGenerator
 from uuid import UUID, uuid4
 
 from fastapi import UploadFile
+from sqlalchemy import func, tuple_
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -30,6 +34,25 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+def encode_cursor(file_reference: FileReference) -> str:
+    """将列表最后一项编码为游标（created_at + id）"""
+    raw = f'{file_reference.created_at.isoformat()}|{file_reference.id}'
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """解析游标
+
+    Raises:
+        ValueError: 游标格式无效
+    """
+    try:
+        created_at, _, reference_id = urlsafe_b64decode(cursor.encode()).decode().partition('|')
+        return datetime.fromisoformat(created_at), UUID(reference_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f'Invalid cursor: {cursor}') from e
+
+
 class FileService:
     """文件服务
 
@@ -100,13 +123,14 @@ class FileService:
             await self.session.commit()
             await self.session.refresh(file_reference)
 
-            logger.info(
-                'File uploaded successfully',
-                file_id=str(file_reference.file_id),
-                filename=file.filename,
-                size=file_size,
-                storage_type=storage_type,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    'File uploaded successfully',
+                    file_id=str(file_reference.file_id),
+                    filename=file.filename,
+                    size=file_size,
+                    storage_type=storage_type,
+                )
 
             return file_reference
 
@@ -156,16 +180,32 @@ class FileService:
             raise StorageFileNotFoundError(str(file_id))
 
         # 2. 从 GridFS 下载文件流
-        file_stream = self.storage.download(file_reference.mongo_id)
+        file_stream = self.stream_file(file_reference)
 
-        logger.info(
-            'File download started',
-            file_id=str(file_id),
-            filename=file_reference.filename,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'File download started',
+                file_id=str(file_id),
+                filename=file_reference.filename,
+            )
 
         return file_reference, file_stream
 
+    def stream_file(
+        self, file_reference: FileReference, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """打开已查询到的文件的内容流（可指定字节区间，用于 Range 请求）
+
+        Args:
+            file_reference: 文件引用记录
+            start: 起始字节偏移（含）
+            end: 结束字节偏移（含），None 表示读到文件末尾
+
+        Returns:
+            AsyncGenerator[bytes, None]: 文件内容流
+        """
+        return self.storage.download(file_reference.mongo_id, start, end)
+
     async def delete_file(self, file_id: UUID) -> bool:
         """删除文件
 
@@ -263,6 +303,79 @@ class FileService:
         result = await self.session.execute(statement)
         return list(result.scalars().all())
 
+    async def list_files_with_count(
+        self,
+        workspace_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[FileReference], int]:
+        """列出工作空间的文件，并在同一条查询中返回总数（COUNT(*) OVER()）
+
+        Args:
+            workspace_id: 工作空间 ID
+            limit: 返回数量限制
+            offset: 偏移量
+
+        Returns:
+            tuple: (文件列表, 工作空间文件总数)
+        """
+        statement = (
+            select(FileReference, func.count().over().label('total'))
+            .where(FileReference.workspace_id == workspace_id)
+            .order_by(FileReference.created_at.desc(), FileReference.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = (await self.session.execute(statement)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+
+        # 偏移量超出范围时没有行携带窗口计数，单独查询总数
+        count_statement = (
+            select(func.count())
+            .select_from(FileReference)
+            .where(FileReference.workspace_id == workspace_id)
+        )
+        total = (await self.session.execute(count_statement)).scalar_one()
+        return [], total
+
+    async def list_files_keyset(
+        self,
+        workspace_id: UUID,
+        after: Optional[str] = None,
+        limit: int = 100,
+    ) -> tuple[list[FileReference], Optional[str]]:
+        """按 (created_at, id) 游标分页列出文件，翻页深度不影响查询代价
+
+        Args:
+            workspace_id: 工作空间 ID
+            after: 上一页返回的游标，None 表示第一页
+            limit: 返回数量限制
+
+        Returns:
+            tuple: (文件列表, 下一页游标；没有更多数据时为 None)
+
+        Raises:
+            ValueError: 游标格式无效
+        """
+        statement = select(FileReference).where(FileReference.workspace_id == workspace_id)
+        if after:
+            after_ts, after_id = decode_cursor(after)
+            statement = statement.where(
+                tuple_(FileReference.created_at, FileReference.id) < tuple_(after_ts, after_id)
+            )
+        statement = statement.order_by(
+            FileReference.created_at.desc(), FileReference.id.desc()
+        ).limit(limit + 1)
+
+        files = list((await self.session.execute(statement)).scalars().all())
+        if len(files) <= limit:
+            return files, None
+        files = files[:limit]
+        return files, encode_cursor(files[-1])
+
     async def check_file_exists(self, file_id: UUID) -> bool:
         """检查文件是否存在
 
@@ -9,7 +9,6 @@ Description:用户管理服务
 
 from typing import Optional
 from uuid import UUID
-from datetime import datetime
 
 from fastapi import UploadFile, HTTPException, status
 from sqlmodel import select
@@ -18,6 +17,7 @@ from passlib.context import CryptContext
 
 from app.models.auth.user import User
 from app.schemas.user import UserUpdateRequest
+from app.utils.time import utcnow
 
 
 pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
@@ -60,7 +60,7 @@ class UserService:
         if update_data.email is not None:
             user.email = update_data.email
 
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
 
         self.session.add(user)
         await self.session.commit()
@@ -75,7 +75,7 @@ class UserService:
 
         # 设置新密码
         user.password_hash = pwd_context.hash(new_password)
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
 
         self.session.add(user)
         await self.session.commit()
@@ -103,7 +103,7 @@ class UserService:
         avatar_url = f'https://example.com/avatars/{user.id}.jpg'
 
         user.avatar_url = avatar_url
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
 
         self.session.add(user)
         await self.session.commit()
@@ -114,7 +114,7 @@ class UserService:
     async def soft_delete_user(self, user: User) -> bool:
         """软删除用户"""
         user.soft_delete()
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
 
         self.session.add(user)
         await self.session.commit()
@@ -129,7 +129,7 @@ class UserService:
 
         if user:
             user.restore()
-            user.updated_at = datetime.utcnow()
+            user.updated_at = utcnow()
             self.session.add(user)
             await self.session.commit()
             await self.session.refresh(user)
@@ -12,10 +12,12 @@ including validation and serialization functionality.
 Copyright (c) 2025 by Senthie email: seemoon2077@gmail.com, All Rights Reserved.
 """
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.models.workflow.workflow import Connection, ExecutionRecord, Node, Workflow
@@ -122,6 +124,31 @@ class WorkflowService:
 
         return workflow
 
+    async def get_workflow_with_graph(self, workflow_id: UUID) -> Workflow:
+        """Get a workflow by ID with its nodes and connections eagerly loaded.
+
+        Args:
+            workflow_id: ID of the workflow
+
+        Returns:
+            Workflow object with ``nodes`` and ``connections`` populated
+
+        Raises:
+            WorkflowNotFoundError: If workflow is not found
+        """
+        statement = (
+            select(Workflow)
+            .where(Workflow.id == workflow_id)
+            .where(~Workflow.is_deleted)
+            .options(selectinload(Workflow.nodes), selectinload(Workflow.connections))
+        )
+        result = await self.db.execute(statement)
+        workflow = result.scalar_one_or_none()
+        if workflow is None:
+            raise WorkflowNotFoundError(f'Workflow {workflow_id} not found')
+
+        return workflow
+
     async def list_workflows(
         self, workspace_id: UUID, skip: int = 0, limit: int = 100
     ) -> tuple[List[Workflow], int]:
@@ -191,7 +218,7 @@ class WorkflowService:
 
         return workflow
 
-    async def delete_workflow(self, workflow_id: UUID) -> None:
+    async def delete_workflow(self, workflow_id: UUID) -> Workflow:
         """Delete a workflow and all its associated data.
 
         This performs a soft delete on the workflow and cascades to:
@@ -202,6 +229,9 @@ class WorkflowService:
         Args:
             workflow_id: ID of the workflow
 
+        Returns:
+            The soft-deleted workflow
+
         Raises:
             WorkflowNotFoundError: If workflow is not found
         """
@@ -228,6 +258,7 @@ class WorkflowService:
             await self.db.delete(record)
 
         await self.db.commit()
+        return workflow
 
     # ========================================================================
     # Node Management Operations
@@ -270,6 +301,53 @@ class WorkflowService:
 
         return node
 
+    async def bulk_add_nodes(
+        self, workflow_id: UUID, nodes_data: List[NodeCreateRequest]
+    ) -> List[Node]:
+        """Add several nodes to a workflow in one transaction.
+
+        All nodes are validated first; if any is invalid nothing is written.
+        The IDs are generated client-side, so the unit of work sends every row
+        in a single multi-row INSERT.
+
+        Args:
+            workflow_id: ID of the workflow
+            nodes_data: Node creation data, in request order
+
+        Returns:
+            Created Node objects, in request order
+
+        Raises:
+            WorkflowNotFoundError: If workflow is not found
+            WorkflowValidationError: If any node configuration is invalid
+        """
+        # Verify workflow exists
+        await self.get_workflow(workflow_id)
+
+        nodes = [
+            Node(
+                workflow_id=workflow_id,
+                type=node_data.type,
+                name=node_data.name,
+                config=node_data.config,
+                position=node_data.position,
+            )
+            for node_data in nodes_data
+        ]
+
+        # Validate every node before writing any of them
+        validation_result = ValidationResult(is_valid=True)
+        for index, node in enumerate(nodes):
+            for error in self.validator.validate_node_config(node).errors:
+                validation_result.add_error(f'nodes[{index}]: {error}')
+        if not validation_result.is_valid:
+            raise WorkflowValidationError(validation_result)
+
+        self.db.add_all(nodes)
+        await self.db.commit()
+
+        return nodes
+
     async def get_node(self, node_id: UUID) -> Node:
         """Get a node by ID.
 
@@ -288,6 +366,22 @@ class WorkflowService:
 
         return node
 
+    async def get_node_or_none(self, workflow_id: UUID, node_id: UUID) -> Optional[Node]:
+        """Get a node by ID, scoped to the workflow it must belong to.
+
+        Args:
+            workflow_id: ID of the workflow
+            node_id: ID of the node
+
+        Returns:
+            Node object, or None if it is not found in the workflow
+        """
+        statement = select(Node).where(
+            Node.id == node_id, Node.workflow_id == workflow_id, ~Node.is_deleted
+        )
+        result = await self.db.execute(statement)
+        return result.scalar_one_or_none()
+
     async def list_nodes(self, workflow_id: UUID) -> List[Node]:
         """List all nodes in a workflow.
 
@@ -301,12 +395,15 @@ class WorkflowService:
         result = await self.db.execute(statement)
         return list(result.scalars().all())
 
-    async def update_node(self, node_id: UUID, node_data: NodeUpdateRequest) -> Node:
+    async def update_node(
+        self, node_id: UUID, node_data: NodeUpdateRequest, workflow_id: Optional[UUID] = None
+    ) -> Node:
         """Update a node.
 
         Args:
             node_id: ID of the node
             node_data: Node update data
+            workflow_id: If given, the node must belong to this workflow
 
         Returns:
             Updated Node object
@@ -315,23 +412,42 @@ class WorkflowService:
             NodeNotFoundError: If node is not found
             WorkflowValidationError: If updated configuration is invalid
         """
-        node = await self.get_node(node_id)
+        values = node_data.model_dump(exclude_none=True)
+        if not values:
+            if workflow_id is None:
+                return await self.get_node(node_id)
+            node = await self.get_node_or_none(workflow_id, node_id)
+            if node is None:
+                raise NodeNotFoundError(f'Node {node_id} not found in workflow {workflow_id}')
+            return node
+
+        # One round trip: the WHERE clause doubles as the existence/ownership check and
+        # RETURNING gives the updated row (type included) for validation
+        statement = (
+            update(Node)
+            .where(Node.id == node_id, ~Node.is_deleted)
+            .values(**values)
+            .returning(Node)
+            .execution_options(populate_existing=True)
+        )
+        if workflow_id is not None:
+            statement = statement.where(Node.workflow_id == workflow_id)
 
-        # Update fields
-        if node_data.name is not None:
-            node.name = node_data.name
-        if node_data.config is not None:
-            node.config = node_data.config
-        if node_data.position is not None:
-            node.position = node_data.position
-
-        # Validate updated configuration
+        result = await self.db.execute(statement)
+        node = result.scalar_one_or_none()
+        if node is None:
+            await self.db.rollback()
+            if workflow_id is None:
+                raise NodeNotFoundError(f'Node {node_id} not found')
+            raise NodeNotFoundError(f'Node {node_id} not found in workflow {workflow_id}')
+
+        # Validate updated configuration; roll the UPDATE back if it is invalid
         validation_result = self.validator.validate_node_config(node)
         if not validation_result.is_valid:
+            await self.db.rollback()
             raise WorkflowValidationError(validation_result)
 
         await self.db.commit()
-        await self.db.refresh(node)
 
         return node
 
@@ -339,7 +455,8 @@ class WorkflowService:
         """Delete a node from a workflow.
 
         This performs a soft delete on the node and removes all connections
-        involving this node.
+        involving this node. Callers that must check workflow ownership look the
+        node up with get_node_or_none first.
 
         Args:
             node_id: ID of the node
@@ -414,6 +531,49 @@ class WorkflowService:
 
         return connection
 
+    async def bulk_connect_nodes(
+        self, workflow_id: UUID, connections_data: List[ConnectionCreateRequest]
+    ) -> List[Connection]:
+        """Create several connections in one transaction.
+
+        Node membership is checked with one query and the cycle check runs once
+        over the existing and new edges together; if any connection is invalid
+        nothing is written.
+
+        Args:
+            workflow_id: ID of the workflow
+            connections_data: Connection creation data, in request order
+
+        Returns:
+            Created Connection objects, in request order
+
+        Raises:
+            WorkflowNotFoundError: If workflow is not found
+            WorkflowValidationError: If a node is missing or the connections create a cycle
+        """
+        # Verify workflow exists
+        await self.get_workflow(workflow_id)
+
+        connections = [
+            Connection(
+                workflow_id=workflow_id,
+                source_node_id=connection_data.source_node_id,
+                target_node_id=connection_data.target_node_id,
+                source_output=connection_data.source_output,
+                target_input=connection_data.target_input,
+            )
+            for connection_data in connections_data
+        ]
+
+        validation_result = await self.validator.validate_connections(workflow_id, connections)
+        if not validation_result.is_valid:
+            raise WorkflowValidationError(validation_result)
+
+        self.db.add_all(connections)
+        await self.db.commit()
+
+        return connections
+
     async def get_connection(self, connection_id: UUID) -> Connection:
         """Get a connection by ID.
 
@@ -432,6 +592,24 @@ class WorkflowService:
 
         return connection
 
+    async def get_connection_or_none(
+        self, workflow_id: UUID, connection_id: UUID
+    ) -> Optional[Connection]:
+        """Get a connection by ID, scoped to the workflow it must belong to.
+
+        Args:
+            workflow_id: ID of the workflow
+            connection_id: ID of the connection
+
+        Returns:
+            Connection object, or None if it is not found in the workflow
+        """
+        statement = select(Connection).where(
+            Connection.id == connection_id, Connection.workflow_id == workflow_id
+        )
+        result = await self.db.execute(statement)
+        return result.scalar_one_or_none()
+
     async def list_connections(self, workflow_id: UUID) -> List[Connection]:
         """List all connections in a workflow.
 
@@ -448,6 +626,9 @@ class WorkflowService:
     async def delete_connection(self, connection_id: UUID) -> None:
         """Delete a connection.
 
+        Callers that must check workflow ownership look the connection up with
+        get_connection_or_none first.
+
         Args:
             connection_id: ID of the connection
 
@@ -134,8 +134,8 @@ class WorkflowValidator:
                     f'Connection references non-existent target node: {connection.target_node_id}'
                 )
 
-        # Check for cyclic dependencies
-        if not await self.check_cyclic_dependency(workflow_id):
+        # Check for cyclic dependencies (reuse the connections loaded above)
+        if self._has_cycle(connections):
             result.add_error('Workflow contains cyclic dependencies')
 
         return result
@@ -154,14 +154,21 @@ class WorkflowValidator:
         connections_result = await self.db.execute(connections_statement)
         connections = connections_result.scalars().all()
 
-        # Build adjacency list
-        connection_tuples = [(conn.source_node_id, conn.target_node_id) for conn in connections]
-        adjacency_list = build_adjacency_list(connection_tuples)
+        return not self._has_cycle(connections)
 
-        # Check for cycles
-        has_cycle = detect_cycle(adjacency_list)
+    @staticmethod
+    def _has_cycle(connections: List[Connection]) -> bool:
+        """Check already-loaded connections for a cycle.
+
+        Args:
+            connections: Connections of a single workflow
 
-        return not has_cycle
+        Returns:
+            True if the connections contain a cycle
+        """
+        connection_tuples = [(conn.source_node_id, conn.target_node_id) for conn in connections]
+        adjacency_list = build_adjacency_list(connection_tuples)
+        return detect_cycle(adjacency_list)
 
     def validate_node_config(self, node: Node) -> ValidationResult:
         """Validate a node's configuration.
@@ -363,3 +370,54 @@ class WorkflowValidator:
             result.add_error('Connection would create a cycle in the workflow')
 
         return result
+
+    async def validate_connections(
+        self, workflow_id: UUID, connections: List[Connection]
+    ) -> ValidationResult:
+        """Validate a batch of new connections for one workflow.
+
+        Same checks as validate_connection, but node membership is looked up with
+        a single query and the cycle check runs once over all edges.
+
+        Args:
+            workflow_id: ID of the workflow
+            connections: New (not yet persisted) connections
+
+        Returns:
+            ValidationResult indicating if all connections are valid
+        """
+        result = ValidationResult(is_valid=True)
+
+        # Check all referenced nodes exist in this workflow
+        node_ids = {conn.source_node_id for conn in connections}
+        node_ids.update(conn.target_node_id for conn in connections)
+        nodes_statement = select(Node.id).where(
+            Node.workflow_id == workflow_id, Node.id.in_(node_ids), ~Node.is_deleted
+        )
+        nodes_result = await self.db.execute(nodes_statement)
+        missing = node_ids - set(nodes_result.scalars().all())
+
+        for index, conn in enumerate(connections):
+            if conn.source_node_id in missing:
+                result.add_error(
+                    f'connections[{index}]: Source node {conn.source_node_id} '
+                    f'not found in workflow {workflow_id}'
+                )
+            if conn.target_node_id in missing:
+                result.add_error(
+                    f'connections[{index}]: Target node {conn.target_node_id} '
+                    f'not found in workflow {workflow_id}'
+                )
+
+        if not result.is_valid:
+            return result
+
+        # Check existing plus new connections for a cycle
+        connections_statement = select(Connection).where(Connection.workflow_id == workflow_id)
+        connections_result = await self.db.execute(connections_statement)
+        existing = connections_result.scalars().all()
+
+        if self._has_cycle([*existing, *connections]):
+            result.add_error('Connections would create a cycle in the workflow')
+
+        return result
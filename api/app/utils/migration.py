@@ -0,0 +1,428 @@
+"""Helpers shared by Alembic revisions.
+
+These wrap ``alembic.op`` so that revisions can emit PostgreSQL-specific DDL
+(e.g. ``CREATE INDEX CONCURRENTLY``) while still running on other dialects.
+"""
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import Column
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn, ExecutableDDLElement
+
+# SQLSTATE raised when lock_timeout expires
+_LOCK_NOT_AVAILABLE = '55P03'
+
+# Fixed signed 64-bit key for pg_advisory_lock, shared by every replica.
+MIGRATION_LOCK_KEY = int.from_bytes(
+    hashlib.sha256(b'aafflux_migrations').digest()[:8], 'big', signed=True
+)
+
+
+@contextmanager
+def migration_lock(
+    connection: Connection,
+    timeout: float = 300.0,
+    max_delay: float = 5.0,
+) -> Iterator[None]:
+    """Hold a PostgreSQL session advisory lock while migrations run.
+
+    Replicas that boot together would otherwise race on the same DDL. The lock
+    is polled with ``pg_try_advisory_lock`` and exponential backoff; a replica
+    that waited simply finds ``alembic_version`` already at head and the upgrade
+    becomes a no-op. Non-PostgreSQL connections are not locked.
+
+    Args:
+        connection: Connection Alembic will run the migrations on
+        timeout: Seconds to wait for the lock before giving up
+        max_delay: Upper bound for the backoff between attempts
+
+    Raises:
+        TimeoutError: If the lock could not be acquired within ``timeout``
+    """
+    if connection.dialect.name != 'postgresql':
+        yield
+        return
+
+    params = {'key': MIGRATION_LOCK_KEY}
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while not connection.execute(
+        sa.text('SELECT pg_try_advisory_lock(:key)'), params
+    ).scalar():
+        if time.monotonic() >= deadline:
+            connection.rollback()
+            raise TimeoutError(f'Could not acquire migration lock within {timeout}s')
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+    # The lock is session-level; end the autobegun transaction so Alembic starts clean.
+    connection.commit()
+
+    try:
+        yield
+    finally:
+        connection.rollback()
+        connection.execute(sa.text('SELECT pg_advisory_unlock(:key)'), params)
+        connection.commit()
+
+
+def _dialect_name() -> str:
+    """Return the dialect name of the current migration context.
+
+    Uses the migration context rather than ``op.get_bind()`` so that it also
+    works in offline (``--sql``) mode where there is no bind.
+    """
+    return op.get_context().dialect.name
+
+
+def _is_postgresql() -> bool:
+    """Return True when the current migration dialect is PostgreSQL."""
+    return _dialect_name() == 'postgresql'
+
+
+def _quote(name: str) -> str:
+    """Quote an identifier using the current migration dialect."""
+    return op.get_context().dialect.identifier_preparer.quote(name)
+
+
+def execute_ddl_batch(elements: Iterable[ExecutableDDLElement]) -> None:
+    """Send several DDL statements to the database in one round-trip.
+
+    On PostgreSQL each element is compiled and the results are joined into a
+    single ``op.execute`` call, so the server receives one multi-statement string
+    instead of one request per statement. Other dialects execute the elements
+    one by one.
+
+    Args:
+        elements: DDL constructs such as ``CreateTable`` or ``CreateIndex``
+    """
+    if not _is_postgresql():
+        for element in elements:
+            op.execute(element)
+        return
+
+    dialect = op.get_context().dialect
+    statements = [str(element.compile(dialect=dialect)).strip() for element in elements]
+    if statements:
+        op.execute(';\n'.join(statements))
+
+
+def set_local_timeouts(lock_timeout: str = '3s', statement_timeout: str = '30s') -> None:
+    """Bound how long DDL in the current transaction may wait or run.
+
+    Without ``lock_timeout`` an ``ALTER TABLE`` queued behind a long-running query
+    holds its pending lock indefinitely and blocks every writer behind it. The
+    settings are ``SET LOCAL`` and end with the current transaction. No-op on
+    other dialects.
+
+    Args:
+        lock_timeout: Maximum time to wait for a lock, e.g. ``'3s'``
+        statement_timeout: Maximum time a single statement may run
+    """
+    if not _is_postgresql():
+        return
+    op.execute(f"SET LOCAL lock_timeout = '{lock_timeout}'")
+    op.execute(f"SET LOCAL statement_timeout = '{statement_timeout}'")
+
+
+def defer_constraints() -> None:
+    """Defer deferrable constraint checks to the end of the current transaction.
+
+    Intended as the first statement of data-migration revisions (bulk inserts,
+    batched updates): deferrable foreign keys are then verified once at commit
+    instead of row by row. Constraints not declared ``DEFERRABLE`` are
+    unaffected. No-op on other dialects.
+    """
+    if not _is_postgresql():
+        return
+    op.execute('SET CONSTRAINTS ALL DEFERRED')
+
+
+def batched_update(
+    table_name: str,
+    set_sql: str,
+    where: str,
+    *,
+    batch_size: int = 5000,
+) -> int:
+    """Backfill a large table in bounded batches.
+
+    Each batch updates at most ``batch_size`` rows picked with
+    ``FOR UPDATE SKIP LOCKED``, so concurrent workers can share the backfill and
+    no batch waits on another. Must be called within
+    ``op.get_context().autocommit_block()``, so that every batch commits on its
+    own: locks are released promptly and WAL/memory stay bounded. ``set_sql``
+    must make the updated rows stop matching ``where``, otherwise the loop never
+    ends. In offline mode a single unbatched UPDATE is emitted.
+
+    Args:
+        table_name: Table to update
+        set_sql: SQL for the SET clause, e.g. ``"duration_ms = ..."``
+        where: SQL predicate selecting rows that still need the update
+        batch_size: Maximum rows per batch
+
+    Returns:
+        Number of rows updated (0 in offline mode)
+    """
+    table = _quote(table_name)
+    if op.get_context().as_sql:
+        op.execute(f'UPDATE {table} SET {set_sql} WHERE {where}')
+        return 0
+
+    lock_clause = ' FOR UPDATE SKIP LOCKED' if _is_postgresql() else ''
+    statement = sa.text(
+        f'UPDATE {table} SET {set_sql} WHERE id IN '
+        f'(SELECT id FROM {table} WHERE {where} LIMIT :batch_size{lock_clause})'
+    )
+    bind = op.get_bind()
+    total = 0
+    while True:
+        updated = bind.execute(statement, {'batch_size': batch_size}).rowcount
+        total += updated
+        if updated < batch_size:
+            return total
+
+
+def run_with_lock_retry(
+    step: Callable[[], None],
+    *,
+    attempts: int = 5,
+    delay: float = 1.0,
+) -> None:
+    """Run a DDL step in a savepoint, retrying when it hits ``lock_timeout``.
+
+    A lock timeout only rolls back to the savepoint, so one busy table does not
+    abort the whole migration; the step is retried after a linear backoff.
+    Offline mode and other dialects run the step once.
+
+    Args:
+        step: Callable issuing the DDL through ``op``
+        attempts: Maximum number of tries
+        delay: Base sleep between tries in seconds
+
+    Raises:
+        sqlalchemy.exc.OperationalError: If the last attempt still times out
+    """
+    if not _is_postgresql() or op.get_context().as_sql:
+        step()
+        return
+
+    for attempt in range(1, attempts + 1):
+        op.execute('SAVEPOINT lock_retry')
+        try:
+            step()
+        except sa.exc.OperationalError as e:
+            if getattr(e.orig, 'pgcode', None) != _LOCK_NOT_AVAILABLE or attempt == attempts:
+                raise
+            op.execute('ROLLBACK TO SAVEPOINT lock_retry')
+            time.sleep(delay * attempt)
+        else:
+            op.execute('RELEASE SAVEPOINT lock_retry')
+            return
+
+
+def drop_tables(*table_names: str) -> None:
+    """Drop several tables with one ``DROP TABLE`` statement.
+
+    PostgreSQL drops them in a single catalog pass and lock cycle; ``CASCADE``
+    removes dependent objects so the order of ``table_names`` does not matter.
+    Other dialects fall back to one ``op.drop_table`` per table.
+
+    Args:
+        table_names: Tables to drop
+    """
+    if not _is_postgresql():
+        for table_name in table_names:
+            op.drop_table(table_name)
+        return
+
+    op.execute(f'DROP TABLE IF EXISTS {", ".join(_quote(name) for name in table_names)} CASCADE')
+
+
+def add_columns(table_name: str, *columns: Column) -> None:
+    """Add several columns to a table with a single ``ALTER TABLE``.
+
+    PostgreSQL applies all ``ADD COLUMN`` clauses under one lock acquisition and
+    one catalog pass; since PG 11 a constant default is metadata-only, so no
+    table rewrite happens either. Other dialects fall back to one
+    ``op.add_column`` per column.
+
+    Args:
+        table_name: Table to alter
+        columns: Columns to add
+    """
+    if not _is_postgresql():
+        for column in columns:
+            op.add_column(table_name, column)
+        return
+
+    dialect = op.get_context().dialect
+    clauses = ', '.join(
+        f'ADD COLUMN {CreateColumn(column).compile(dialect=dialect)}' for column in columns
+    )
+    op.execute(f'ALTER TABLE {_quote(table_name)} {clauses}')
+
+
+def drop_columns(table_name: str, *column_names: str) -> None:
+    """Drop several columns from a table with a single ``ALTER TABLE``.
+
+    Args:
+        table_name: Table to alter
+        column_names: Names of the columns to drop
+    """
+    if not _is_postgresql():
+        for column_name in column_names:
+            op.drop_column(table_name, column_name)
+        return
+
+    clauses = ', '.join(f'DROP COLUMN {_quote(name)}' for name in column_names)
+    op.execute(f'ALTER TABLE {_quote(table_name)} {clauses}')
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+    where: Optional[str] = None,
+    include: Sequence[str] = (),
+    using: Optional[str] = None,
+    ops: Optional[Dict[str, str]] = None,
+) -> None:
+    """Create an index without blocking writers on PostgreSQL.
+
+    ``CREATE INDEX CONCURRENTLY`` cannot run inside a transaction block, so the
+    caller must invoke this within ``op.get_context().autocommit_block()``.
+    ``IF NOT EXISTS`` makes a retried revision pick up where it failed.
+    Other dialects fall back to a plain ``op.create_index``.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table to index
+        columns: Indexed column names
+        unique: Whether to create a unique index
+        where: Optional SQL predicate that makes this a partial index
+        include: Non-key columns stored in the index (``INCLUDE``) for index-only scans
+        using: Index access method, e.g. ``'gin'`` (defaults to btree)
+        ops: Column name -> operator class, e.g. ``{'config': 'jsonb_path_ops'}``
+    """
+    if not _is_postgresql():
+        op.create_index(
+            index_name,
+            table_name,
+            list(columns),
+            unique=unique,
+            sqlite_where=sa.text(where) if where else None,
+        )
+        return
+
+    op.execute(
+        _create_index_concurrently_sql(
+            index_name,
+            table_name,
+            columns,
+            unique=unique,
+            where=where,
+            include=include,
+            using=using,
+            ops=ops,
+        )
+    )
+
+
+def _create_index_concurrently_sql(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    unique: bool = False,
+    where: Optional[str] = None,
+    include: Sequence[str] = (),
+    using: Optional[str] = None,
+    ops: Optional[Dict[str, str]] = None,
+) -> str:
+    """Render the PostgreSQL ``CREATE INDEX CONCURRENTLY`` statement."""
+    ops = ops or {}
+    column_list = ', '.join(
+        f'{_quote(column)} {ops[column]}' if column in ops else _quote(column)
+        for column in columns
+    )
+    include_list = ', '.join(_quote(column) for column in include)
+    method = f' USING {using}' if using else ''
+    covering = f' INCLUDE ({include_list})' if include else ''
+    predicate = f' WHERE {where}' if where else ''
+    return (
+        f'CREATE {"UNIQUE " if unique else ""}INDEX CONCURRENTLY IF NOT EXISTS '
+        f'{_quote(index_name)} ON {_quote(table_name)}{method} ({column_list})'
+        f'{covering}{predicate}'
+    )
+
+
+def create_indexes_concurrently(
+    indexes: Sequence[Dict[str, Any]],
+    *,
+    max_workers: int = 4,
+) -> None:
+    """Build several indexes concurrently on PostgreSQL, in parallel across tables.
+
+    Each entry holds the keyword arguments of :func:`create_index_concurrently`.
+    Concurrent builds on the same table wait for each other, so the indexes are
+    grouped by table: each table's indexes are built one after another on its
+    own autocommit connection from the migration engine, and up to
+    ``max_workers`` tables are indexed at once. Offline mode and other dialects
+    build them one by one. Must be called within
+    ``op.get_context().autocommit_block()``.
+
+    Args:
+        indexes: Index definitions, e.g. ``{'index_name': ..., 'table_name': ...,
+            'columns': [...]}``
+        max_workers: Number of tables indexed at once
+    """
+    if not _is_postgresql() or op.get_context().as_sql or max_workers <= 1:
+        for index in indexes:
+            create_index_concurrently(**index)
+        return
+
+    statements_by_table: Dict[str, List[str]] = {}
+    for index in indexes:
+        statements_by_table.setdefault(index['table_name'], []).append(
+            _create_index_concurrently_sql(**index)
+        )
+    if len(statements_by_table) <= 1:
+        for index in indexes:
+            create_index_concurrently(**index)
+        return
+
+    engine = op.get_bind().engine
+
+    def build(statements: List[str]) -> None:
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            for statement in statements:
+                connection.execute(sa.text(statement))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(statements_by_table))) as pool:
+        # list() re-raises the first failure; IF NOT EXISTS makes a rerun resume
+        list(pool.map(build, statements_by_table.values()))
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index without blocking writers on PostgreSQL.
+
+    Must be called within ``op.get_context().autocommit_block()``.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table the index belongs to
+    """
+    if not _is_postgresql():
+        op.drop_index(index_name, table_name=table_name)
+        return
+
+    op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {_quote(index_name)}')
@@ -0,0 +1,17 @@
+"""时间工具"""
+
+from datetime import datetime, timezone
+
+_UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """当前 UTC 时间（带时区）。
+
+    datetime.utcnow() 返回无时区的时间且在 Python 3.12 中已弃用；写入 timestamptz 列
+    和 MongoDB 时使用本函数。仍为 timestamp without time zone 的列不能写入带时区的值。
+
+    Returns:
+        带 UTC 时区的当前时间
+    """
+    return datetime.now(_UTC)
@@ -1,11 +1,19 @@
 """JWT token generation and verification utilities."""
 
 import jwt
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional, Dict, Any
 from uuid import UUID
 
 from app.core.config import settings
+from app.utils.time import utcnow
+
+# Settings are fixed for the process lifetime; resolve them once instead of per token.
+_ACCESS_TOKEN_LIFETIME = timedelta(minutes=settings.access_token_expire_minutes)
+_REFRESH_TOKEN_LIFETIME = timedelta(days=settings.refresh_token_expire_days)
+_JWT_SECRET_KEY = settings.jwt_secret_key
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
 
 
 class TokenType:
@@ -26,17 +34,18 @@ def generate_access_token(user_id: UUID, additional_claims: Optional[Dict[str, A
     Returns:
         Encoded JWT access token
     """
+    now = utcnow()
     payload = {
         'user_id': str(user_id),
         'type': TokenType.ACCESS,
-        'exp': datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes),
-        'iat': datetime.utcnow(),
+        'exp': now + _ACCESS_TOKEN_LIFETIME,
+        'iat': now,
     }
 
     if additional_claims:
         payload.update(additional_claims)
 
-    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    token = jwt.encode(payload, _JWT_SECRET_KEY, algorithm=_JWT_ALGORITHM)
     return token
 
 
@@ -50,14 +59,15 @@ def generate_refresh_token(user_id: UUID) -> str:
     Returns:
         Encoded JWT refresh token
     """
+    now = utcnow()
     payload = {
         'user_id': str(user_id),
         'type': TokenType.REFRESH,
-        'exp': datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days),
-        'iat': datetime.utcnow(),
+        'exp': now + _REFRESH_TOKEN_LIFETIME,
+        'iat': now,
     }
 
-    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    token = jwt.encode(payload, _JWT_SECRET_KEY, algorithm=_JWT_ALGORITHM)
     return token
 
 
@@ -73,7 +83,7 @@ def verify_token(token: str, token_type: Optional[str] = None) -> Optional[Dict[
         Token payload if valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, _JWT_SECRET_KEY, algorithms=_JWT_ALGORITHMS)
 
         # Verify token type if specified
         if token_type and payload.get('type') != token_type:
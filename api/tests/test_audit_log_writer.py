@@ -0,0 +1,52 @@
+"""
+Tests for AuditLogWriter's batching and shutdown.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.services.audit_log_writer import AuditLogWriter
+
+
+def _writer(**kwargs) -> tuple[AuditLogWriter, list[list[dict]]]:
+    """A writer whose flushes are recorded instead of inserted."""
+    writer = AuditLogWriter(**kwargs)
+    batches: list[list[dict]] = []
+
+    async def flush(batch):
+        batches.append(batch)
+
+    writer._flush = flush
+    return writer, batches
+
+
+def _record(writer: AuditLogWriter, count: int) -> None:
+    """Queue count audit log entries."""
+    for _ in range(count):
+        writer.record(action='UPDATE', resource_type='WORKFLOW', workspace_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_queued_entries():
+    """Test entries queued before stop are written in batches of batch_size."""
+    writer, batches = _writer(batch_size=2, flush_interval=0.01, max_queue_size=10)
+    writer.start()
+    _record(writer, 5)
+
+    await writer.stop()
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_stop_with_full_queue_does_not_block():
+    """Test stop returns when the queue has no room for the stop signal."""
+    writer, batches = _writer(batch_size=2, flush_interval=0.01, max_queue_size=3)
+    writer.start()
+    _record(writer, 3)  # the writer task has not run yet, so the queue is full
+
+    await asyncio.wait_for(writer.stop(), timeout=1)
+
+    assert sum(len(batch) for batch in batches) == 3
@@ -0,0 +1,39 @@
+"""
+Tests for ApprovalService.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.engine.bpm import TaskNotFoundError
+from app.services.bpm_approval_service import ApprovalService
+
+
+@pytest.mark.asyncio
+async def test_approve_nonexistent_task_raises(test_session):
+    """Test approving a missing task raises TaskNotFoundError (mapped to 404)."""
+    service = ApprovalService(test_session)
+
+    with pytest.raises(TaskNotFoundError):
+        await service.approve_task(
+            task_id=uuid4(),
+            user_id=uuid4(),
+            user_name='Approver',
+            workspace_id=uuid4(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_reject_nonexistent_task_raises(test_session):
+    """Test rejecting a missing task raises TaskNotFoundError (mapped to 404)."""
+    service = ApprovalService(test_session)
+
+    with pytest.raises(TaskNotFoundError):
+        await service.reject_task(
+            task_id=uuid4(),
+            user_id=uuid4(),
+            user_name='Approver',
+            comment='No',
+            workspace_id=uuid4(),
+        )
@@ -0,0 +1,155 @@
+"""
+Tests for the BPM process executor and task event worker.
+
+Completing a task only writes the task row and a completed event; the
+TaskEventWorker consumes the event and advances the process instance.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlmodel import select
+
+from app.engine.bpm import ProcessExecutor, TaskNotActiveError, TaskNotFoundError
+from app.engine.bpm.event_worker import TaskEventWorker
+from app.models.bpm import (
+    ProcessDefinition,
+    ProcessStatus,
+    Task,
+    TaskEvent,
+    TaskEventStatus,
+    TaskStatus,
+)
+
+
+async def _start_process(session):
+    """Create a one-task process definition and start an instance of it."""
+    workspace_id = uuid4()
+    user_id = uuid4()
+    definition = ProcessDefinition(
+        key=f'test_{uuid4().hex}',
+        name='Test Process',
+        nodes=[
+            {'id': 'start', 'type': 'start', 'name': 'Start'},
+            {'id': 'approval', 'type': 'user_task', 'name': 'Approval'},
+            {'id': 'end', 'type': 'end', 'name': 'End'},
+        ],
+        workspace_id=workspace_id,
+        created_by=user_id,
+    )
+    session.add(definition)
+    await session.commit()
+
+    executor = ProcessExecutor(session)
+    instance = await executor.start_process(definition.key, workspace_id, user_id, {})
+    task = (
+        await session.execute(select(Task).where(Task.process_instance_id == instance.id))
+    ).scalar_one()
+    return executor, instance, task, user_id
+
+
+@pytest.mark.asyncio
+async def test_start_process_creates_first_task(test_session):
+    """Test starting a process creates the first user task and waits on it."""
+    _, instance, task, _ = await _start_process(test_session)
+
+    assert instance.status == ProcessStatus.WAITING
+    assert instance.current_node_id == 'approval'
+    assert task.status == TaskStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_complete_task_writes_event(test_session):
+    """Test completing a task updates it and queues one completed event."""
+    executor, instance, task, user_id = await _start_process(test_session)
+
+    completed = await executor.complete_task(task.id, user_id, {'approved': True})
+    await test_session.commit()
+
+    assert completed.status == TaskStatus.COMPLETED
+    assert completed.result == {'approved': True}
+    events = (
+        await test_session.execute(select(TaskEvent).where(TaskEvent.task_id == task.id))
+    ).scalars().all()
+    assert len(events) == 1
+    assert events[0].process_instance_id == instance.id
+    assert events[0].status == TaskEventStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_complete_task_twice_raises(test_session):
+    """Test completing a finished task is rejected and writes no second event."""
+    executor, _, task, user_id = await _start_process(test_session)
+    await executor.complete_task(task.id, user_id, {'approved': True})
+    await test_session.commit()
+
+    with pytest.raises(TaskNotActiveError):
+        await executor.complete_task(task.id, user_id, {'approved': False})
+    await test_session.rollback()
+
+    await test_session.refresh(task)
+    assert task.result == {'approved': True}
+    events = (
+        await test_session.execute(select(TaskEvent).where(TaskEvent.task_id == task.id))
+    ).scalars().all()
+    assert len(events) == 1
+
+
+@pytest.mark.asyncio
+async def test_complete_nonexistent_task_raises(test_session):
+    """Test completing a non-existent task raises TaskNotFoundError."""
+    executor = ProcessExecutor(test_session)
+
+    with pytest.raises(TaskNotFoundError):
+        await executor.complete_task(uuid4(), uuid4(), {})
+
+
+@pytest.mark.asyncio
+async def test_complete_tasks_skips_finished(test_session):
+    """Test bulk completion only returns tasks that were still active."""
+    executor, _, task, user_id = await _start_process(test_session)
+    await executor.complete_task(task.id, user_id, {'approved': True})
+    await test_session.commit()
+
+    completed = await executor.complete_tasks([task.id, uuid4()], user_id, {})
+    await test_session.commit()
+
+    assert completed == []
+
+
+@pytest.mark.asyncio
+async def test_worker_completes_process(test_session):
+    """Test the worker consumes the completed event and finishes the instance."""
+    executor, instance, task, user_id = await _start_process(test_session)
+    await executor.complete_task(task.id, user_id, {'approved': True})
+    await test_session.commit()
+
+    await TaskEventWorker(batch_size=1000).process_batch()
+
+    await test_session.refresh(instance)
+    assert instance.status == ProcessStatus.COMPLETED
+    assert instance.result == {'approved': True}
+    event = (
+        await test_session.execute(select(TaskEvent).where(TaskEvent.task_id == task.id))
+    ).scalar_one()
+    await test_session.refresh(event)
+    assert event.status == TaskEventStatus.PROCESSED
+    assert event.processed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_continue_process_is_idempotent(test_session):
+    """Test advancing an already completed instance leaves it unchanged."""
+    executor, instance, task, user_id = await _start_process(test_session)
+    await executor.complete_task(task.id, user_id, {'approved': True})
+    await executor.continue_process(instance.id, {'approved': True})
+    await test_session.commit()
+    completed_at = instance.completed_at
+
+    await executor.continue_process(instance.id, {'approved': False})
+    await test_session.commit()
+
+    await test_session.refresh(instance)
+    assert instance.status == ProcessStatus.COMPLETED
+    assert instance.completed_at == completed_at
+    assert instance.result == {'approved': True}
@@ -0,0 +1,182 @@
+"""
+Tests for the cache-aside helpers.
+
+Like the database tests, these use the real Redis from the .env file.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from app.core import cache
+from app.core.cache import _should_refresh, get_or_load, invalidate
+from app.core.redis import redis_client
+
+
+class Item(BaseModel):
+    """Cached payload used by the tests."""
+
+    id: str
+    name: str
+
+
+@pytest.fixture
+async def redis():
+    """Connect the global Redis client for one test and clear the local tier."""
+    await redis_client.connect()
+    cache._local_cache.clear()
+    yield redis_client
+    cache._local_cache.clear()
+    await redis_client.close()
+
+
+def _key() -> str:
+    """A fresh cache key per test."""
+    return f'test:cache:{uuid4()}'
+
+
+class CountingLoader:
+    """Loader that records how often the database would have been hit."""
+
+    def __init__(self, value, delay: float = 0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_miss_loads_and_caches(redis):
+    """Test a miss calls the loader once and stores the value in both tiers."""
+    key = _key()
+    loader = CountingLoader(Item(id='1', name='first'))
+
+    value = await get_or_load(key, Item, loader)
+
+    assert value == loader.value
+    assert loader.calls == 1
+    assert key in cache._local_cache
+    assert await redis.get_bytes(key) is not None
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_loader(redis):
+    """Test hits are served from L1, then from Redis once L1 is cleared."""
+    key = _key()
+    loader = CountingLoader(Item(id='1', name='first'))
+    await get_or_load(key, Item, loader)
+
+    assert await get_or_load(key, Item, loader) == loader.value
+    cache._local_cache.clear()
+    assert await get_or_load(key, Item, loader) == loader.value
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_mutating_result_does_not_change_cache(redis):
+    """Test callers get their own copy, not the shared L1 instance."""
+    key = _key()
+    loader = CountingLoader(Item(id='1', name='first'))
+
+    loaded = await get_or_load(key, Item, loader)
+    loaded.name = 'changed by loader caller'
+    from_l1 = await get_or_load(key, Item, loader)
+    from_l1.name = 'changed by first reader'
+    cache._local_cache.clear()
+    from_l2 = await get_or_load(key, Item, loader)
+    from_l2.name = 'changed by second reader'
+
+    assert (await get_or_load(key, Item, loader)).name == 'first'
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_none_is_not_cached(redis):
+    """Test a not-found result is returned but not cached."""
+    key = _key()
+    loader = CountingLoader(None)
+
+    assert await get_or_load(key, Item, loader) is None
+    assert await get_or_load(key, Item, loader) is None
+    assert loader.calls == 2
+    assert await redis.get_bytes(key) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_both_tiers(redis):
+    """Test invalidate forces the next read to hit the loader again."""
+    key = _key()
+    loader = CountingLoader(Item(id='1', name='first'))
+    await get_or_load(key, Item, loader)
+
+    await invalidate(key)
+
+    assert key not in cache._local_cache
+    assert await redis.get_bytes(key) is None
+    await get_or_load(key, Item, loader)
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load_prevents_write_back(redis):
+    """Test a value loaded before a concurrent invalidate is not cached."""
+    key = _key()
+    stale = Item(id='1', name='stale')
+
+    async def loader():
+        # A write lands (and invalidates) after the loader read the old row
+        await invalidate(key)
+        return stale
+
+    assert await get_or_load(key, Item, loader) == stale
+    assert key not in cache._local_cache
+    assert await redis.get_bytes(key) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(redis):
+    """Test the lock lets only one of several concurrent readers hit the loader."""
+    key = _key()
+    loader = CountingLoader(Item(id='1', name='first'), delay=0.2)
+
+    values = await asyncio.gather(*(get_or_load(key, Item, loader) for _ in range(5)))
+
+    assert all(value == loader.value for value in values)
+    assert loader.calls == 1
+    assert await redis.get_bytes(f'{key}:lock') is None
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_reloads_value(redis, monkeypatch):
+    """Test a value past its refresh deadline is reloaded by the lock holder."""
+    key = _key()
+    await redis.set(key, f'0|{Item(id="1", name="old").model_dump_json()}', expire=60)
+    loader = CountingLoader(Item(id='1', name='new'))
+    monkeypatch.setattr(cache.random, 'random', lambda: 0.0)
+
+    value = await get_or_load(key, Item, loader)
+
+    assert value.name == 'new'
+    assert loader.calls == 1
+
+
+def test_should_refresh_before_deadline():
+    """Test values are never refreshed before their refresh deadline."""
+    assert _should_refresh(refresh_at=float('inf'), ttl=300) is False
+
+
+def test_should_refresh_probability_grows_towards_expiry(monkeypatch):
+    """Test the refresh chance rises from 0 at the deadline to 1 at expiry."""
+    monkeypatch.setattr(cache.time, 'time', lambda: 1000.0)
+    monkeypatch.setattr(cache.random, 'random', lambda: 0.5)
+
+    # 300s TTL: refresh window is the last 60s; 10s and 50s into it
+    assert _should_refresh(refresh_at=990.0, ttl=300) is False
+    assert _should_refresh(refresh_at=950.0, ttl=300) is True
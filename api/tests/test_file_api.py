@@ -0,0 +1,62 @@
+"""
+Tests for Range header parsing on file downloads.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.file import _parse_range
+
+
+@pytest.mark.parametrize(
+    'header, expected',
+    [
+        ('bytes=0-99', (0, 99)),
+        ('bytes=100-', (100, 999)),
+        ('bytes=-50', (950, 999)),
+        ('bytes=-5000', (0, 999)),  # suffix longer than the file
+        ('bytes=900-5000', (900, 999)),  # end clamped to the last byte
+        ('bytes=999-999', (999, 999)),
+        (' bytes = 0-0', (0, 0)),
+    ],
+)
+def test_parse_range(header, expected):
+    """Test single ranges resolve to an inclusive (start, end) within the file."""
+    assert _parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    'header',
+    [
+        'bytes=0-99,200-299',  # multi-range
+        'items=0-99',  # unsupported unit
+        'bytes',
+        'bytes=',
+        'bytes=-',
+        'bytes=abc-def',
+        'bytes=0x10-20',
+        'bytes=10',
+    ],
+)
+def test_parse_range_ignored(header):
+    """Test unsupported or malformed headers fall back to the full file."""
+    assert _parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize(
+    'header, size',
+    [
+        ('bytes=1000-', 1000),  # starts past the end
+        ('bytes=1000-1100', 1000),
+        ('bytes=500-100', 1000),  # start after end
+        ('bytes=-0', 1000),  # empty suffix
+        ('bytes=0-', 0),  # empty file
+    ],
+)
+def test_parse_range_unsatisfiable(header, size):
+    """Test unsatisfiable ranges raise 416 with the full size in Content-Range."""
+    with pytest.raises(HTTPException) as exc_info:
+        _parse_range(header, size)
+
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {'Content-Range': f'bytes */{size}'}
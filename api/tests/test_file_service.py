@@ -0,0 +1,114 @@
+"""
+Tests for file listing: cursor encoding and keyset pagination.
+"""
+
+from base64 import urlsafe_b64encode
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.file.reference import FileReference
+from app.services.file_server import FileService, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test a cursor decodes back to the created_at and id it was built from."""
+    created_at = datetime(2025, 12, 10, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    reference = SimpleNamespace(created_at=created_at, id=uuid4())
+
+    assert decode_cursor(encode_cursor(reference)) == (created_at, reference.id)
+
+
+def test_cursor_is_url_safe():
+    """Test cursors can be passed in a query string without escaping."""
+    reference = SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid4())
+
+    cursor = encode_cursor(reference)
+
+    assert not set(cursor) & {'+', '/'}
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    [
+        '',
+        'not base64!',
+        'abc',  # bad padding
+        urlsafe_b64encode(b'\xff\xfe').decode(),  # not UTF-8
+        urlsafe_b64encode(b'2025-12-10T08:30:15+00:00').decode(),  # no id
+        urlsafe_b64encode(f'yesterday|{uuid4()}'.encode()).decode(),  # bad timestamp
+        urlsafe_b64encode(b'2025-12-10T08:30:15+00:00|not-a-uuid').decode(),  # bad id
+    ],
+)
+def test_decode_invalid_cursor(cursor):
+    """Test malformed cursors raise ValueError (mapped to 400 by the API)."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+async def _add_files(session, workspace_id, count):
+    """Insert file references for one workspace."""
+    files = [
+        FileReference(
+            workspace_id=workspace_id,
+            file_id=uuid4(),
+            filename=f'file-{i}.txt',
+            content_type='text/plain',
+            size_bytes=i,
+            storage_type='GRIDFS',
+            mongo_id=f'{i:024x}',
+            uploaded_by=uuid4(),
+        )
+        for i in range(count)
+    ]
+    session.add_all(files)
+    await session.commit()
+    return files
+
+
+@pytest.mark.asyncio
+async def test_list_files_keyset_pages(test_session):
+    """Test walking every page returns each file once, newest first."""
+    service = FileService(test_session)
+    workspace_id = uuid4()
+    files = await _add_files(test_session, workspace_id, 5)
+    # Another workspace's files never show up
+    await _add_files(test_session, uuid4(), 2)
+
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = await service.list_files_keyset(workspace_id, after=cursor, limit=2)
+        pages.append(page)
+        if cursor is None:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    listed = [f for page in pages for f in page]
+    assert {f.id for f in listed} == {f.id for f in files}
+    keys = [(f.created_at, f.id) for f in listed]
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_list_files_keyset_exact_page(test_session):
+    """Test no cursor is returned when the last page is exactly full."""
+    service = FileService(test_session)
+    workspace_id = uuid4()
+    await _add_files(test_session, workspace_id, 2)
+
+    page, cursor = await service.list_files_keyset(workspace_id, limit=2)
+
+    assert len(page) == 2
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_files_keyset_invalid_cursor(test_session):
+    """Test an invalid cursor raises ValueError before querying."""
+    service = FileService(test_session)
+
+    with pytest.raises(ValueError):
+        await service.list_files_keyset(uuid4(), after='not base64!')
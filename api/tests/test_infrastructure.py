@@ -48,3 +48,43 @@ class TestDatabaseConnection:
         assert app is not None
         assert app.title == 'Low-Code Platform Backend'
         assert app.version == '0.1.0'
+
+    def test_routes_registered_once(self):
+        """Test that every API route is registered exactly once."""
+        from fastapi.routing import APIRoute
+
+        from app.main import app
+
+        routes = [
+            (route.path, method)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        ]
+        assert len(routes) == len(set(routes))
+        assert any(path.startswith('/api/v1/bpm/processes') for path, _ in routes)
+        assert any(path.startswith('/api/v1/bpm/tasks') for path, _ in routes)
+
+
+class TestMigrationSkipMode:
+    """Test startup with migration_mode='skip' (the default)."""
+
+    def test_login_available_after_startup(self, monkeypatch):
+        """Test the migration guard lets requests through once a skip-mode app has started."""
+        from fastapi.testclient import TestClient
+
+        from app.core.migrations import MIGRATION_STATUS
+        from app.main import app
+
+        monkeypatch.setattr(settings, 'migration_mode', 'skip')
+        monkeypatch.setitem(MIGRATION_STATUS, 'state', 'pending')
+
+        with TestClient(app) as client:
+            assert client.get('/api/v1/healthz/migrations').json()['state'] == 'skipped'
+            response = client.post(
+                '/api/v1/auth/login',
+                json={'email': 'nobody@example.com', 'password': 'wrong-password'},
+            )
+
+        # Unknown user, not 503 from require_migrations_done
+        assert response.status_code == 401
@@ -12,6 +12,7 @@ import pytest
 from app.schemas.workflow import (
     ConnectionCreateRequest,
     NodeCreateRequest,
+    NodeUpdateRequest,
     WorkflowCreateRequest,
 )
 from app.services.workflow_service import (
@@ -414,3 +415,343 @@ async def test_validate_workflow(test_session):
 
     assert result.is_valid is True
     assert len(result.errors) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_nodes(test_session):
+    """Test adding several nodes in one call keeps request order."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+
+    nodes_data = [
+        NodeCreateRequest(
+            type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': f'Prompt {i}'}
+        )
+        for i in range(3)
+    ]
+    nodes = await service.bulk_add_nodes(workflow.id, nodes_data)
+
+    assert [node.name for node in nodes] == ['Node 0', 'Node 1', 'Node 2']
+    assert all(node.workflow_id == workflow.id for node in nodes)
+    assert len(await service.list_nodes(workflow.id)) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_nodes_with_invalid_config(test_session):
+    """Test one invalid node rejects the whole batch and writes nothing."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+
+    nodes_data = [
+        NodeCreateRequest(type='LLM', name='Valid', config={'model': 'gpt-4', 'prompt': 'Test'}),
+        NodeCreateRequest(type='LLM', name='Invalid', config={}),
+    ]
+
+    with pytest.raises(WorkflowValidationError) as exc_info:
+        await service.bulk_add_nodes(workflow.id, nodes_data)
+
+    errors = exc_info.value.validation_result.errors
+    assert errors and all(error.startswith('nodes[1]') for error in errors)
+    assert await service.list_nodes(workflow.id) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_connect_nodes(test_session):
+    """Test creating several connections in one call."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    nodes = await service.bulk_add_nodes(
+        workflow.id,
+        [
+            NodeCreateRequest(
+                type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': 'Test'}
+            )
+            for i in range(3)
+        ],
+    )
+
+    connections_data = [
+        ConnectionCreateRequest(
+            source_node_id=nodes[i].id,
+            target_node_id=nodes[i + 1].id,
+            source_output='output',
+            target_input='input',
+        )
+        for i in range(2)
+    ]
+    connections = await service.bulk_connect_nodes(workflow.id, connections_data)
+
+    assert [(c.source_node_id, c.target_node_id) for c in connections] == [
+        (nodes[0].id, nodes[1].id),
+        (nodes[1].id, nodes[2].id),
+    ]
+    assert len(await service.list_connections(workflow.id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_connect_nodes_creates_cycle(test_session):
+    """Test a cycle formed by existing plus new edges rejects the whole batch."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    a, b, c = await service.bulk_add_nodes(
+        workflow.id,
+        [
+            NodeCreateRequest(
+                type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': 'Test'}
+            )
+            for i in range(3)
+        ],
+    )
+
+    # Existing edge a -> b; the batch adds b -> c and c -> a
+    await service.connect_nodes(
+        workflow.id,
+        ConnectionCreateRequest(
+            source_node_id=a.id, target_node_id=b.id, source_output='output', target_input='input'
+        ),
+    )
+    connections_data = [
+        ConnectionCreateRequest(
+            source_node_id=b.id, target_node_id=c.id, source_output='output', target_input='input'
+        ),
+        ConnectionCreateRequest(
+            source_node_id=c.id, target_node_id=a.id, source_output='output', target_input='input'
+        ),
+    ]
+
+    with pytest.raises(WorkflowValidationError):
+        await service.bulk_connect_nodes(workflow.id, connections_data)
+
+    assert len(await service.list_connections(workflow.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_connect_nodes_with_foreign_node(test_session):
+    """Test connections to nodes of another workflow are rejected and nothing is written."""
+    service = WorkflowService(test_session)
+
+    workflow = await service.create_workflow(
+        WorkflowCreateRequest(name='Test Workflow'), uuid4(), uuid4()
+    )
+    other = await service.create_workflow(
+        WorkflowCreateRequest(name='Other Workflow'), uuid4(), uuid4()
+    )
+    node_data = NodeCreateRequest(
+        type='LLM', name='Node', config={'model': 'gpt-4', 'prompt': 'Test'}
+    )
+    node = await service.add_node(workflow.id, node_data)
+    foreign = await service.add_node(other.id, node_data)
+
+    connections_data = [
+        ConnectionCreateRequest(
+            source_node_id=node.id,
+            target_node_id=foreign.id,
+            source_output='output',
+            target_input='input',
+        ),
+        ConnectionCreateRequest(
+            source_node_id=uuid4(),
+            target_node_id=node.id,
+            source_output='output',
+            target_input='input',
+        ),
+    ]
+
+    with pytest.raises(WorkflowValidationError) as exc_info:
+        await service.bulk_connect_nodes(workflow.id, connections_data)
+
+    errors = exc_info.value.validation_result.errors
+    assert any(error.startswith('connections[0]: Target node') for error in errors)
+    assert any(error.startswith('connections[1]: Source node') for error in errors)
+    assert await service.list_connections(workflow.id) == []
+
+
+@pytest.mark.asyncio
+async def test_validate_connections(test_session):
+    """Test batch connection validation accepts a chain and rejects a cycle."""
+    from app.models.workflow.workflow import Connection
+
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    a, b = await service.bulk_add_nodes(
+        workflow.id,
+        [
+            NodeCreateRequest(
+                type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': 'Test'}
+            )
+            for i in range(2)
+        ],
+    )
+
+    def edge(source, target):
+        return Connection(
+            workflow_id=workflow.id,
+            source_node_id=source.id,
+            target_node_id=target.id,
+            source_output='output',
+            target_input='input',
+        )
+
+    result = await service.validator.validate_connections(workflow.id, [edge(a, b)])
+    assert result.is_valid is True
+
+    result = await service.validator.validate_connections(workflow.id, [edge(a, b), edge(b, a)])
+    assert result.is_valid is False
+    assert 'cycle' in result.errors[0]
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_with_graph(test_session):
+    """Test loading a workflow together with its nodes and connections."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    a, b = await service.bulk_add_nodes(
+        workflow.id,
+        [
+            NodeCreateRequest(
+                type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': 'Test'}
+            )
+            for i in range(2)
+        ],
+    )
+    await service.connect_nodes(
+        workflow.id,
+        ConnectionCreateRequest(
+            source_node_id=a.id, target_node_id=b.id, source_output='output', target_input='input'
+        ),
+    )
+    test_session.expunge_all()
+
+    loaded = await service.get_workflow_with_graph(workflow.id)
+
+    assert loaded.id == workflow.id
+    assert {node.id for node in loaded.nodes} == {a.id, b.id}
+    assert [(c.source_node_id, c.target_node_id) for c in loaded.connections] == [(a.id, b.id)]
+
+    with pytest.raises(WorkflowNotFoundError):
+        await service.get_workflow_with_graph(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_node_or_none(test_session):
+    """Test the scoped node lookup returns None outside the workflow or after deletion."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    node = await service.add_node(
+        workflow.id,
+        NodeCreateRequest(type='LLM', name='Node', config={'model': 'gpt-4', 'prompt': 'Test'}),
+    )
+
+    assert (await service.get_node_or_none(workflow.id, node.id)).id == node.id
+    assert await service.get_node_or_none(uuid4(), node.id) is None
+    assert await service.get_node_or_none(workflow.id, uuid4()) is None
+
+    await service.delete_node(node.id)
+    assert await service.get_node_or_none(workflow.id, node.id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_connection_or_none(test_session):
+    """Test the scoped connection lookup returns None outside the workflow."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    a, b = await service.bulk_add_nodes(
+        workflow.id,
+        [
+            NodeCreateRequest(
+                type='LLM', name=f'Node {i}', config={'model': 'gpt-4', 'prompt': 'Test'}
+            )
+            for i in range(2)
+        ],
+    )
+    connection = await service.connect_nodes(
+        workflow.id,
+        ConnectionCreateRequest(
+            source_node_id=a.id, target_node_id=b.id, source_output='output', target_input='input'
+        ),
+    )
+
+    assert (await service.get_connection_or_none(workflow.id, connection.id)).id == connection.id
+    assert await service.get_connection_or_none(uuid4(), connection.id) is None
+    assert await service.get_connection_or_none(workflow.id, uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_update_node_scoped_to_workflow(test_session):
+    """Test updating a node through the wrong workflow raises and changes nothing."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    node = await service.add_node(
+        workflow.id,
+        NodeCreateRequest(
+            type='LLM', name='Original Node', config={'model': 'gpt-4', 'prompt': 'Original'}
+        ),
+    )
+
+    with pytest.raises(NodeNotFoundError):
+        await service.update_node(node.id, NodeUpdateRequest(name='Moved'), workflow_id=uuid4())
+
+    updated = await service.update_node(
+        node.id, NodeUpdateRequest(name='Updated Node'), workflow_id=workflow.id
+    )
+    assert updated.name == 'Updated Node'
+    assert updated.config['prompt'] == 'Original'
+
+
+@pytest.mark.asyncio
+async def test_update_node_with_invalid_config(test_session):
+    """Test an invalid config rolls the UPDATE back."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    node = await service.add_node(
+        workflow.id,
+        NodeCreateRequest(
+            type='LLM', name='Original Node', config={'model': 'gpt-4', 'prompt': 'Original'}
+        ),
+    )
+
+    with pytest.raises(WorkflowValidationError):
+        await service.update_node(node.id, NodeUpdateRequest(name='Broken', config={}))
+
+    reloaded = await service.get_node(node.id)
+    assert reloaded.name == 'Original Node'
+    assert reloaded.config['prompt'] == 'Original'
+
+
+@pytest.mark.asyncio
+async def test_update_node_without_changes(test_session):
+    """Test an empty update returns the node, and still checks workflow ownership."""
+    service = WorkflowService(test_session)
+
+    workflow_data = WorkflowCreateRequest(name='Test Workflow')
+    workflow = await service.create_workflow(workflow_data, uuid4(), uuid4())
+    node = await service.add_node(
+        workflow.id,
+        NodeCreateRequest(type='LLM', name='Node', config={'model': 'gpt-4', 'prompt': 'Test'}),
+    )
+
+    unchanged = await service.update_node(node.id, NodeUpdateRequest(), workflow_id=workflow.id)
+    assert unchanged.id == node.id
+
+    with pytest.raises(NodeNotFoundError):
+        await service.update_node(node.id, NodeUpdateRequest(), workflow_id=uuid4())